@@ -1,7 +1,8 @@
 import streamlit as st
-import pdfplumber
-from docx import Document
 from chains import Chain
+from resume_parser import DOCX_MIME, PDF_MIME, parse_resume
+from resume import build_resume
+from portfolio import get_portfolio
 import os
 from dotenv import load_dotenv
 import base64
@@ -127,20 +128,6 @@ def create_download_link(content, filename):
     href = f'<a href="data:text/plain;base64,{b64}" download="{filename}" class="download-link">📥 Download Email</a>'
     return href
 
-def extract_text_from_pdf(file):
-    text = ""
-    with pdfplumber.open(file) as pdf:
-        for page in pdf.pages:
-            text += page.extract_text() + "\n"
-    return text
-
-def extract_text_from_docx(file):
-    doc = Document(file)
-    full_text = []
-    for para in doc.paragraphs:
-        full_text.append(para.text)
-    return "\n".join(full_text)
-
 def generate_cold_email_interface():
     """Cold email generation interface"""
     
@@ -248,13 +235,11 @@ def generate_cold_email_interface():
                 st.markdown('<p class="progress-text">Extracting and analyzing resume content</p>', unsafe_allow_html=True)
                 
                 try:
-                    if resume_file.type == "application/pdf":
-                        resume_text = extract_text_from_pdf(resume_file)
-                    elif resume_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                        resume_text = extract_text_from_docx(resume_file)
-                    else:
+                    if resume_file.type not in (PDF_MIME, DOCX_MIME):
                         st.error("❌ Unsupported file format. Please upload PDF or DOCX.")
                         return
+                    # Parsed text is cached by file content, so repeat generations skip parsing
+                    resume_text = parse_resume(resume_file.getvalue(), resume_file.type)
                     
                     if not resume_text.strip():
                         st.error("❌ Could not extract text from your resume. Please check the file.")
@@ -271,7 +256,7 @@ def generate_cold_email_interface():
                 st.markdown('<p class="progress-text">Scraping and processing job description</p>', unsafe_allow_html=True)
                 
                 try:
-                    chain = Chain(name=name, tone=tone, resume_text=resume_text, language=language)
+                    chain = Chain(name=name, tone=tone, resume=build_resume(resume_text), language=language)
                     job_description = chain.scrape_job_description(job_url)
                     progress_bar.progress(66)
                     
@@ -280,22 +265,53 @@ def generate_cold_email_interface():
                     st.info("💡 Make sure the URL is accessible and contains a job description")
                     return
 
+                reduction = chain.last_scrape_stats.get("reduction", 0)
+                if reduction > 0:
+                    st.caption(f"Removed page boilerplate: job description is {reduction:.0%} shorter")
+
+                # Skills and portfolio links only enrich the page; the email is generated without them
+                try:
+                    job_skills = chain.job_skills(job_description)
+                    if job_skills:
+                        st.caption(f"Skills in this posting: {', '.join(job_skills[:15])}")
+                        # Projects using skills the candidate also lists on the resume come first
+                        shared_skills = chain.resume.matching_skills(job_skills)
+                        if shared_skills:
+                            st.caption(f"Your matching skills: {', '.join(sorted(shared_skills))}")
+                        links = get_portfolio().query_links(job_skills, limit=3, preferred=shared_skills,
+                                                            semantic=True)
+                        st.markdown(f"**🗂️ Portfolio links for this job:** {links}")
+                except Exception as e:
+                    st.warning(f"⚠️ Could not match portfolio projects to this job: {e}")
+
             # Step 3: Email Generation
             with st.spinner("🤖 Generating personalized cold email..."):
                 st.markdown('<p class="progress-text">Creating your personalized cold email</p>', unsafe_allow_html=True)
                 
                 try:
-                    email = chain.write_mail(job_description)
-                    progress_bar.progress(100)
+                    # Slot for the success message, filled once the email is complete
+                    status_placeholder = st.empty()
                     
-                    # Success message
-                    st.success("✅ Your professional cold email is ready!")
-                    
-                    # Display the email
+                    # Display the email as it streams in
                     st.markdown("### 📧 Generated Cold Email")
                     st.markdown('<div class="email-output">', unsafe_allow_html=True)
-                    st.write(email)
+                    email_placeholder = st.empty()
+                    chunks = []
+                    for chunk in chain.stream_mail(job_description):
+                        chunks.append(chunk)
+                        email_placeholder.markdown("".join(chunks) + "▌")
+                    email = "".join(chunks)
+                    email_placeholder.write(email)
                     st.markdown('</div>', unsafe_allow_html=True)
+                    progress_bar.progress(100)
+                    
+                    token_report = chain.last_token_report
+                    if token_report:
+                        note = " (job description and resume trimmed to fit)" if token_report["trimmed"] else ""
+                        st.caption(f"Prompt size: ~{token_report['prompt_tokens']} tokens{note}")
+                    
+                    # Success message
+                    status_placeholder.success("✅ Your professional cold email is ready!")
                     
                     # Download link
                     download_link = create_download_link(email, f"cold_email_{name.replace(' ', '_')}.txt")
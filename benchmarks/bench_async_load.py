@@ -0,0 +1,72 @@
+"""Load test: sync versus async scrape-and-generate as concurrency grows.
+
+Each job fetches a posting from the local stub server (SCRAPE_LATENCY per
+request) and generates an email with the fake LLM (LLM_LATENCY per call). The
+sync path handles jobs one after another on one thread, as a blocking server
+worker does; the async path runs up to N jobs at once on one event loop.
+"""
+import asyncio
+import itertools
+import time
+
+import common  # noqa: F401
+
+import scraper
+from chains import Chain
+from fake_llm import FakeEmailLLM
+from stub_server import StubServer
+
+JOBS = 64
+SCRAPE_LATENCY = 0.05
+LLM_LATENCY = 0.2
+CONCURRENCY = (1, 4, 16, 64)
+PAGE = ("<html><body><h1>Backend Engineer</h1>"
+        + "<p>We build logistics software in Python and need an engineer to run our APIs.</p>" * 20
+        + "</body></html>")
+
+_runs = itertools.count()
+
+
+def job_urls(server):
+    # A fresh query string per run keeps the job cache cold
+    run = next(_runs)
+    return [server.url(f"/job{i}?run={run}") for i in range(JOBS)]
+
+
+def run_sync(chain, urls):
+    for url in urls:
+        chain.write_mail(scraper.scrape_job_description(url))
+
+
+async def run_async(chain, urls, concurrency):
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one(url):
+        async with limit:
+            await chain.awrite_mail(await scraper.ascrape_job_description(url))
+
+    await asyncio.gather(*(one(url) for url in urls))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    routes = {f"/job{i}": PAGE for i in range(JOBS)}
+    with StubServer(routes, latency=SCRAPE_LATENCY) as server:
+        chain = Chain(name="Ada", resume_text="Python developer", llm=FakeEmailLLM(latency=LLM_LATENCY),
+                      use_cache=False)
+        print(f"{JOBS} jobs, {SCRAPE_LATENCY * 1000:.0f} ms scrape + {LLM_LATENCY * 1000:.0f} ms LLM each")
+        elapsed = timed(lambda: run_sync(chain, job_urls(server)))
+        print(f"sync            {elapsed:6.2f} s  {JOBS / elapsed:6.1f} jobs/s")
+        for concurrency in CONCURRENCY:
+            urls = job_urls(server)
+            elapsed = timed(lambda: asyncio.run(run_async(chain, urls, concurrency)))
+            print(f"async x{concurrency:<3}      {elapsed:6.2f} s  {JOBS / elapsed:6.1f} jobs/s")
+
+
+if __name__ == "__main__":
+    main()
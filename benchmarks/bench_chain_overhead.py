@@ -0,0 +1,63 @@
+"""Per-call overhead of building the email chain on every button press versus once per process.
+
+"rebuilt" is what each press used to do: construct a Groq client, parse the
+prompt template and compose prompt | llm | parser. "shared" is Chain() with
+the process-wide client and runnable. Both then invoke the runnable with a
+zero-latency fake LLM, so the numbers are pure framework overhead.
+"""
+import os
+import time
+
+import common  # noqa: F401
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
+from langchain_groq import ChatGroq
+
+import chains
+from fake_llm import FakeEmailLLM
+
+CALLS = 300
+INPUTS = {
+    "job_description": "Backend Engineer\nPython, Django and PostgreSQL.",
+    "user_name": "Ada",
+    "resume_text": "Python developer, 5 years",
+    "tone_style": "Formal",
+    "language": "English",
+}
+
+
+def per_call(fn):
+    fn()
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        fn()
+    return (time.perf_counter() - start) / CALLS
+
+
+def main():
+    os.environ.setdefault("GROQ_API_KEY", "gsk_benchmark_key")
+    fake = FakeEmailLLM()
+    template = chains.EMAIL_PROMPT.template
+
+    def rebuilt_setup():
+        ChatGroq(temperature=0, groq_api_key=os.environ["GROQ_API_KEY"], model_name=chains.MODEL_NAME)
+        return PromptTemplate.from_template(template) | fake | StrOutputParser()
+
+    def shared_setup():
+        return chains.Chain(name="Ada", use_cache=False).chain_email
+
+    shared_runnable = chains.build_email_chain(fake)
+    setup_rebuilt = per_call(rebuilt_setup)
+    setup_shared = per_call(shared_setup)
+    call_rebuilt = per_call(lambda: rebuilt_setup().invoke(INPUTS))
+    call_shared = per_call(lambda: (shared_setup(), shared_runnable.invoke(INPUTS)))
+
+    print(f"{CALLS} calls, zero-latency fake LLM")
+    print(f"setup only       rebuilt {setup_rebuilt * 1e3:7.3f} ms   shared {setup_shared * 1e3:7.3f} ms   "
+          f"{setup_rebuilt / setup_shared:6.0f}x")
+    print(f"setup + invoke   rebuilt {call_rebuilt * 1e3:7.3f} ms   shared {call_shared * 1e3:7.3f} ms   "
+          f"{call_rebuilt / call_shared:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
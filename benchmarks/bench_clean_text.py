@@ -0,0 +1,70 @@
+"""clean_text throughput in MB/s: the original six-pass cleaner versus the merged one.
+
+The corpus is the saved job pages in tests/fixtures/pages, cleaned as many
+small texts and as one large text. For the large text, clean_texts works in
+CLEAN_CHUNK_CHARS pieces; its peak traced memory is reported next to
+clean_text on the whole string.
+"""
+import glob
+import os
+import tracemalloc
+
+import common
+from test_utils import original_clean_text
+from utils import clean_text, clean_texts
+
+PAGES = sorted(glob.glob(os.path.join(common.ROOT, "tests", "fixtures", "pages", "*.html")))
+SMALL_TEXTS = 2_000
+LARGE_MB = 32
+
+
+def load_pages():
+    texts = []
+    for path in PAGES:
+        with open(path, encoding="utf-8") as f:
+            texts.append(f.read())
+    return texts
+
+
+def megabytes(texts):
+    return sum(len(text.encode("utf-8")) for text in texts) / 1e6
+
+
+def peak_traced_mb(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main():
+    pages = load_pages()
+    small = [pages[i % len(pages)] for i in range(SMALL_TEXTS)]
+    large = "\n".join(pages)
+    large = large * (LARGE_MB * 1_000_000 // len(large) + 1)
+
+    assert [clean_text(text) for text in pages] == [original_clean_text(text) for text in pages]
+    assert list(clean_texts([large])) == [clean_text(large)]
+
+    rows = [
+        ("original, small texts", small, lambda: [original_clean_text(text) for text in small]),
+        ("clean_text, small texts", small, lambda: [clean_text(text) for text in small]),
+        ("clean_texts, small texts", small, lambda: list(clean_texts(small))),
+        ("original, one large text", [large], lambda: original_clean_text(large)),
+        ("clean_text, one large text", [large], lambda: clean_text(large)),
+        ("clean_texts, one large text", [large], lambda: list(clean_texts([large]))),
+    ]
+    print(f"{len(pages)} pages; {SMALL_TEXTS} small texts ({megabytes(small):.1f} MB), "
+          f"one large text ({megabytes([large]):.1f} MB)")
+    for label, texts, fn in rows:
+        seconds = common.best_of(fn, repeat=3)
+        print(f"{label:<30} {megabytes(texts) / seconds:8.1f} MB/s")
+
+    print()
+    print(f"peak memory, clean_text on the large text:  {peak_traced_mb(lambda: clean_text(large)):6.1f} MB")
+    print(f"peak memory, clean_texts on the large text: {peak_traced_mb(lambda: list(clean_texts([large]))):6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
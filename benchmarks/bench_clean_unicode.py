@@ -0,0 +1,85 @@
+"""Unicode cleaning on mixed-script job pages: translation table versus a regex pass chain.
+
+keep_unicode exists to keep non-English text, not to clean faster; this
+checks that its cost stays on par with the regex chain.
+
+Each corpus is a synthetic posting page (tags, URLs, punctuation, line breaks)
+in one or more scripts. "regex chain" is the original pass chain with its
+ASCII class widened to Unicode word characters, the obvious regex version of
+keep_unicode; it also keeps underscores and drops combining marks (Devanagari
+vowel signs), so its output differs where noted. "ascii mode" is the default
+clean_text, shown for speed only: it deletes every non-ASCII letter.
+"""
+import random
+import re
+
+import common
+from utils import clean_text
+
+PAGE_WORDS = 200_000
+
+SCRIPTS = {
+    "latin": "Python SQL engineer team remote Docker AWS data platform senior".split(),
+    "accented": "Entwickler München für Qualität équipe développeur données Señor año Zürich".split(),
+    "cyrillic": "Разработчик опыт работы команда данные Москва удалённо сервисы".split(),
+    "cjk": "東京 ソフトウェア エンジニア 募集 経験 データ 北京 开发 工程师".split(),
+    "devanagari": "डेवलपर अनुभव टीम डेटा सेवाएं हिंदी बेंगलुरु".split(),
+    "arabic": "مهندس برمجيات خبرة فريق بيانات دبي".split(),
+    "emoji": "🚀 ✨ 💼 𝐁old 🙂 🌍".split(),
+}
+CORPORA = {
+    "english": ["latin"],
+    "german/french": ["latin", "accented"],
+    "russian + english": ["cyrillic", "latin"],
+    "japanese/chinese": ["cjk", "latin"],
+    "hindi + english": ["devanagari", "latin"],
+    "arabic + english": ["arabic", "latin"],
+    "all scripts + emoji": list(SCRIPTS),
+}
+
+TAG_RE = re.compile(r'<[^>]*?>')
+URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+NON_WORD_RE = re.compile(r'[^\w\s]')
+SPACES_RE = re.compile(r'\s{2,}')
+
+
+def regex_chain(text):
+    text = TAG_RE.sub('', text)
+    text = URL_RE.sub('', text)
+    text = NON_WORD_RE.sub('', text)
+    text = SPACES_RE.sub(' ', text)
+    return ' '.join(text.strip().split())
+
+
+def make_page(rng, scripts):
+    words = [word for script in scripts for word in SCRIPTS[script]]
+    parts = []
+    for _ in range(PAGE_WORDS):
+        roll = rng.random()
+        if roll < 0.05:
+            parts.append(rng.choice(["<li>", "</li>", "<p class='job'>", "</p>"]))
+        elif roll < 0.07:
+            parts.append(f"https://jobs.example.com/{rng.randint(0, 9999)}")
+        elif roll < 0.15:
+            parts.append(rng.choice(["-", "•", ",", "(m/w/d)", "—", "：", "、", "\n"]))
+        else:
+            parts.append(rng.choice(words))
+    return " ".join(parts)
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'corpus':<22}{'MB':>6}{'table':>10}{'regex chain':>13}{'ascii mode':>12}  (MB/s)")
+    for name, scripts in CORPORA.items():
+        page = make_page(rng, scripts)
+        size = len(page.encode("utf-8")) / 1e6
+        table = size / common.best_of(lambda: clean_text(page, keep_unicode=True), repeat=3)
+        chain = size / common.best_of(lambda: regex_chain(page), repeat=3)
+        ascii_ = size / common.best_of(lambda: clean_text(page), repeat=3)
+        same = clean_text(page, keep_unicode=True) == regex_chain(page)
+        note = "" if same else "  outputs differ"
+        print(f"{name:<22}{size:6.1f}{table:10.1f}{chain:13.1f}{ascii_:12.1f}{note}")
+
+
+if __name__ == "__main__":
+    main()
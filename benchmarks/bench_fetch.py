@@ -0,0 +1,43 @@
+"""Per-URL latency of bare requests.get versus the pooled scraper.fetch.
+
+The stub server sleeps once per new connection to stand in for DNS, TCP and
+TLS setup against a real job board, and a little on every request.
+"""
+import time
+
+import common  # noqa: F401
+import requests
+
+import scraper
+from stub_server import StubServer
+
+REQUESTS = 50
+HANDSHAKE_LATENCY = 0.03
+REQUEST_LATENCY = 0.005
+PAGE = "<html><body><h1>Engineer</h1>" + "<p>Build services in Python.</p>" * 200 + "</body></html>"
+
+
+def run(get):
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        get()
+    return (time.perf_counter() - start) / REQUESTS
+
+
+def main():
+    with StubServer({"/job": PAGE}, latency=REQUEST_LATENCY, handshake_latency=HANDSHAKE_LATENCY) as server:
+        url = server.url("/job")
+        bare = run(lambda: requests.get(url, timeout=10).text)
+        bare_connections = server.connections
+        pooled = run(lambda: scraper.fetch(url).text)
+        pooled_connections = server.connections - bare_connections
+
+    print(f"{REQUESTS} sequential fetches, {HANDSHAKE_LATENCY * 1000:.0f} ms connection setup, "
+          f"{REQUEST_LATENCY * 1000:.0f} ms per request")
+    print(f"requests.get   {bare * 1000:7.1f} ms/URL  {bare_connections} connections")
+    print(f"scraper.fetch  {pooled * 1000:7.1f} ms/URL  {pooled_connections} connections")
+    print(f"speedup        {bare / pooled:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
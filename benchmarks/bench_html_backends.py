@@ -0,0 +1,57 @@
+"""Parse time of each html_to_text backend over the saved-page corpus.
+
+Each page body is repeated to roughly the size of a large job board page, and every
+backend's output is checked against html.parser before it is timed. Peak memory
+is the Python heap only (tracemalloc); the C parsers allocate outside it.
+"""
+import glob
+import os
+import tracemalloc
+
+import common
+import html_text
+
+PAGES_DIR = os.path.join(common.ROOT, "tests", "fixtures", "pages")
+REPEAT_BODY = 40
+
+
+def load_pages():
+    pages = []
+    for path in sorted(glob.glob(os.path.join(PAGES_DIR, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        start = html.index(">", html.index("<body")) + 1
+        end = html.rindex("</body>")
+        pages.append(html[:start] + html[start:end] * REPEAT_BODY + html[end:])
+    return pages
+
+
+def peak_kb(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    pages = load_pages()
+    size_mb = sum(len(page.encode("utf-8")) for page in pages) / 1e6
+    reference = [html_text.html_to_text(page, "html.parser") for page in pages]
+
+    print(f"{len(pages)} pages, {size_mb:.2f} MB of HTML")
+    baseline = None
+    for backend in reversed(html_text.available_backends()):
+        def run():
+            return [html_text.html_to_text(page, backend) for page in pages]
+
+        same = run() == reference
+        elapsed = common.best_of(run, repeat=3)
+        baseline = baseline or elapsed
+        print(f"{backend:12} {elapsed * 1000:8.1f} ms  {size_mb / elapsed:6.1f} MB/s  "
+              f"python heap {peak_kb(run):7.0f} KB  {baseline / elapsed:5.1f}x  "
+              f"{'same output' if same else 'OUTPUT DIFFERS'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""fetch_listings throughput with one slow site: blocking per-site semaphores versus map_per_host.
+
+Six stand-in job sites serve their recorded search page from
+tests/fixtures/listings; Indeed answers in 500 ms, the others in 50 ms. The
+semaphore version is the previous fetch_listings, where pool threads picked
+up pages of the slow site and blocked on its semaphore while pages of the
+other sites waited for a thread.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import common  # noqa: F401
+
+from listings import ADAPTERS, fetch_listings
+from scraper import fetch
+from stub_server import StubServer
+from test_listings import site_routes
+
+QUERIES = [f"data scientist {i}" for i in range(8)]
+LOCATION = "New York"
+SLOW_SITE = "Indeed"
+LATENCY = 0.05
+SLOW_LATENCY = 0.5
+MAX_WORKERS = 8
+PER_SITE = 2
+
+
+def semaphore_fetch_listings(queries, location, sites, max_workers, per_site, base_urls):
+    adapters = {site: ADAPTERS[site](base_url=base_urls.get(site)) for site in sites}
+    site_limits = {site: threading.BoundedSemaphore(per_site) for site in sites}
+
+    def worker(site, query):
+        adapter = adapters[site]
+        with site_limits[site]:
+            response = fetch(adapter.search_url(query, location))
+        return adapter.parse(response.text)
+
+    tasks = [(site, query) for query in queries for site in sites]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        futures = {executor.submit(worker, site, query): (site, query) for site, query in tasks}
+        for future in as_completed(futures):
+            site, query = futures[future]
+            yield site, query, future.result(), None
+
+
+def run(fn):
+    """Seconds until every page is in and until every fast-site page is in"""
+    start = time.perf_counter()
+    fast_done = None
+    pending_fast = (len(ADAPTERS) - 1) * len(QUERIES)
+    for site, _, _, error in fn():
+        assert error is None, error
+        if site != SLOW_SITE:
+            pending_fast -= 1
+            if not pending_fast:
+                fast_done = time.perf_counter() - start
+    return time.perf_counter() - start, fast_done
+
+
+def main():
+    sites = list(ADAPTERS)
+    servers = {site: StubServer(latency=SLOW_LATENCY if site == SLOW_SITE else LATENCY).start() for site in sites}
+    try:
+        base_urls = {}
+        for site, server in servers.items():
+            routes, urls = site_routes(server, [site], QUERIES, LOCATION)
+            server.routes.update(routes)
+            base_urls.update(urls)
+
+        pages = len(sites) * len(QUERIES)
+        print(f"{pages} pages on {len(sites)} sites, {SLOW_SITE} {SLOW_LATENCY * 1000:.0f} ms, others "
+              f"{LATENCY * 1000:.0f} ms; max_workers={MAX_WORKERS}, per_site={PER_SITE}")
+        variants = {
+            "semaphores": lambda: semaphore_fetch_listings(QUERIES, LOCATION, sites, MAX_WORKERS, PER_SITE,
+                                                           base_urls),
+            "map_per_host": lambda: fetch_listings(QUERIES, LOCATION, sites, max_workers=MAX_WORKERS,
+                                                   per_site=PER_SITE, rate=0, base_urls=base_urls),
+        }
+        for label, fn in variants.items():
+            total, fast = min(run(fn) for _ in range(3))
+            print(f"{label:<14} all pages {total:5.2f} s ({pages / total:5.1f} pages/s), "
+                  f"fast sites done after {fast:5.2f} s")
+    finally:
+        for server in servers.values():
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
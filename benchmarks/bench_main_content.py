@@ -0,0 +1,27 @@
+"""Prompt tokens saved by extract_main_content on the saved-page corpus"""
+import glob
+import os
+
+import common
+import html_text
+from token_budget import count_tokens
+
+PAGES_DIR = os.path.join(common.ROOT, "tests", "fixtures", "pages")
+
+
+def main():
+    total_raw = total_main = 0
+    for path in sorted(glob.glob(os.path.join(PAGES_DIR, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            raw = html_text.html_to_text(f.read())
+        main_text = html_text.extract_main_content(raw)
+        raw_tokens, main_tokens = count_tokens(raw), count_tokens(main_text)
+        total_raw += raw_tokens
+        total_main += main_tokens
+        print(f"{os.path.basename(path):28} {raw_tokens:5} -> {main_tokens:5} tokens  "
+              f"{html_text.reduction_ratio(raw, main_text):5.0%} chars removed")
+    print(f"{'total':28} {total_raw:5} -> {total_main:5} tokens  {1 - total_main / total_raw:5.0%} fewer tokens")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Time each PDF backend on the sample resumes and on a synthetic 30 page document"""
+import glob
+import os
+
+import common
+import resume_parser
+from pdf_factory import make_pdf, resume_pages
+
+RESUMES_DIR = os.path.join(common.ROOT, "tests", "fixtures", "resumes")
+
+
+def documents():
+    for path in sorted(glob.glob(os.path.join(RESUMES_DIR, "*.pdf"))):
+        with open(path, "rb") as f:
+            yield os.path.basename(path), f.read()
+    yield "synthetic_30_pages.pdf", make_pdf(resume_pages(30))
+
+
+def main():
+    backends = list(resume_parser.PDF_BACKENDS)
+    print(f"{'document':24} {'pages':>5}  " + "  ".join(f"{name:>10}" for name in backends) + "   auto")
+    for name, data in documents():
+        pages = resume_parser.pdf_page_count(data)
+        times = [common.best_of(lambda: resume_parser.extract_text_from_pdf(data, backend=backend), repeat=3)
+                 for backend in backends]
+        cells = "  ".join(f"{seconds * 1000:8.1f}ms" for seconds in times)
+        print(f"{name:24} {pages:5}  {cells}   {resume_parser.choose_pdf_backend(pages)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Wall time and peak RSS of PDF resume extraction on synthetic 30-100 page documents.
+
+"old" is the original app.py function, which appended each page to a string
+with pdfplumber. "pdfplumber" is resume_parser's pdfplumber path, which
+releases each page as it goes; "auto" picks the backend by page count, so at
+these lengths it reads with the fast text backend. Each variant runs in a
+fresh interpreter, so peak RSS is its own.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+import common
+
+PAGE_COUNTS = (30, 60, 100)
+VARIANTS = {
+    "old": {},
+    "pdfplumber": {"PDF_BACKEND": "pdfplumber"},
+    "auto": {},
+}
+
+
+def old_extract_text_from_pdf(file):
+    import pdfplumber
+
+    text = ""
+    with pdfplumber.open(file) as pdf:
+        for page in pdf.pages:
+            text += page.extract_text() + "\n"
+    return text
+
+
+def run_variant(variant, page_count):
+    """Child process: extract once and report time, peak RSS and a digest of the text"""
+    import hashlib
+    import io
+
+    from pdf_factory import make_pdf, resume_pages
+
+    data = make_pdf(resume_pages(page_count, blank_every=10))
+    start = time.perf_counter()
+    if variant == "old":
+        text = old_extract_text_from_pdf(io.BytesIO(data))
+    else:
+        import resume_parser
+        text = resume_parser.extract_text_from_pdf(data)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "seconds": elapsed,
+        "rss_mb": common.peak_rss_mb(),
+        "lines": hashlib.sha256("\n".join(line.rstrip() for line in text.splitlines()).encode()).hexdigest()[:12],
+    }))
+
+
+def main():
+    print(f"{'pages':>5} {'variant':10} {'seconds':>8} {'peak RSS':>10}  text")
+    for page_count in PAGE_COUNTS:
+        for variant, env in VARIANTS.items():
+            result = subprocess.run(
+                [sys.executable, __file__, variant, str(page_count)],
+                env=dict(os.environ, **env), capture_output=True, text=True, check=True,
+            )
+            row = json.loads(result.stdout)
+            print(f"{page_count:5} {variant:10} {row['seconds']:8.2f} {row['rss_mb']:7.1f} MB  {row['lines']}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        run_variant(sys.argv[1], int(sys.argv[2]))
+    else:
+        main()
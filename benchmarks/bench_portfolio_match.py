@@ -0,0 +1,67 @@
+"""Tag matching over 10k synthetic projects: original per-call scan versus the inverted index.
+
+The scan is the original query_links, which rebuilt a lowercase tag set for
+every project on every call. Both return the same projects; the index also
+ranks them by overlap.
+"""
+import random
+import time
+
+import common
+from portfolio import Portfolio
+
+PROJECTS = 10_000
+TAG_VOCABULARY = 2_000
+QUERIES = 200
+SKILLS_PER_QUERY = 10
+
+
+def synthetic_projects(rng):
+    tags = [f"Tech{i}" for i in range(TAG_VOCABULARY)]
+    return [
+        {"title": f"Project {i}", "url": f"https://example.com/p{i}", "tags": rng.sample(tags, rng.randint(3, 8))}
+        for i in range(PROJECTS)
+    ]
+
+
+def scan_query_links(projects, skills):
+    matched_links = []
+    skills_lower = set(skill.lower() for skill in skills)
+    for project in projects:
+        project_tags = set(tag.lower() for tag in project["tags"])
+        if skills_lower & project_tags:
+            matched_links.append(f"[{project['title']}]({project['url']})")
+    if not matched_links:
+        matched_links = [f"[{p['title']}]({p['url']})" for p in projects[:2]]
+    return ", ".join(matched_links)
+
+
+def per_query(fn, queries):
+    start = time.perf_counter()
+    results = [fn(skills) for skills in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def main():
+    rng = random.Random(0)
+    projects = synthetic_projects(rng)
+    queries = [[f"tech{rng.randrange(TAG_VOCABULARY)}" for _ in range(SKILLS_PER_QUERY)] for _ in range(QUERIES)]
+
+    portfolio = Portfolio(file_path=None)
+    portfolio.projects = projects
+    build = common.best_of(portfolio.build_index, repeat=3)
+
+    scan, scan_links = per_query(lambda skills: scan_query_links(projects, skills), queries)
+    indexed, indexed_links = per_query(portfolio.query_links, queries)
+    top3, _ = per_query(lambda skills: portfolio.query_links(skills, limit=3), queries)
+    same = all(set(a.split(", ")) == set(b.split(", ")) for a, b in zip(scan_links, indexed_links))
+
+    print(f"{PROJECTS} projects, {TAG_VOCABULARY} distinct tags, {SKILLS_PER_QUERY} skills per query")
+    print(f"index build          {build * 1000:8.2f} ms (once per load)")
+    print(f"scan query           {scan * 1000:8.3f} ms")
+    print(f"index query          {indexed * 1000:8.3f} ms  {scan / indexed:6.0f}x  same projects: {same}")
+    print(f"index query, top 3   {top3 * 1000:8.3f} ms  {scan / top3:6.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Ranking synthetic job postings against one resume: vectorized TF-IDF versus a per-posting loop.
+
+rank_postings scores every posting in one pass of NumPy operations; the
+reference computes the same TF-IDF cosine one posting at a time with dicts.
+Both give the same scores. The tfidf_scores column is the scoring alone,
+without building the ranked posting dicts. The target is 10k postings well
+under a second on one CPU core.
+"""
+import numpy as np
+
+import common
+from job_fit import fit_terms, posting_text, rank_postings, tfidf_scores
+from test_job_fit import reference_scores, synthetic_postings
+
+SIZES = (1_000, 10_000, 50_000)
+RESUME = ("Data scientist with Python, SQL, pandas, PyTorch and AWS. Built NLP and ML models; "
+          "statistics and Tableau dashboards.\nSkills: Python, SQL, PyTorch, Spark, Docker\n") * 3
+SKILLS = ("python", "sql", "pytorch", "spark", "docker")
+
+
+def main():
+    print(f"{'postings':>9}{'rank_postings':>15}{'tfidf_scores':>15}{'per-posting loop':>18}")
+    for size in SIZES:
+        postings = synthetic_postings(size, seed=size)
+        documents = [posting_text(posting) for posting in postings]
+        boost = set(fit_terms(" ".join(SKILLS)))
+        assert np.allclose(tfidf_scores(RESUME, documents, boost), reference_scores(RESUME, documents, boost))
+
+        ranked = common.best_of(lambda: rank_postings(postings, RESUME, SKILLS), repeat=5)
+        scores = common.best_of(lambda: tfidf_scores(RESUME, documents, boost), repeat=5)
+        loop = common.best_of(lambda: reference_scores(RESUME, [posting_text(p) for p in postings], boost),
+                              repeat=1)
+        print(f"{size:>9,}{ranked * 1000:>12.0f} ms{scores * 1000:>12.0f} ms{loop * 1000:>15.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Throughput of scrape_many as the concurrency limit grows.
+
+Eight stand-in job boards (separate stub servers, so separate hosts) each
+serve ten postings with 100 ms latency. With two slots per host, throughput
+should grow with max_workers until all 16 host slots are busy.
+"""
+import time
+
+import common  # noqa: F401
+
+import scraper
+from stub_server import StubServer
+
+HOSTS = 8
+URLS_PER_HOST = 10
+LATENCY = 0.1
+PER_HOST = 2
+PAGE = "<html><body><h1>Engineer</h1><p>Build services in Python.</p></body></html>"
+
+
+def main():
+    servers = [StubServer({f"/job{i}": PAGE for i in range(URLS_PER_HOST)}, latency=LATENCY).start()
+               for _ in range(HOSTS)]
+    try:
+        urls = [server.url(f"/job{i}") for server in servers for i in range(URLS_PER_HOST)]
+        print(f"{len(urls)} URLs on {HOSTS} hosts, {LATENCY * 1000:.0f} ms latency, {PER_HOST} per host")
+        for max_workers in (1, 2, 4, 8, 16, 32):
+            start = time.perf_counter()
+            errors = sum(error is not None for _, _, error in
+                         scraper.scrape_many(urls, max_workers=max_workers, per_host=PER_HOST, use_cache=False))
+            elapsed = time.perf_counter() - start
+            print(f"max_workers={max_workers:<3} {elapsed:6.2f} s  {len(urls) / elapsed:6.1f} URLs/s  errors={errors}")
+    finally:
+        for server in servers:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Skill extraction per job description: Aho-Corasick automaton versus one regex per skill.
+
+The dictionary is default_skills() (base skills, domain keywords and insight
+skills, portfolio tags). Job descriptions are synthetic, mixing skill names
+with filler words. The regex variants search the lowercased text once per
+skill, either with patterns compiled up front or through re.search.
+"""
+import random
+import re
+import time
+
+import common  # noqa: F401
+
+from skills import SkillExtractor, default_skills, normalize
+from test_skills import naive_extract
+
+TEXTS = 50
+WORDS_PER_TEXT = (300, 1_500, 6_000)
+FILLER = "we are looking for an engineer with experience in building scalable systems across the team".split()
+
+
+def per_text_ms(fn, texts):
+    start = time.perf_counter()
+    for text in texts:
+        fn(text)
+    return (time.perf_counter() - start) / len(texts) * 1000
+
+
+def main():
+    skills = default_skills()
+    start = time.perf_counter()
+    extractor = SkillExtractor(skills)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"{len(extractor)} skills, automaton built in {build_ms:.1f} ms")
+
+    patterns = [(skill, re.compile(r"(?<![^\W_])" + re.escape(normalize(skill)) + r"(?![^\W_])"))
+                for skill in dict.fromkeys(skills) if len(normalize(skill)) >= 2]
+
+    def compiled_regex(text):
+        text = normalize(text)
+        return [skill for skill, pattern in patterns if pattern.search(text)]
+
+    rng = random.Random(0)
+    vocabulary = skills + FILLER * 20
+    print(f"{'words/text':>10}{'automaton':>12}{'compiled regex':>17}{'re.search':>12}  (ms per text)")
+    for words in WORDS_PER_TEXT:
+        texts = [" ".join(rng.choices(vocabulary, k=words)) for _ in range(TEXTS)]
+        automaton = per_text_ms(extractor.extract, texts)
+        compiled = per_text_ms(compiled_regex, texts)
+        naive = per_text_ms(lambda text: naive_extract(skills, text), texts[:10])
+        print(f"{words:>10,}{automaton:>12.2f}{compiled:>17.2f}{naive:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
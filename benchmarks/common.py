@@ -0,0 +1,37 @@
+"""Shared setup for the benchmark scripts: import paths, a throwaway cache and timers.
+
+Run a benchmark from the repository root, e.g. ``python benchmarks/bench_fetch.py``.
+"""
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "tests")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# Benchmarks never read or write the real cache
+_cache_dir = tempfile.mkdtemp(prefix="cold-mail-bench-")
+os.environ["CACHE_DIR"] = _cache_dir
+atexit.register(shutil.rmtree, _cache_dir, True)
+
+
+def best_of(fn, repeat=5):
+    """Best wall time of fn over repeat runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB"""
+    import resource
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / 1024 / 1024 if sys.platform == "darwin" else usage / 1024
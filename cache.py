@@ -0,0 +1,112 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+CACHE_DB = os.path.join(CACHE_DIR, "cache.sqlite3")
+
+
+class SQLiteCache:
+    """Key/value cache stored in one SQLite table, shared by every session of the process.
+
+    Values and metadata are stored as JSON. Entries older than ``ttl`` seconds are
+    stale: ``get`` ignores them unless ``allow_stale`` is set, so callers can still
+    revalidate them. When ``max_entries`` is set the least recently used entries
+    are evicted on write.
+    """
+
+    def __init__(self, table, ttl=None, max_entries=None, path=None):
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", table):
+            raise ValueError(f"Invalid cache table name: {table}")
+        self.table = table
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = path or CACHE_DB
+        self.stats = {"hits": 0, "misses": 0, "stale": 0}
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, meta TEXT, "
+                "stored_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_last_used ON {table} (last_used)")
+
+    def _is_fresh(self, stored_at):
+        return self.ttl is None or time.time() - stored_at < self.ttl
+
+    def get(self, key, allow_stale=False):
+        """Return the entry for key as a dict, or None on a miss"""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT value, meta, stored_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+
+            fresh = self._is_fresh(row[2])
+            if not fresh and not allow_stale:
+                self.stats["misses"] += 1
+                return None
+
+            self.stats["hits" if fresh else "stale"] += 1
+            self._conn.execute(f"UPDATE {self.table} SET last_used = ? WHERE key = ?", (time.time(), key))
+
+        return {
+            "value": json.loads(row[0]),
+            "meta": json.loads(row[1]) if row[1] else {},
+            "stored_at": row[2],
+            "fresh": fresh,
+        }
+
+    def set(self, key, value, meta=None):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, meta, stored_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(value), json.dumps(meta) if meta else None, now, now),
+            )
+            if self.max_entries:
+                self._conn.execute(
+                    f"DELETE FROM {self.table} WHERE key IN ("
+                    f"SELECT key FROM {self.table} ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def touch(self, key):
+        """Mark an entry as freshly validated without rewriting its value"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE {self.table} SET stored_at = ?, last_used = ? WHERE key = ?", (now, now, key)
+            )
+
+    def delete(self, key):
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def hit_rate(self):
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["stale"]
+        return self.stats["hits"] / lookups if lookups else 0.0
@@ -1,59 +1,27 @@
 from dotenv import load_dotenv
+import hashlib
 import os
+from functools import lru_cache
 
 load_dotenv()
-import requests
-from bs4 import BeautifulSoup
 from langchain_groq import ChatGroq
 from langchain_core.prompts import PromptTemplate
-from langchain_core.runnables import RunnableLambda
+from langchain_core.output_parsers import StrOutputParser
+import scraper
+from cache import SQLiteCache
+from skills import extract_skills
+from token_budget import count_tokens, fit_prompt
 
-class Chain:
-    def __init__(self, name="Your name", tone="Formal", resume_text="", language="English"):
-        self.name = name
-        self.tone = tone
-        self.resume_text = resume_text
-        self.language = language
-        
-        # Get API key from environment variables or Streamlit secrets
-        api_key = os.getenv("GROQ_API_KEY")
-        
-        # Try to get from Streamlit secrets if available
-        try:
-            import streamlit as st
-            if not api_key and hasattr(st, 'secrets'):
-                api_key = st.secrets.get("GROQ_API_KEY", "")
-        except ImportError:
-            pass  # Streamlit not available, use only environment variables
-            
-        if not api_key:
-            raise ValueError("GROQ API key not found. Please check your environment variables or Streamlit secrets.")
-            
-        self.llm = ChatGroq(
-            temperature=0,
-            groq_api_key=api_key,
-            model_name="llama3-70b-8192"
-        )
+MODEL_NAME = "llama3-70b-8192"
 
-    def scrape_job_description(self, url):
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            for script in soup(["script", "style"]):
-                script.extract()
+# Generated emails are deterministic (temperature=0), so identical prompts are
+# answered from this cache
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 60 * 60)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
 
-            text = soup.get_text(separator="\n")
-            lines = [line.strip() for line in text.splitlines()]
-            text = "\n".join(line for line in lines if line)
-            return text
-        except Exception as e:
-            raise RuntimeError(f"Failed to scrape URL: {e}")
-
-    def write_mail(self, job_description):
-        prompt_email = PromptTemplate.from_template(
-            """
+# Parsed once at import; every Chain shares it
+EMAIL_PROMPT = PromptTemplate.from_template(
+    """
             ### JOB DESCRIPTION:
             {job_description}
 
@@ -68,16 +36,182 @@ class Chain:
             Use the candidate's name and tone style.
             Highlight relevant experience from the resume.
             Use the specified language.
-            
+
             ### EMAIL ONLY:
             """
-        )
-        chain_email = prompt_email | self.llm | RunnableLambda(lambda x: x.content)
-        email_text = chain_email.invoke({
+)
+
+
+def get_api_key():
+    # Get API key from environment variables or Streamlit secrets
+    api_key = os.getenv("GROQ_API_KEY")
+
+    # Try to get from Streamlit secrets if available; only imported when the
+    # environment has no key, so each Chain() stays cheap
+    if not api_key:
+        try:
+            import streamlit as st
+            if hasattr(st, 'secrets'):
+                api_key = st.secrets.get("GROQ_API_KEY", "")
+        except ImportError:
+            pass  # Streamlit not available, use only environment variables
+
+    if not api_key:
+        raise ValueError("GROQ API key not found. Please check your environment variables or Streamlit secrets.")
+    return api_key
+
+
+@lru_cache(maxsize=None)
+def get_llm(api_key):
+    """Groq client shared by every Chain in the process"""
+    return ChatGroq(
+        temperature=0,
+        groq_api_key=api_key,
+        model_name=MODEL_NAME
+    )
+
+
+def build_email_chain(llm):
+    # StrOutputParser passes chunks through, so the chain supports .stream()
+    return EMAIL_PROMPT | llm | StrOutputParser()
+
+
+@lru_cache(maxsize=None)
+def get_email_chain(api_key):
+    """Prompt | LLM runnable, composed once per API key"""
+    return build_email_chain(get_llm(api_key))
+
+
+@lru_cache(maxsize=None)
+def get_response_cache():
+    return SQLiteCache("llm_responses", ttl=LLM_CACHE_TTL, max_entries=LLM_CACHE_MAX_ENTRIES)
+
+
+def response_cache_key(model_name, prompt_text):
+    return hashlib.sha256(f"{model_name}\0{prompt_text}".encode("utf-8")).hexdigest()
+
+
+class Chain:
+    def __init__(self, name="Your name", tone="Formal", resume_text="", language="English", llm=None, use_cache=True, token_budget=None, resume=None):
+        self.name = name
+        self.tone = tone
+        # A structured Resume lets each prompt carry only the sections relevant to the job
+        self.resume = resume
+        self.resume_text = resume.text if resume is not None and not resume_text else resume_text
+        self.language = language
+        self.use_cache = use_cache
+        self.token_budget = token_budget
+        self.last_scrape_stats = {}
+        # Skills found by the last job_skills call
+        self.last_skills = []
+        self.last_token_report = {}
+        self.last_from_cache = False
+
+        # A custom llm (e.g. a fake model in tests) gets its own runnable; the
+        # default Groq client and runnable are shared process-wide
+        if llm is not None:
+            self.llm = llm
+            self.chain_email = build_email_chain(llm)
+        else:
+            api_key = get_api_key()
+            self.llm = get_llm(api_key)
+            self.chain_email = get_email_chain(api_key)
+
+    def scrape_job_description(self, url):
+        try:
+            text, self.last_scrape_stats = scraper.scrape_job_description(url, with_stats=True)
+            return text
+        except Exception as e:
+            raise RuntimeError(f"Failed to scrape URL: {e}")
+
+    async def ascrape_job_description(self, url):
+        try:
+            text, self.last_scrape_stats = await scraper.ascrape_job_description(url, with_stats=True)
+            return text
+        except Exception as e:
+            raise RuntimeError(f"Failed to scrape URL: {e}")
+
+    def job_skills(self, job_description):
+        """Skills mentioned in a job description, kept as last_skills"""
+        self.last_skills = extract_skills(job_description)
+        return self.last_skills
+
+    def scrape_job_descriptions(self, urls, max_workers=None, per_host=None, timeout=None):
+        """Scrape many job URLs concurrently, yielding (url, text, error) as each completes"""
+        return scraper.scrape_many(urls, max_workers=max_workers, per_host=per_host, timeout=timeout)
+
+    def _prompt(self, job_description):
+        """Prompt variables, with job description and resume trimmed to the token budget, and the trim report"""
+        resume_text = self.resume.relevant_text(job_description) if self.resume is not None else self.resume_text
+        job_description, resume_text, report = fit_prompt(job_description, resume_text, self.token_budget)
+        inputs = {
             "job_description": job_description,
             "user_name": self.name,
-            "resume_text": self.resume_text,
+            "resume_text": resume_text,
             "tone_style": self.tone,
             "language": self.language
-        })
+        }
+        report["prompt_tokens"] = count_tokens(EMAIL_PROMPT.format(**inputs))
+        return inputs, report
+
+    def prompt_inputs(self, job_description):
+        """Prompt variables for a job description; the trim report is kept as last_token_report"""
+        inputs, self.last_token_report = self._prompt(job_description)
+        return inputs
+
+    def cache_key(self, inputs):
+        model_name = getattr(self.llm, "model_name", type(self.llm).__name__)
+        return response_cache_key(model_name, EMAIL_PROMPT.format(**inputs))
+
+    def _lookup(self, inputs):
+        """Return (cache key, cached email or None) for the given prompt inputs"""
+        if not self.use_cache:
+            return None, None
+        key = self.cache_key(inputs)
+        entry = get_response_cache().get(key)
+        return key, entry["value"] if entry else None
+
+    def write_mail(self, job_description):
+        inputs = self.prompt_inputs(job_description)
+        key, email_text = self._lookup(inputs)
+        self.last_from_cache = email_text is not None
+        if email_text is not None:
+            return email_text
+
+        email_text = self.chain_email.invoke(inputs)
+        if key:
+            get_response_cache().set(key, email_text)
         return email_text
+
+    async def awrite_mail(self, job_description, with_report=False):
+        """Async write_mail that leaves the chain's last_* fields alone, so concurrent calls can share it.
+
+        With ``with_report`` an (email, report) tuple is returned, where report is
+        this call's token report plus whether the email came from the cache.
+        """
+        inputs, report = self._prompt(job_description)
+        key, email_text = self._lookup(inputs)
+        report["from_cache"] = email_text is not None
+        if email_text is None:
+            email_text = await self.chain_email.ainvoke(inputs)
+            if key:
+                get_response_cache().set(key, email_text)
+        return (email_text, report) if with_report else email_text
+
+    def stream_mail(self, job_description):
+        """Yield the email in chunks as the LLM produces them"""
+        inputs = self.prompt_inputs(job_description)
+        key, email_text = self._lookup(inputs)
+        self.last_from_cache = email_text is not None
+        if email_text is not None:
+            yield email_text
+            return
+
+        chunks = []
+        for chunk in self.chain_email.stream(inputs):
+            chunks.append(chunk)
+            yield chunk
+
+        # Only complete emails are cached; an abandoned stream never gets here
+        if key:
+            get_response_cache().set(key, "".join(chunks))
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from cache import CACHE_DIR
+
+EMBEDDING_CACHE_DIR = os.path.join(CACHE_DIR, "embeddings")
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "50000"))
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+# all-MiniLM-L6-v2, Chroma's default model and the one the portfolio store was built with
+EMBEDDING_DIM = 384
+# The index log is rewritten from the live entries once it has this many lines per cache row
+INDEX_LOG_COMPACT_RATIO = 4
+
+
+def default_embedding_function():
+    """Chroma's local CPU embedding model (all-MiniLM-L6-v2, ONNX)"""
+    from chromadb.utils import embedding_functions
+    return embedding_functions.DefaultEmbeddingFunction()
+
+
+def text_key(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Embeddings stored in a memory-mapped float32 matrix, keyed by content hash.
+
+    Missing texts are embedded together in batched model calls. When all
+    ``capacity`` rows are used, the least recently used row is overwritten.
+    The key -> row index is an append-only log of JSON lines, so a write costs
+    only its new rows; the log is compacted once it outgrows the cache.
+    """
+
+    def __init__(self, embed_fn=None, dim=EMBEDDING_DIM, capacity=EMBEDDING_CACHE_SIZE,
+                 path=EMBEDDING_CACHE_DIR, batch_size=EMBEDDING_BATCH_SIZE):
+        self._embed_fn = embed_fn
+        self.dim = dim
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.stats = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+        self._vectors_path = os.path.join(path, f"vectors_{dim}.f32")
+        self._index_path = os.path.join(path, f"index_{dim}.jsonl")
+
+        expected_size = capacity * dim * 4
+        fresh = not os.path.exists(self._vectors_path) or os.path.getsize(self._vectors_path) != expected_size
+        self.vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="w+" if fresh else "r+",
+                                 shape=(capacity, dim))
+
+        # key -> row, least recently used first
+        self._slots = OrderedDict()
+        self._log_lines = 0
+        if fresh:
+            # Rows of a recreated matrix are empty; an old log would point keys at them
+            if os.path.exists(self._index_path):
+                os.remove(self._index_path)
+        elif os.path.exists(self._index_path):
+            self._load_index()
+        self._free = sorted(set(range(capacity)) - set(self._slots.values()), reverse=True)
+
+    def _load_index(self):
+        """Replay the index log; a later line for a row replaces the key stored there before"""
+        owners = {}
+        with open(self._index_path, encoding="utf-8") as f:
+            for line in f:
+                self._log_lines += 1
+                try:
+                    key, slot = json.loads(line)
+                except ValueError:
+                    continue  # line torn by a crash mid-append
+                if slot >= self.capacity:
+                    continue
+                if slot in owners:
+                    self._slots.pop(owners[slot], None)
+                self._slots.pop(key, None)
+                self._slots[key] = slot
+                owners[slot] = key
+
+    @property
+    def embed_fn(self):
+        if self._embed_fn is None:
+            self._embed_fn = default_embedding_function()
+        return self._embed_fn
+
+    def _compute(self, texts):
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
+            vectors.append(np.asarray(self.embed_fn(batch), dtype=np.float32))
+        return np.vstack(vectors)
+
+    def _allocate(self, key):
+        if self._free:
+            slot = self._free.pop()
+        else:
+            _, slot = self._slots.popitem(last=False)
+        self._slots[key] = slot
+        return slot
+
+    def embed(self, texts):
+        """Embeddings of texts as an (n, dim) float32 array, computing only uncached ones"""
+        texts = list(texts)
+        if not texts:
+            return np.empty((0, self.dim), dtype=np.float32)
+        keys = [text_key(text) for text in texts]
+
+        with self._lock:
+            missing = {}
+            hit_keys = set()
+            for key, text in zip(keys, texts):
+                if key in self._slots:
+                    self._slots.move_to_end(key)
+                    hit_keys.add(key)
+                elif key not in missing:
+                    missing[key] = text
+            self.stats["hits"] += len(texts) - len(missing)
+            self.stats["misses"] += len(missing)
+
+            overflow = {}
+            if missing:
+                # Rows used by this call's hits are never evicted, so only the
+                # remaining capacity is stored; the rest is returned uncached
+                storable = self.capacity - len(hit_keys)
+                computed = self._compute(list(missing.values()))
+                stored = []
+                for row, key in enumerate(missing):
+                    if row < storable:
+                        slot = self._allocate(key)
+                        self.vectors[slot] = computed[row]
+                        stored.append((key, slot))
+                    else:
+                        overflow[key] = computed[row]
+                self._flush(stored)
+
+            return np.stack([
+                overflow[key] if key in overflow else np.array(self.vectors[self._slots[key]])
+                for key in keys
+            ])
+
+    def _flush(self, stored):
+        """Persist the rows written by one call, vectors before their index lines"""
+        self.vectors.flush()
+        if self._log_lines + len(stored) > INDEX_LOG_COMPACT_RATIO * self.capacity:
+            tmp_path = self._index_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(item) + "\n" for item in self._slots.items())
+            os.replace(tmp_path, self._index_path)
+            self._log_lines = len(self._slots)
+        else:
+            with open(self._index_path, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(item) + "\n" for item in stored)
+            self._log_lines += len(stored)
+
+    def __len__(self):
+        return len(self._slots)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache():
+    """Process-wide embedding cache using the default embedding model"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmbeddingCache()
+    return _cache
+
+
+def embed_texts(texts):
+    return get_embedding_cache().embed(texts)
@@ -0,0 +1,219 @@
+import importlib
+import os
+
+from bs4 import BeautifulSoup
+
+# Extraction backend used when none is requested explicitly; "auto" picks the
+# fastest parser that is installed
+HTML_BACKEND = os.getenv("HTML_BACKEND", "auto")
+
+DROP_TAGS = ["script", "style"]
+
+
+def _join_lines(strings):
+    """Join text nodes, keeping one stripped non-empty line per text block"""
+    text = "\n".join(strings)
+    lines = [line.strip() for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def _html_parser_to_text(html):
+    soup = BeautifulSoup(html, "html.parser")
+
+    for script in soup(DROP_TAGS):
+        script.extract()
+
+    return _join_lines([soup.get_text(separator="\n")])
+
+
+def _lxml_to_text(html):
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    if not html.strip():
+        return ""
+    # Encode first: lxml refuses str input that carries an XML encoding declaration
+    parser = lxml_html.HTMLParser(encoding="utf-8")
+    try:
+        root = lxml_html.document_fromstring(html.encode("utf-8", errors="replace"), parser=parser)
+    except etree.ParserError:
+        # Raised for documents without any element or text, e.g. only a comment
+        return ""
+
+    # drop_tree moves the tail text onto the previous node; a newline keeps it
+    # a separate line, as html.parser keeps the text on both sides apart
+    for node in root.xpath("//script | //style | //comment() | //processing-instruction()"):
+        if node.getparent() is not None:
+            node.tail = "\n" + (node.tail or "")
+            node.drop_tree()
+
+    return _join_lines(root.itertext())
+
+
+def _selectolax_to_text(html):
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    if tree.root is None:
+        return ""
+    # Replace rather than strip, so the text on both sides stays on separate lines
+    for node in tree.css(", ".join(DROP_TAGS)):
+        node.replace_with("\n")
+    return _join_lines([tree.root.text(separator="\n")])
+
+
+BACKENDS = {
+    "selectolax": ("selectolax.lexbor", _selectolax_to_text),
+    "lxml": ("lxml", _lxml_to_text),
+    "html.parser": (None, _html_parser_to_text),
+}
+
+
+def available_backends():
+    """Names of the backends whose parser library is installed, fastest first"""
+    names = []
+    for name, (module, _) in BACKENDS.items():
+        if module is None:
+            names.append(name)
+            continue
+        try:
+            importlib.import_module(module)
+            names.append(name)
+        except ImportError:
+            continue
+    return names
+
+
+_auto_backend = None
+
+
+def html_to_text(html, backend=None):
+    """Visible text of a page, one non-empty line per text block.
+
+    All backends strip script and style elements and produce the same output on
+    well-formed markup; they differ only in speed and memory use. On broken
+    markup (stray table cells, misnested blocks) each parser repairs the tree
+    its own way, so the line breaks can differ there.
+    """
+    global _auto_backend
+    backend = backend or HTML_BACKEND
+    if backend == "auto":
+        if _auto_backend is None:
+            _auto_backend = available_backends()[0]
+        backend = _auto_backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown HTML backend: {backend}. Choose from {', '.join(BACKENDS)}")
+    return BACKENDS[backend][1](html)
+
+
+# Main-content detection: adjacent short lines (a bulleted list with its heading,
+# a title block) are joined into one segment, and segments are scored by word
+# count minus a fixed cost, so prose and lists score positive and navigation or
+# footer fragments negative. The highest scoring contiguous run of segments is
+# kept as the posting body, together with any requirements section outside it.
+LINE_COST = int(os.getenv("MAIN_CONTENT_LINE_COST", "4"))
+MIN_MAIN_WORDS = int(os.getenv("MAIN_CONTENT_MIN_WORDS", "40"))
+# Lines with fewer words are list items, headings or labels; each one after the
+# first in a segment costs SHORT_LINE_COST, so menus of one-word links stay negative
+SHORT_LINE_WORDS = 8
+SHORT_LINE_COST = 1
+# Short lines just above the body (job title, company, location) are kept too
+LEAD_LINES = 4
+
+BOILERPLATE_MARKERS = (
+    "cookie", "privacy policy", "terms of use", "terms of service", "all rights reserved",
+    "sign in", "log in", "sign up", "similar jobs", "share this job", "©",
+)
+
+# Headings of sections that are never dropped, wherever they sit on the page
+SECTION_MARKERS = (
+    "requirement", "qualification", "must have", "must-have", "what you'll need",
+    "what you will need", "what we're looking for", "what we are looking for",
+    "skills", "who you are", "about you", "you bring",
+)
+
+
+def _is_boilerplate(line):
+    lowered = line.lower()
+    return len(line.split()) < 12 and any(marker in lowered for marker in BOILERPLATE_MARKERS)
+
+
+def _is_section_heading(line):
+    lowered = line.lower()
+    return len(line.split()) <= 6 and any(marker in lowered for marker in SECTION_MARKERS)
+
+
+def _segments(lines):
+    """Split lines into [start, end, kind] segments; runs of short lines form one segment"""
+    segments = []
+    for i, line in enumerate(lines):
+        if _is_boilerplate(line):
+            kind = "boilerplate"
+        elif len(line.split()) < SHORT_LINE_WORDS:
+            kind = "short"
+        else:
+            kind = "long"
+        if kind == "short" and segments and segments[-1][2] == "short":
+            segments[-1][1] = i + 1
+        else:
+            segments.append([i, i + 1, kind])
+    return segments
+
+
+def _segment_score(lines, segment):
+    start, end, kind = segment
+    words = sum(len(line.split()) for line in lines[start:end])
+    if kind == "boilerplate":
+        return -LINE_COST - words
+    return words - LINE_COST - SHORT_LINE_COST * (end - start - 1)
+
+
+def extract_main_content(text):
+    """Keep only the densest block of a page, dropping nav bars, banners and footers.
+
+    Requirement and qualification sections are always kept. Returns the original
+    text when no block of at least MIN_MAIN_WORDS words stands out.
+    """
+    lines = text.split("\n")
+    segments = _segments(lines)
+    best_sum, best_start, best_end = 0, 0, -1
+    run_sum, run_start = 0, 0
+    for i, segment in enumerate(segments):
+        if run_sum <= 0:
+            run_sum, run_start = 0, i
+        run_sum += _segment_score(lines, segment)
+        if run_sum > best_sum:
+            best_sum, best_start, best_end = run_sum, run_start, i
+    if best_end < 0:
+        return text
+
+    keep = set(range(segments[best_start][0], segments[best_end][1]))
+
+    first = segments[best_start][0]
+    lead = 0
+    while lead < LEAD_LINES and first > 0 and not _is_boilerplate(lines[first - 1]):
+        first -= 1
+        lead += 1
+        keep.add(first)
+
+    # A requirements heading keeps its own segment and the prose paragraphs after it
+    for i, (start, end, kind) in enumerate(segments):
+        if kind != "short" or not any(_is_section_heading(line) for line in lines[start:end]):
+            continue
+        keep.update(range(start, end))
+        for start, end, kind in segments[i + 1:]:
+            if kind != "long":
+                break
+            keep.update(range(start, end))
+
+    main = [line for i, line in enumerate(lines) if i in keep]
+    if sum(len(line.split()) for line in main) < MIN_MAIN_WORDS:
+        return text
+    return "\n".join(main)
+
+
+def reduction_ratio(original, reduced):
+    """Fraction of characters removed from the original text"""
+    if not original:
+        return 0.0
+    return 1 - len(reduced) / len(original)
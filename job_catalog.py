@@ -0,0 +1,129 @@
+"""Job sites, domain keywords and insights, and the shared search cache, without any UI dependency"""
+import json
+import os
+from functools import lru_cache
+from urllib.parse import quote_plus
+
+from cache import SQLiteCache
+
+
+# Search results are shared by every session for this many seconds
+JOB_SEARCH_CACHE_TTL = int(os.getenv("JOB_SEARCH_CACHE_TTL", str(60 * 60)))
+JOB_SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("JOB_SEARCH_CACHE_MAX_ENTRIES", "2000"))
+
+JOB_SITES = {
+    "LinkedIn": "https://www.linkedin.com/jobs/search/?keywords={}&location={}&f_E=2,3",
+    "Indeed": "https://www.indeed.com/jobs?q={}&l={}",
+    "Glassdoor": "https://www.glassdoor.com/Job/jobs.htm?sc.keyword={}&locT=C&locId={}",
+    "AngelList": "https://angel.co/jobs?keywords={}&location={}",
+    "RemoteOK": "https://remoteok.io/remote-{}-jobs",
+    "WeWorkRemotely": "https://weworkremotely.com/remote-jobs/search?term={}",
+}
+
+DOMAIN_KEYWORDS = {
+    "Data Science": ["data scientist", "machine learning engineer", "data analyst", "ML engineer", "AI researcher", "data science intern"],
+    "Finance": ["financial analyst", "investment banker", "portfolio manager", "risk analyst", "quantitative analyst", "finance intern"],
+    "Software Engineering": ["software engineer", "full stack developer", "backend developer", "frontend developer", "DevOps engineer", "software engineering intern"],
+    "Marketing": ["digital marketing", "content marketing", "marketing manager", "SEO specialist", "social media manager", "marketing intern"],
+    "Product Management": ["product manager", "product owner", "product analyst", "growth manager", "business analyst", "product management intern"],
+    "Consulting": ["management consultant", "strategy consultant", "business consultant", "IT consultant", "consulting intern"],
+    "Healthcare": ["healthcare analyst", "medical device", "pharmaceutical", "biotech", "clinical research", "healthcare intern"],
+    "Cybersecurity": ["cybersecurity analyst", "security engineer", "penetration tester", "information security", "cybersecurity intern"],
+    "UX/UI Design": ["UX designer", "UI designer", "product designer", "visual designer", "user researcher", "design intern"],
+    "Sales": ["sales manager", "account executive", "business development", "sales representative", "sales intern"]
+}
+
+# Salary, growth and skill highlights shown for each domain
+DOMAIN_INSIGHTS = {
+    "Data Science": {
+        "avg_salary": "$95,000 - $165,000",
+        "growth_rate": "22% (Much faster than average)",
+        "key_skills": ["Python", "SQL", "Machine Learning", "Statistics", "Tableau"],
+        "certifications": ["Google Data Analytics", "AWS Machine Learning", "Microsoft Azure AI"]
+    },
+    "Finance": {
+        "avg_salary": "$85,000 - $150,000", 
+        "growth_rate": "5% (Average)",
+        "key_skills": ["Excel", "Financial Modeling", "Bloomberg Terminal", "SQL", "Python"],
+        "certifications": ["CFA", "FRM", "CPA", "Financial Modeling & Valuation"]
+    },
+    "Software Engineering": {
+        "avg_salary": "$90,000 - $180,000",
+        "growth_rate": "25% (Much faster than average)",
+        "key_skills": ["JavaScript", "Python", "React", "Node.js", "Cloud Services"],
+        "certifications": ["AWS Solutions Architect", "Google Cloud Professional", "Microsoft Azure"]
+    },
+    "Marketing": {
+        "avg_salary": "$65,000 - $120,000",
+        "growth_rate": "10% (Faster than average)", 
+        "key_skills": ["Google Analytics", "SEO", "Content Marketing", "Social Media", "PPC"],
+        "certifications": ["Google Ads", "HubSpot", "Facebook Blueprint", "Google Analytics"]
+    },
+    "Product Management": {
+        "avg_salary": "$100,000 - $170,000",
+        "growth_rate": "15% (Much faster than average)",
+        "key_skills": ["Product Strategy", "Data Analysis", "User Research", "Agile", "SQL"],
+        "certifications": ["Product School PM", "Google Product Management", "Scrum Master"]
+    }
+}
+
+# Sites used for generated suggestions
+SUGGESTION_SITES = list(JOB_SITES)[:4]
+
+
+def _search_keywords(keywords, internship):
+    """Top 3 search keywords of a domain for internship or regular positions"""
+    if internship:
+        filtered = [k for k in keywords if "intern" in k.lower()]
+        if not filtered:  # If no intern-specific keywords, add "intern" to general keywords
+            filtered = [f"{k} intern" for k in keywords[:3]]
+    else:
+        filtered = [k for k in keywords if "intern" not in k.lower()]
+    return filtered[:3]
+
+
+# Keyword lists per (domain, is_internship), computed once at import
+SEARCH_KEYWORDS = {
+    (domain, internship): _search_keywords(keywords, internship)
+    for domain, keywords in DOMAIN_KEYWORDS.items()
+    for internship in (False, True)
+}
+
+
+def search_queries(domain, job_type="Full-time"):
+    """(keyword, search query) pairs searched for a domain and job type"""
+    queries = []
+    for keyword in SEARCH_KEYWORDS.get((domain, job_type.lower() == "internship"), []):
+        # Add job type to search query
+        search_query = keyword
+        if job_type.lower() != "full-time":
+            search_query += f" {job_type.lower()}"
+        queries.append((keyword, search_query))
+    return queries
+
+
+@lru_cache(maxsize=4096)
+def build_search_url(site_name, search_query, location):
+    """Search URL of a job site, memoized per (site, query, location)"""
+    site_url = JOB_SITES[site_name]
+    if site_name == "RemoteOK":
+        return site_url.format(quote_plus(search_query.replace(" ", "-")))
+    elif site_name == "WeWorkRemotely":
+        return site_url.format(quote_plus(search_query))
+    return site_url.format(quote_plus(search_query), quote_plus(location))
+
+
+@lru_cache(maxsize=None)
+def get_search_cache():
+    return SQLiteCache("job_searches", ttl=JOB_SEARCH_CACHE_TTL, max_entries=JOB_SEARCH_CACHE_MAX_ENTRIES)
+
+
+def _normalize_filter(value):
+    return " ".join((value or "").lower().split())
+
+
+def search_cache_key(kind, domain, location="", experience_level="", job_type="", company=""):
+    """Cache key of a search; kind separates URL suggestions from fetched listings"""
+    return json.dumps([
+        kind, domain, _normalize_filter(location), experience_level, job_type, _normalize_filter(company)
+    ])
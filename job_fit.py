@@ -0,0 +1,110 @@
+import re
+from collections import Counter
+
+import numpy as np
+
+from token_budget import STOPWORDS
+
+# Like token_budget.TERM_RE, but keeps two-letter terms such as "ml", "ai" and "ux"
+FIT_TERM_RE = re.compile(r"[a-z][a-z0-9+#.]+")
+DOCUMENT_TERM_RE = re.compile(r"[a-z][a-z0-9+#.]+|\n")
+
+# Posting fields compared with the resume
+POSTING_FIELDS = ("title", "keyword", "company", "location", "description")
+
+# Query weight multiplier for terms of the skills listed on the resume
+SKILL_BOOST = 2.0
+
+
+def fit_terms(text):
+    """Lowercased terms of text, stopwords removed, repeats kept for term frequency"""
+    terms = (term.strip(".") for term in FIT_TERM_RE.findall(text.lower()))
+    return [term for term in terms if term and term not in STOPWORDS]
+
+
+def posting_text(posting):
+    return " ".join(str(posting.get(field) or "") for field in POSTING_FIELDS)
+
+
+def _term_matrix(documents):
+    """(document ids, term ids, vocabulary) of every kept term occurrence in documents.
+
+    All documents are tokenized in one regex pass over their newline-joined
+    text; the newlines mark document boundaries. Stopwords are dropped per
+    distinct token rather than per occurrence.
+    """
+    text = "\n".join(document.replace("\n", " ") for document in documents).lower()
+    tokens = DOCUMENT_TERM_RE.findall(text)
+    token_ids = {}
+    ids = np.fromiter((token_ids.setdefault(token, len(token_ids)) for token in tokens),
+                      dtype=np.int64, count=len(tokens))
+
+    vocabulary = {}
+    token_terms = np.full(len(token_ids), -1, dtype=np.int64)
+    for token, token_id in token_ids.items():
+        term = token.strip(".")
+        if token != "\n" and term and term not in STOPWORDS:
+            token_terms[token_id] = vocabulary.setdefault(term, len(vocabulary))
+
+    doc_ids = np.cumsum(ids == token_ids.get("\n", -1))
+    term_ids = token_terms[ids]
+    kept = term_ids >= 0
+    return doc_ids[kept], term_ids[kept], vocabulary
+
+
+def tfidf_scores(resume_text, documents, boost_terms=()):
+    """Cosine similarity of each document to the resume under TF-IDF weights.
+
+    All documents are scored together: their terms become one COO matrix of
+    (document, term, count) triplets, and document frequencies, norms and dot
+    products are each a single np.bincount over it. Resume terms in
+    ``boost_terms`` weigh SKILL_BOOST times as much.
+    """
+    documents = list(documents)
+    n_docs = len(documents)
+    if not n_docs:
+        return np.zeros(0)
+
+    doc_ids, term_ids, vocabulary = _term_matrix(documents)
+    n_terms = len(vocabulary)
+    if not n_terms:
+        return np.zeros(n_docs)
+
+    # Collapse repeated (document, term) pairs into counts
+    pairs, counts = np.unique(doc_ids * n_terms + term_ids, return_counts=True)
+    rows, cols = np.divmod(pairs, n_terms)
+
+    document_frequency = np.bincount(cols, minlength=n_terms)
+    idf = np.log((1 + n_docs) / (1 + document_frequency)) + 1
+    weights = (1 + np.log(counts)) * idf[cols]
+    doc_norms = np.sqrt(np.bincount(rows, weights=weights ** 2, minlength=n_docs))
+
+    boost_terms = set(boost_terms)
+    query = np.zeros(n_terms)
+    for term, count in Counter(fit_terms(resume_text)).items():
+        if term in vocabulary:
+            boost = SKILL_BOOST if term in boost_terms else 1.0
+            query[vocabulary[term]] = (1 + np.log(count)) * idf[vocabulary[term]] * boost
+    query_norm = np.sqrt(np.square(query).sum())
+    if not query_norm:
+        return np.zeros(n_docs)
+
+    dots = np.bincount(rows, weights=weights * query[cols], minlength=n_docs)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scores = dots / (doc_norms * query_norm)
+    return np.nan_to_num(scores)
+
+
+def rank_postings(postings, resume_text, skills=()):
+    """Postings ordered by fit with the resume, best first, each with a "fit" score in [0, 1].
+
+    ``skills`` (e.g. Resume.skills) marks the resume terms that matter most.
+    """
+    postings = list(postings)
+    if not postings or not resume_text or not resume_text.strip():
+        return postings
+    skill_terms = fit_terms(" ".join(skills))
+    scores = tfidf_scores(resume_text, (posting_text(posting) for posting in postings), skill_terms)
+    # Stable sort keeps generation order among equally good postings
+    order = np.argsort(-scores, kind="stable")
+    return [dict(postings[i], fit=round(float(scores[i]), 4)) for i in order]
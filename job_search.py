@@ -4,70 +4,55 @@ import streamlit as st
 from urllib.parse import quote_plus
 import time
 
+from job_catalog import (
+    DOMAIN_INSIGHTS, DOMAIN_KEYWORDS, JOB_SITES, SUGGESTION_SITES, build_search_url, get_search_cache,
+    search_cache_key, search_queries,
+)
+from job_fit import rank_postings
+from resume import build_resume
+from resume_parser import EXTRACTORS, parse_resume
+
+
 class JobSearcher:
     def __init__(self):
-        self.job_sites = {
-            "LinkedIn": "https://www.linkedin.com/jobs/search/?keywords={}&location={}&f_E=2,3",
-            "Indeed": "https://www.indeed.com/jobs?q={}&l={}",
-            "Glassdoor": "https://www.glassdoor.com/Job/jobs.htm?sc.keyword={}&locT=C&locId={}",
-            "AngelList": "https://angel.co/jobs?keywords={}&location={}",
-            "RemoteOK": "https://remoteok.io/remote-{}-jobs",
-            "WeWorkRemotely": "https://weworkremotely.com/remote-jobs/search?term={}",        }
-        
-        self.domain_keywords = {
-            "Data Science": ["data scientist", "machine learning engineer", "data analyst", "ML engineer", "AI researcher", "data science intern"],
-            "Finance": ["financial analyst", "investment banker", "portfolio manager", "risk analyst", "quantitative analyst", "finance intern"],
-            "Software Engineering": ["software engineer", "full stack developer", "backend developer", "frontend developer", "DevOps engineer", "software engineering intern"],
-            "Marketing": ["digital marketing", "content marketing", "marketing manager", "SEO specialist", "social media manager", "marketing intern"],
-            "Product Management": ["product manager", "product owner", "product analyst", "growth manager", "business analyst", "product management intern"],
-            "Consulting": ["management consultant", "strategy consultant", "business consultant", "IT consultant", "consulting intern"],
-            "Healthcare": ["healthcare analyst", "medical device", "pharmaceutical", "biotech", "clinical research", "healthcare intern"],
-            "Cybersecurity": ["cybersecurity analyst", "security engineer", "penetration tester", "information security", "cybersecurity intern"],
-            "UX/UI Design": ["UX designer", "UI designer", "product designer", "visual designer", "user researcher", "design intern"],            "Sales": ["sales manager", "account executive", "business development", "sales representative", "sales intern"]
-        }
+        self.job_sites = JOB_SITES
+        self.domain_keywords = DOMAIN_KEYWORDS
 
     def get_job_suggestions(self, domain, location="United States", experience_level="entry", job_type="Full-time"):
         """Get job suggestions based on domain and preferences"""
         if domain not in self.domain_keywords:
             return []
-        
-        keywords = self.domain_keywords[domain]
-        
-        # Filter keywords based on job type
-        if job_type.lower() == "internship":
-            keywords = [k for k in keywords if "intern" in k.lower()]
-            if not keywords:  # If no intern-specific keywords, add "intern" to general keywords
-                keywords = [f"{k} intern" for k in self.domain_keywords[domain][:3]]
-        else:
-            keywords = [k for k in keywords if "intern" not in k.lower()]
-        
+
         job_suggestions = []
-        
-        for keyword in keywords[:3]:  # Limit to top 3 keywords
-            # Add job type to search query
-            search_query = keyword
-            if job_type.lower() != "full-time":
-                search_query += f" {job_type.lower()}"
-            
-            for site_name, site_url in list(self.job_sites.items())[:4]:  # Limit to top 4 sites
-                try:
-                    if site_name == "RemoteOK":
-                        formatted_url = site_url.format(quote_plus(search_query.replace(" ", "-")))
-                    elif site_name == "WeWorkRemotely":
-                        formatted_url = site_url.format(quote_plus(search_query))
-                    else:
-                        formatted_url = site_url.format(quote_plus(search_query), quote_plus(location))
-                    
-                    job_suggestions.append({
-                        "title": f"{keyword.title()} ({job_type}) - {site_name}",
-                        "url": formatted_url,
-                        "site": site_name,
-                        "keyword": keyword,
-                        "job_type": job_type
-                    })
-                except Exception as e:
-                    continue
-        
+
+        for keyword, search_query in search_queries(domain, job_type):
+            for site_name in SUGGESTION_SITES:
+                job_suggestions.append({
+                    "title": f"{keyword.title()} ({job_type}) - {site_name}",
+                    "url": build_search_url(site_name, search_query, location),
+                    "site": site_name,
+                    "keyword": keyword,
+                    "job_type": job_type
+                })
+
+        return job_suggestions
+
+    def find_jobs(self, domain, location="United States", experience_level="entry", job_type="Full-time",
+                  company="", use_cache=True):
+        """Job suggestions for a search, served from the shared cache while fresh"""
+        key = search_cache_key("suggestions", domain, location, experience_level, job_type, company)
+        if use_cache:
+            entry = get_search_cache().get(key)
+            if entry is not None:
+                return entry["value"]
+
+        if company:
+            job_suggestions = self.search_specific_jobs(domain, company, location)
+        else:
+            job_suggestions = self.get_job_suggestions(domain, location, experience_level, job_type)
+
+        if use_cache and job_suggestions:
+            get_search_cache().set(key, job_suggestions)
         return job_suggestions
 
     def search_specific_jobs(self, domain, company_name="", location="United States"):
@@ -124,6 +109,21 @@ class JobSearcher:
         
         return company_mapping.get(domain, [])
 
+# Shared by every session; its lookup tables are built once per process
+job_searcher = JobSearcher()
+
+
+def uploaded_resume_text():
+    """Text of the resume uploaded in the email tab, or None"""
+    resume_file = st.session_state.get("email_resume")
+    if resume_file is None or resume_file.type not in EXTRACTORS:
+        return None
+    try:
+        return parse_resume(resume_file.getvalue(), resume_file.type)
+    except Exception:
+        return None
+
+
 def display_job_search_interface():
     """Display the job search interface"""
     st.markdown("## 🔍 Job Search Assistant")
@@ -134,7 +134,7 @@ def display_job_search_interface():
         # Domain selection
         selected_domain = st.selectbox(
             "🎯 Select Your Domain",
-            options=list(JobSearcher().domain_keywords.keys()),
+            options=list(job_searcher.domain_keywords.keys()),
             help="Choose the field you want to search jobs in"
         )
         
@@ -174,25 +174,30 @@ def display_job_search_interface():
         )
       # Search button
     if st.button("🔍 Find Jobs", type="primary", use_container_width=True):
-        job_searcher = JobSearcher()
-        
         with st.spinner("🔄 Searching for jobs..."):
-            # Get job suggestions
-            if company_filter:
-                job_suggestions = job_searcher.search_specific_jobs(
-                    selected_domain, 
-                    company_filter, 
-                    location
-                )
-            else:
-                job_suggestions = job_searcher.get_job_suggestions(
-                    selected_domain, 
-                    location, 
-                    experience_level.lower().replace(" ", "_"),
-                    job_type                )
+            # Get job suggestions, shared with other sessions through the search cache
+            job_suggestions = job_searcher.find_jobs(
+                selected_domain,
+                location,
+                experience_level.lower().replace(" ", "_"),
+                job_type,
+                company_filter
+            )
+
+            # Best fit with the resume uploaded in the email tab first
+            resume_text = uploaded_resume_text()
+            if resume_text:
+                job_suggestions = rank_postings(job_suggestions, resume_text, build_resume(resume_text).skills)
         
         if job_suggestions:
             st.success(f"✅ Found {len(job_suggestions)} job opportunities!")
+            if resume_text:
+                st.caption("Ranked by fit with your uploaded resume")
+            search_cache = get_search_cache()
+            st.caption(
+                f"Search cache: {search_cache.hit_rate():.0%} hit rate "
+                f"({search_cache.stats['hits']} hits, {search_cache.stats['misses']} misses)"
+            )
             
             # Display job suggestions with helpful tip
             st.markdown("### 📋 Job Opportunities")
@@ -216,7 +221,7 @@ def display_job_search_interface():
                         <p style="margin: 0.25rem 0; color: #7f8c8d;">
                             <strong>Site:</strong> {job['site']} | 
                             <strong>Keywords:</strong> {job['keyword']} | 
-                            <strong>Type:</strong> {job.get('job_type', 'Full-time')}
+                            <strong>Type:</strong> {job.get('job_type', 'Full-time')}{f" | <strong>Fit:</strong> {job['fit']:.0%}" if 'fit' in job else ""}
                         </p>
                     </div>
                     """, unsafe_allow_html=True)
@@ -347,43 +352,11 @@ def display_job_search_interface():
     
     return selected_domain
 
+
 def display_job_insights(domain):
     """Display insights for the selected domain"""
-    insights = {
-        "Data Science": {
-            "avg_salary": "$95,000 - $165,000",
-            "growth_rate": "22% (Much faster than average)",
-            "key_skills": ["Python", "SQL", "Machine Learning", "Statistics", "Tableau"],
-            "certifications": ["Google Data Analytics", "AWS Machine Learning", "Microsoft Azure AI"]
-        },
-        "Finance": {
-            "avg_salary": "$85,000 - $150,000", 
-            "growth_rate": "5% (Average)",
-            "key_skills": ["Excel", "Financial Modeling", "Bloomberg Terminal", "SQL", "Python"],
-            "certifications": ["CFA", "FRM", "CPA", "Financial Modeling & Valuation"]
-        },
-        "Software Engineering": {
-            "avg_salary": "$90,000 - $180,000",
-            "growth_rate": "25% (Much faster than average)",
-            "key_skills": ["JavaScript", "Python", "React", "Node.js", "Cloud Services"],
-            "certifications": ["AWS Solutions Architect", "Google Cloud Professional", "Microsoft Azure"]
-        },
-        "Marketing": {
-            "avg_salary": "$65,000 - $120,000",
-            "growth_rate": "10% (Faster than average)", 
-            "key_skills": ["Google Analytics", "SEO", "Content Marketing", "Social Media", "PPC"],
-            "certifications": ["Google Ads", "HubSpot", "Facebook Blueprint", "Google Analytics"]
-        },
-        "Product Management": {
-            "avg_salary": "$100,000 - $170,000",
-            "growth_rate": "15% (Much faster than average)",
-            "key_skills": ["Product Strategy", "Data Analysis", "User Research", "Agile", "SQL"],
-            "certifications": ["Product School PM", "Google Product Management", "Scrum Master"]
-        }
-    }
-    
-    if domain in insights:
-        insight = insights[domain]
+    if domain in DOMAIN_INSIGHTS:
+        insight = DOMAIN_INSIGHTS[domain]
         
         st.markdown("### 📊 Domain Insights")
         
@@ -0,0 +1,271 @@
+import json
+import os
+import threading
+import time
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from bs4 import BeautifulSoup
+
+from job_catalog import JOB_SITES, build_search_url, get_search_cache, search_cache_key, search_queries
+from scraper import fetch, map_per_host
+
+# Fetch limits: parallel requests overall, parallel requests per site and
+# requests per second per site
+LISTINGS_MAX_WORKERS = int(os.getenv("LISTINGS_MAX_WORKERS", "8"))
+LISTINGS_PER_SITE = int(os.getenv("LISTINGS_PER_SITE", "2"))
+LISTINGS_RATE = float(os.getenv("LISTINGS_RATE", "1"))
+
+
+def _bs4_parser():
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+
+BS4_PARSER = _bs4_parser()
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across threads"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _text(node):
+    return " ".join(node.get_text(" ").split()) if node is not None else ""
+
+
+class SiteAdapter:
+    """Search results parser for one job site.
+
+    Subclasses name the site and give CSS selectors for a result card and its
+    fields. ``base_url`` sends requests to another host (a local stub server
+    with recorded pages, for instance); posting links always resolve against
+    the real site.
+    """
+
+    site = None
+    card = None
+    title = None
+    company = None
+    location = None
+    link = None
+
+    def __init__(self, base_url=None):
+        self.base_url = base_url
+        parts = urlsplit(JOB_SITES[self.site])
+        self.site_root = f"{parts.scheme}://{parts.netloc}/"
+
+    def search_url(self, query, location):
+        url = build_search_url(self.site, query, location)
+        if not self.base_url:
+            return url
+        base = urlsplit(self.base_url)
+        parts = urlsplit(url)
+        return urlunsplit((base.scheme, base.netloc, base.path.rstrip("/") + parts.path, parts.query, ""))
+
+    def posting_url(self, node):
+        if node is None:
+            return ""
+        href = node.get("href") or node.get("data-href") or ""
+        return urljoin(self.site_root, href.strip()) if href.strip() else ""
+
+    def parse(self, html):
+        """Postings on a search results page as dicts of title, company, location, url and site"""
+        soup = BeautifulSoup(html, BS4_PARSER)
+        postings = []
+        for card in soup.select(self.card):
+            title_node = card.select_one(self.title)
+            link_node = card.select_one(self.link) if self.link else title_node
+            posting = {
+                "title": _text(title_node),
+                "company": _text(card.select_one(self.company)),
+                "location": _text(card.select_one(self.location)) if self.location else "",
+                # Some sites put the posting link on the card itself
+                "url": self.posting_url(link_node) or self.posting_url(card),
+                "site": self.site,
+            }
+            if posting["title"] and posting["url"]:
+                postings.append(posting)
+        return postings
+
+
+class LinkedInAdapter(SiteAdapter):
+    site = "LinkedIn"
+    card = "div.base-search-card, div.base-card"
+    title = "h3.base-search-card__title"
+    company = "h4.base-search-card__subtitle"
+    location = "span.job-search-card__location"
+    link = "a.base-card__full-link"
+
+
+class IndeedAdapter(SiteAdapter):
+    site = "Indeed"
+    card = "div.job_seen_beacon"
+    title = "h2.jobTitle"
+    company = "[data-testid=company-name], span.companyName"
+    location = "[data-testid=text-location], div.companyLocation"
+    link = "h2.jobTitle a"
+
+
+class GlassdoorAdapter(SiteAdapter):
+    site = "Glassdoor"
+    card = "li[data-test=jobListing]"
+    title = "[data-test=job-title]"
+    company = "[class*=EmployerProfile_compactEmployerName], [data-test=employer-short-name]"
+    location = "[data-test=emp-location]"
+    link = "a[data-test=job-title]"
+
+
+class AngelListAdapter(SiteAdapter):
+    """One result card per startup, listing several of its open roles"""
+
+    site = "AngelList"
+    card = "[data-test=StartupResult]"
+    title = "a[href*='/jobs/']"
+    company = "h2"
+    location = "[class*=location]"
+
+    def parse(self, html):
+        soup = BeautifulSoup(html, BS4_PARSER)
+        postings = []
+        for card in soup.select(self.card):
+            company = _text(card.select_one(self.company))
+            location = _text(card.select_one(self.location))
+            for role in card.select(self.title):
+                title = _text(role.select_one("span") or role)
+                url = self.posting_url(role)
+                if title and url:
+                    postings.append({
+                        "title": title,
+                        "company": company,
+                        "location": location,
+                        "url": url,
+                        "site": self.site,
+                    })
+        return postings
+
+
+class RemoteOKAdapter(SiteAdapter):
+    site = "RemoteOK"
+    card = "tr.job"
+    title = "h2[itemprop=title], h2"
+    company = "h3[itemprop=name], h3"
+    location = "div.location"
+    link = "a.preventLink[href], a[itemprop=url]"
+
+
+class WeWorkRemotelyAdapter(SiteAdapter):
+    site = "WeWorkRemotely"
+    card = "section.jobs li:has(a[href^='/remote-jobs/'])"
+    title = "span.title"
+    company = "span.company"
+    location = "span.region"
+    link = "a[href^='/remote-jobs/']"
+
+
+ADAPTERS = {
+    adapter.site: adapter
+    for adapter in (LinkedInAdapter, IndeedAdapter, GlassdoorAdapter, AngelListAdapter,
+                    RemoteOKAdapter, WeWorkRemotelyAdapter)
+}
+
+# Process-wide per-site limiters, so concurrent sessions share each site's rate
+_site_limiters = {}
+_site_limiters_lock = threading.Lock()
+
+
+def site_limiter(site):
+    with _site_limiters_lock:
+        if site not in _site_limiters:
+            _site_limiters[site] = RateLimiter(LISTINGS_RATE)
+        return _site_limiters[site]
+
+
+def fetch_listings(queries, location="United States", sites=None, max_workers=None, per_site=None,
+                   rate=None, base_urls=None, timeout=None):
+    """Fetch and parse search results for every (query, site) pair concurrently.
+
+    Yields ``(site, query, postings, error)`` as each page finishes. At most
+    ``max_workers`` pages are fetched at once, at most ``per_site`` of them from
+    the same site, and each site is requested at most ``rate`` times per second.
+    ``base_urls`` maps site names to replacement hosts. Failures are yielded
+    with postings None instead of raised.
+    """
+    queries = list(dict.fromkeys(queries))
+    sites = list(sites or ADAPTERS)
+    unknown = [site for site in sites if site not in ADAPTERS]
+    if unknown:
+        raise ValueError(f"No listings adapter for: {', '.join(unknown)}. Choose from {', '.join(ADAPTERS)}")
+    if not queries or not sites:
+        return
+
+    base_urls = base_urls or {}
+    max_workers = max_workers or LISTINGS_MAX_WORKERS
+    per_site = per_site or LISTINGS_PER_SITE
+
+    adapters = {site: ADAPTERS[site](base_url=base_urls.get(site)) for site in sites}
+    if rate is None:
+        limiters = {site: site_limiter(site) for site in sites}
+    else:
+        limiters = {site: RateLimiter(rate) for site in sites}
+
+    def worker(task):
+        site, query = task
+        adapter = adapters[site]
+        limiters[site].wait()
+        response = fetch(adapter.search_url(query, location), timeout=timeout)
+        return adapter.parse(response.text)
+
+    # Pages of one site wait in its queue instead of holding pool threads
+    tasks = [(site, query) for query in queries for site in sites]
+    for (site, query), postings, error in map_per_host(worker, tasks, lambda task: task[0], max_workers, per_site):
+        yield site, query, postings, error
+
+
+def get_live_listings(domain, location="United States", job_type="Full-time", sites=None, use_cache=True,
+                      **options):
+    """Postings for a domain's search keywords across job sites, without duplicates.
+
+    Returns ``(postings, errors)``; errors maps (site, query) to the exception
+    raised for that page. Complete results are kept in the shared search cache,
+    keyed apart for replacement hosts (``base_urls``). Other keyword arguments
+    go to fetch_listings.
+    """
+    kind = "listings" if sites is None else "listings:" + ",".join(sites)
+    if options.get("base_urls"):
+        kind += ":" + json.dumps(sorted(options["base_urls"].items()))
+    key = search_cache_key(kind, domain, location, job_type=job_type)
+    if use_cache:
+        entry = get_search_cache().get(key)
+        if entry is not None:
+            return entry["value"], {}
+
+    queries = {search_query: keyword for keyword, search_query in search_queries(domain, job_type)}
+    postings = {}
+    errors = {}
+    for site, query, found, error in fetch_listings(queries, location, sites, **options):
+        if error is not None:
+            errors[(site, query)] = error
+            continue
+        for posting in found:
+            postings.setdefault(posting["url"], dict(posting, keyword=queries[query], job_type=job_type))
+
+    postings = list(postings.values())
+    # Partial results are not cached, so a failing site is retried on the next search
+    if use_cache and postings and not errors:
+        get_search_cache().set(key, postings)
+    return postings, errors
@@ -1,45 +1,228 @@
+import csv
+import hashlib
+import os
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+PORTFOLIO_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "my_portfolio.csv")
+
+# Semantic matching through the Chroma index; "0" keeps tag overlap only
+PORTFOLIO_SEMANTIC = os.getenv("PORTFOLIO_SEMANTIC", "1") != "0"
+# After the index fails (e.g. the embedding model cannot be downloaded), tag
+# overlap is used for this many seconds before the index is tried again
+PORTFOLIO_INDEX_RETRY = int(os.getenv("PORTFOLIO_INDEX_RETRY", "600"))
+
+# Predefined portfolio links with associated tags/skills, used when no CSV is available
+DEFAULT_PROJECTS = [
+    {
+        "title": "AI Resume Analyzer",
+        "url": "https://github.com/username/ai-resume-analyzer",
+        "tags": ["AI", "machine learning", "NLP", "resume"]
+    },
+    {
+        "title": "Personal Website",
+        "url": "https://username.github.io",
+        "tags": ["web development", "portfolio", "React"]
+    },
+    {
+        "title": "Chatbot Assistant",
+        "url": "https://github.com/username/chatbot-assistant",
+        "tags": ["chatbot", "AI", "dialogue systems"]
+    },
+    {
+        "title": "Grammar Scoring Engine",
+        "url": "https://github.com/username/grammar-scoring",
+        "tags": ["NLP", "grammar", "scoring"]
+    },
+]
+
+
+def split_techstack(techstack):
+    """Tags of a "React, Node.js, MongoDB" style tech stack"""
+    return [tag.strip() for tag in techstack.split(",") if tag.strip()]
+
+
+def _title_from_url(url, tags):
+    slug = urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+    if slug:
+        return slug.replace("-", " ").replace("_", " ").title()
+    return ", ".join(tags)
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_portfolio_csv(path):
+    """Yield projects from a Techstack/Links CSV one row at a time"""
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            url = (row.get("Links") or "").strip()
+            tags = split_techstack(row.get("Techstack") or "")
+            if not url or not tags:
+                continue
+            yield {
+                "title": (row.get("Title") or "").strip() or _title_from_url(url, tags),
+                "url": url,
+                "tags": tags,
+            }
+
+
 class Portfolio:
-    def __init__(self):
-        # Predefined portfolio links with associated tags/skills
-        self.projects = [
-            {
-                "title": "AI Resume Analyzer",
-                "url": "https://github.com/username/ai-resume-analyzer",
-                "tags": ["AI", "machine learning", "NLP", "resume"]
-            },
-            {
-                "title": "Personal Website",
-                "url": "https://username.github.io",
-                "tags": ["web development", "portfolio", "React"]
-            },
-            {
-                "title": "Chatbot Assistant",
-                "url": "https://github.com/username/chatbot-assistant",
-                "tags": ["chatbot", "AI", "dialogue systems"]
-            },
-            {
-                "title": "Grammar Scoring Engine",
-                "url": "https://github.com/username/grammar-scoring",
-                "tags": ["NLP", "grammar", "scoring"]
-            },
-        ]
+    def __init__(self, file_path=PORTFOLIO_CSV):
+        self.file_path = file_path
+        self.projects = list(DEFAULT_PROJECTS)
+        self._signature = None
+        self._digest = None
+        self._lock = threading.Lock()
+        # Separate from _lock, so tag matching never waits on an index build or sync
+        self._index_lock = threading.Lock()
+        self._vector_index = None
+        self._indexed_projects = None
+        self._index_failed_at = None
+        # Last exception raised by the vector index, for display or debugging
+        self.index_error = None
+        self.build_index()
+        self.load_portfolio()
+
+    def build_index(self):
+        """Normalize tags once and map each tag to the ids of the projects carrying it"""
+        self.tag_index = self._index(self.projects)
+
+    @staticmethod
+    def _index(projects):
+        tag_index = {}
+        for project_id, project in enumerate(projects):
+            for tag in {tag.strip().lower() for tag in project["tags"]}:
+                tag_index.setdefault(tag, []).append(project_id)
+        return tag_index
 
     def load_portfolio(self):
-        # Placeholder for loading from file/db if needed in future
-        pass
+        """(Re)load the CSV if it changed since the last load; returns True when reloaded.
 
-    def query_links(self, skills):
-        # Given a list of skills, return matching project links as a comma-separated string
-        matched_links = []
-        skills_lower = set(skill.lower() for skill in skills)
+        A stat call decides whether the file may have changed; the content hash
+        confirms it before the rows are parsed again.
+        """
+        if not self.file_path:
+            return False
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return False
 
-        for project in self.projects:
-            project_tags = set(tag.lower() for tag in project["tags"])
-            if skills_lower & project_tags:
-                matched_links.append(f"[{project['title']}]({project['url']})")
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return False
+
+        with self._lock:
+            if signature == self._signature:
+                return False
+            digest = _file_digest(self.file_path)
+            if digest == self._digest:
+                self._signature = signature
+                return False
+
+            # A CSV without usable rows counts as no CSV: the default projects apply
+            projects = list(read_portfolio_csv(self.file_path)) or list(DEFAULT_PROJECTS)
+            self.projects, self.tag_index = projects, self._index(projects)
+            self._signature, self._digest = signature, digest
+            return True
+
+    def match_projects(self, skills, limit=None, preferred=()):
+        """Projects sharing at least one tag with skills, most overlapping tags first.
+
+        Skills also in ``preferred`` (e.g. those the candidate lists on the
+        resume) count twice.
+        """
+        self.load_portfolio()
+        with self._lock:
+            projects, tag_index = self.projects, self.tag_index
+
+        skills = {skill.strip().lower() for skill in skills}
+        preferred = {skill.strip().lower() for skill in preferred} & skills
+        overlap = Counter()
+        for skill in list(skills) + list(preferred):
+            overlap.update(tag_index.get(skill, ()))
+
+        ranked = sorted(overlap, key=lambda project_id: (-overlap[project_id], project_id))
+        return [projects[project_id] for project_id in ranked[:limit]]
+
+    def vector_index(self):
+        """Chroma index kept in sync with the loaded projects, or None without chromadb"""
+        if self._vector_index is None:
+            with self._index_lock:
+                if self._vector_index is None:
+                    try:
+                        from portfolio_index import PortfolioIndex
+                        self._vector_index = PortfolioIndex()
+                    except ImportError:
+                        return None
+        if self._indexed_projects is not self.projects:
+            with self._index_lock:
+                projects = self.projects
+                if self._indexed_projects is not projects:
+                    self._vector_index.sync(projects)
+                    self._indexed_projects = projects
+        return self._vector_index
+
+    def semantic_projects(self, skills, k=3, preferred=()):
+        """Projects closest in meaning to the skills, falling back to tag overlap.
+
+        Tag overlap is used without chromadb, when PORTFOLIO_SEMANTIC is off, and
+        for PORTFOLIO_INDEX_RETRY seconds after any index error.
+        """
+        self.load_portfolio()
+        if isinstance(skills, str):
+            skills = [skills]
+        if (not PORTFOLIO_SEMANTIC or self._index_failed_at is not None
+                and time.monotonic() - self._index_failed_at < PORTFOLIO_INDEX_RETRY):
+            return self.match_projects(skills, k, preferred)
+
+        # Skills the candidate also has lead the query text
+        preferred = [skill for skill in skills if skill in set(preferred)]
+        text = ", ".join(preferred + [skill for skill in skills if skill not in preferred])
+        try:
+            index = self.vector_index()
+            if index is not None and text.strip():
+                matches = index.query(text, k)
+                self._index_failed_at = None
+                if matches:
+                    return matches
+        except Exception as e:
+            self.index_error = e
+            self._index_failed_at = time.monotonic()
+        return self.match_projects(skills, k, preferred)
+
+    def query_links(self, skills, limit=None, preferred=(), semantic=False):
+        # Given a list of skills, return matching project links as a comma-separated string
+        if semantic:
+            projects = self.semantic_projects(skills, limit or 3, preferred)
+        else:
+            projects = self.match_projects(skills, limit, preferred)
+        matched_links = [f"[{p['title']}]({p['url']})" for p in projects]
 
         if not matched_links:
             # Return some default links if no match found
             matched_links = [f"[{p['title']}]({p['url']})" for p in self.projects[:2]]
 
         return ", ".join(matched_links)
+
+
+_portfolio = None
+_portfolio_lock = threading.Lock()
+
+
+def get_portfolio():
+    """Process-wide portfolio loaded from my_portfolio.csv"""
+    global _portfolio
+    if _portfolio is None:
+        with _portfolio_lock:
+            if _portfolio is None:
+                _portfolio = Portfolio()
+    return _portfolio
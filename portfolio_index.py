@@ -0,0 +1,91 @@
+import hashlib
+import os
+import shutil
+
+from cache import CACHE_DIR
+from embeddings import embed_texts
+
+# Chroma store shipped with the repo; it seeds the working copy and is never written
+VECTORSTORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vectorstore")
+# Working copy that sync() updates
+INDEX_DIR = os.path.join(CACHE_DIR, "vectorstore")
+COLLECTION_NAME = "portfolio"
+
+
+def row_id(project):
+    """Stable id of a portfolio row; changes whenever its tech stack or link changes"""
+    content = "\0".join([", ".join(project["tags"]), project["url"], project["title"]])
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class PortfolioIndex:
+    """Semantic portfolio search over a persisted Chroma collection.
+
+    The collection lives in INDEX_DIR under the cache directory, copied on
+    first use from the bundled vectorstore/ so its embeddings are reused. Tech
+    stacks and queries are embedded through the shared embedding cache
+    (Chroma's local CPU model, all-MiniLM-L6-v2) unless another ``embed``
+    callable is given, and looked up through the collection's HNSW index.
+    """
+
+    def __init__(self, path=INDEX_DIR, collection_name=COLLECTION_NAME, embed=None, seed=VECTORSTORE_DIR):
+        import chromadb
+        from chromadb.config import Settings
+
+        if seed and not os.path.exists(path) and os.path.isdir(seed):
+            shutil.copytree(seed, path)
+        self.client = chromadb.PersistentClient(path=path, settings=Settings(anonymized_telemetry=False))
+        self.collection = self.client.get_or_create_collection(name=collection_name)
+        self.embed = embed or embed_texts
+
+    def sync(self, projects):
+        """Upsert rows that are new or changed and delete rows no longer in the portfolio.
+
+        Rows being replaced lend their embeddings to new rows with the same tech
+        stack, so only unseen tech stacks are embedded. Returns that number.
+        """
+        rows = {row_id(project): project for project in projects}
+        existing = set(self.collection.get(include=[])["ids"])
+        stale = list(existing - rows.keys())
+
+        embedded = 0
+        new_ids = [id_ for id_ in rows if id_ not in existing]
+        if new_ids:
+            reusable = {}
+            if stale:
+                old = self.collection.get(ids=stale, include=["documents", "embeddings"])
+                reusable = dict(zip(old["documents"], old["embeddings"]))
+            documents = [", ".join(rows[id_]["tags"]) for id_ in new_ids]
+            missing = list(dict.fromkeys(document for document in documents if document not in reusable))
+            if missing:
+                reusable.update(zip(missing, self.embed(missing)))
+                embedded = len(missing)
+            self.collection.upsert(
+                ids=new_ids,
+                embeddings=[list(map(float, reusable[document])) for document in documents],
+                documents=documents,
+                metadatas=[{"links": rows[id_]["url"], "title": rows[id_]["title"]} for id_ in new_ids],
+            )
+
+        if stale:
+            self.collection.delete(ids=stale)
+        return embedded
+
+    def query(self, text, k=3):
+        """Top-k portfolio rows closest to text (a skill list or job description)"""
+        count = self.collection.count()
+        if not count or not text.strip():
+            return []
+
+        result = self.collection.query(query_embeddings=self.embed([text]).tolist(), n_results=min(k, count))
+        matches = []
+        for document, metadata, distance in zip(
+            result["documents"][0], result["metadatas"][0], result["distances"][0]
+        ):
+            matches.append({
+                "title": metadata.get("title") or document,
+                "url": metadata["links"],
+                "tags": [tag.strip() for tag in document.split(",") if tag.strip()],
+                "distance": distance,
+            })
+        return matches
@@ -0,0 +1,98 @@
+import re
+from functools import lru_cache
+
+from token_budget import key_terms
+
+# Headings that start each resume section, matched case-insensitively
+SECTION_HEADINGS = {
+    "summary": ["summary", "professional summary", "profile", "objective", "about me", "career objective"],
+    "experience": ["experience", "work experience", "professional experience", "employment history",
+                   "work history", "employment", "internships", "internship experience"],
+    "skills": ["skills", "technical skills", "key skills", "core competencies", "technologies",
+               "tools", "tech stack", "skills & tools", "skills and tools"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects"],
+    "education": ["education", "academic background", "qualifications", "education & training"],
+    "certifications": ["certifications", "certificates", "licenses & certifications", "courses"],
+    "achievements": ["achievements", "awards", "honors", "honors & awards", "accomplishments"],
+}
+HEADING_LOOKUP = {alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases}
+
+# Sections sent with every prompt; the others only when they mention job terms
+CORE_SECTIONS = ("header", "summary", "skills", "experience")
+
+SKILL_SPLIT_RE = re.compile(r"[,;|•·●▪\n]|\s+-\s+|\t")
+SKILL_LABEL_RE = re.compile(r"^[^:]{1,30}:\s*")
+HEADING_STRIP = " \t:-_*#=•"
+
+
+def normalize_skill(skill):
+    return " ".join(skill.lower().split()).strip(".")
+
+
+def _heading(line):
+    candidate = line.strip(HEADING_STRIP).lower()
+    if len(candidate.split()) > 4:
+        return None
+    return HEADING_LOOKUP.get(candidate)
+
+
+def split_sections(text):
+    """Split resume text into named sections; text before the first heading is the header"""
+    sections = {}
+    current = "header"
+    lines = []
+    for line in text.splitlines():
+        section = _heading(line)
+        if section:
+            if lines:
+                sections[current] = (sections.get(current, "") + "\n" + "\n".join(lines)).strip()
+            current, lines = section, []
+        elif line.strip():
+            lines.append(line.strip())
+    if lines:
+        sections[current] = (sections.get(current, "") + "\n" + "\n".join(lines)).strip()
+    return sections
+
+
+def parse_skill_list(text):
+    """Normalized skills listed in a skills section ("Languages: Python, SQL" style lines)"""
+    skills = set()
+    for line in text.splitlines():
+        for item in SKILL_SPLIT_RE.split(line):
+            # "Languages: Python; Tools: Docker" carries a label after every separator
+            item = normalize_skill(SKILL_LABEL_RE.sub("", item.strip()).strip(HEADING_STRIP))
+            if item and len(item.split()) <= 4:
+                skills.add(item)
+    return skills
+
+
+class Resume:
+    """Resume text split into sections, with a normalized skill set computed once"""
+
+    def __init__(self, text):
+        self.text = text
+        self.sections = split_sections(text)
+        self.skills = frozenset(parse_skill_list(self.sections.get("skills", "")))
+        self._section_terms = {name: key_terms(body) for name, body in self.sections.items()}
+
+    def relevant_text(self, job_description):
+        """Resume sections worth sending for this job, in their original order"""
+        if len(self.sections) <= 1:
+            return self.text
+
+        job_terms = key_terms(job_description)
+        parts = []
+        for name, body in self.sections.items():
+            if name in CORE_SECTIONS or self._section_terms[name] & job_terms:
+                parts.append(body if name == "header" else f"{name.title()}:\n{body}")
+        return "\n\n".join(parts)
+
+    def matching_skills(self, skills):
+        """Resume skills that also appear in the given skill list"""
+        return self.skills & {normalize_skill(skill) for skill in skills}
+
+
+@lru_cache(maxsize=128)
+def build_resume(text):
+    """Structured Resume for text, built once per distinct resume"""
+    return Resume(text)
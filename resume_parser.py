@@ -0,0 +1,228 @@
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import pdfplumber
+from docx import Document
+
+from cache import SQLiteCache
+
+PDF_MIME = "application/pdf"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Pages beyond this limit are ignored; resumes rarely run past a few pages
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "100"))
+# "auto" reads documents below PDF_FAST_MIN_PAGES pages with layout-aware
+# pdfplumber, about 50-200 ms a page, and longer ones with a plain text backend
+# (pdfium, or pdfminer when pypdfium2 is missing) that reads 30 pages in well
+# under a second. Resumes fall below the default; pdfium's text of them matches
+# pdfplumber's line for line, so one growing past it keeps its shape.
+PDF_BACKEND = os.getenv("PDF_BACKEND", "auto")
+PDF_FAST_MIN_PAGES = int(os.getenv("PDF_FAST_MIN_PAGES", "8"))
+# pdfplumber joins characters closer than this many points into one word. Its
+# default of 3 merges whole lines of pdfTeX output, which positions words
+# instead of emitting spaces.
+PDF_X_TOLERANCE = float(os.getenv("PDF_X_TOLERANCE", "1.5"))
+
+# Parsed resumes are cached by content hash in memory; the disk tier is opt-in
+# because it keeps resume text after the session ends
+RESUME_CACHE_SIZE = int(os.getenv("RESUME_CACHE_SIZE", "128"))
+RESUME_DISK_CACHE = os.getenv("RESUME_DISK_CACHE", "0") == "1"
+RESUME_DISK_CACHE_TTL = int(os.getenv("RESUME_DISK_CACHE_TTL", str(24 * 60 * 60)))
+RESUME_DISK_CACHE_MAX_ENTRIES = int(os.getenv("RESUME_DISK_CACHE_MAX_ENTRIES", "1000"))
+
+
+def _read_bytes(file):
+    """Raw bytes of an uploaded file, a file object or a bytes value"""
+    if isinstance(file, (bytes, bytearray)):
+        return bytes(file)
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    data = file.read()
+    if hasattr(file, "seek"):
+        file.seek(0)
+    return data
+
+
+def _release_page(page):
+    """Drop the layout objects pdfplumber caches on a page until the document closes"""
+    if hasattr(page, "close"):
+        page.close()
+        return
+    # pdfplumber < 0.11 has no Page.close; clear the same caches by hand
+    page.flush_cache()
+    textmap = getattr(page, "get_textmap", None)
+    if hasattr(textmap, "cache_clear"):
+        textmap.cache_clear()
+
+
+def _page_texts(pages):
+    texts = []
+    for page in pages:
+        # Image-only pages have no text layer and return None
+        texts.append(page.extract_text(x_tolerance=PDF_X_TOLERANCE) or "")
+        # Released right away so memory stays flat as the page count grows
+        _release_page(page)
+    return texts
+
+
+def _pdfplumber_pages(data, page_count):
+    """Layout-aware extraction, the most faithful and the slowest"""
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        return _page_texts(pdf.pages[:page_count])
+
+
+def _pdfminer_pages(data, page_count):
+    """Plain pdfminer text, skipping the character objects pdfplumber builds"""
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+
+    pages = []
+    for layout in extract_pages(io.BytesIO(data), maxpages=page_count):
+        text = "".join(element.get_text() for element in layout if isinstance(element, LTTextContainer))
+        pages.append(text)
+    return pages
+
+
+def _pdfium_pages(data, page_count):
+    """Text straight from PDFium's text layer, the fastest path available"""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(data)
+    try:
+        pages = []
+        for index in range(page_count):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return pages
+    finally:
+        pdf.close()
+
+
+def _normalize_page(text):
+    # Backends differ in line endings and trailing whitespace only
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+PDF_BACKENDS = {
+    "pdfplumber": _pdfplumber_pages,
+    "pdfminer": _pdfminer_pages,
+    "pdfium": _pdfium_pages,
+}
+
+
+def _fast_backend():
+    try:
+        import pypdfium2  # noqa: F401
+        return "pdfium"
+    except ImportError:
+        return "pdfminer"
+
+
+def pdf_page_count(data):
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdfparser import PDFParser
+
+    document = PDFDocument(PDFParser(io.BytesIO(data)))
+    return sum(1 for _ in PDFPage.create_pages(document))
+
+
+def choose_pdf_backend(page_count):
+    """PDF_BACKEND, or for "auto" pdfplumber below PDF_FAST_MIN_PAGES pages and a fast text path otherwise"""
+    if PDF_BACKEND != "auto":
+        return PDF_BACKEND
+    return "pdfplumber" if page_count < PDF_FAST_MIN_PAGES else _fast_backend()
+
+
+def extract_text_from_pdf(file, max_pages=None, backend=None):
+    """Text of a PDF, one page per line block, reading at most max_pages pages"""
+    data = _read_bytes(file)
+    max_pages = max_pages or PDF_MAX_PAGES
+    page_count = min(pdf_page_count(data), max_pages)
+    backend = backend or choose_pdf_backend(page_count)
+    if backend not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend: {backend}. Choose from {', '.join(PDF_BACKENDS)}")
+
+    pages = PDF_BACKENDS[backend](data, page_count)
+    return "".join(f"{_normalize_page(text)}\n" for text in pages)
+
+
+def extract_text_from_docx(file):
+    doc = Document(io.BytesIO(_read_bytes(file)))
+    full_text = []
+    for para in doc.paragraphs:
+        full_text.append(para.text)
+    return "\n".join(full_text)
+
+
+EXTRACTORS = {
+    PDF_MIME: extract_text_from_pdf,
+    DOCX_MIME: extract_text_from_docx,
+}
+
+
+class ResumeCache:
+    """LRU cache of parsed resume text keyed by SHA-256 of the file, shared by all sessions"""
+
+    def __init__(self, max_entries=RESUME_CACHE_SIZE, disk=RESUME_DISK_CACHE):
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+        if disk:
+            self._disk = SQLiteCache("resumes", ttl=RESUME_DISK_CACHE_TTL, max_entries=RESUME_DISK_CACHE_MAX_ENTRIES)
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return self._entries[key]
+
+        entry = self._disk.get(key) if self._disk is not None else None
+        if entry is None:
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+
+        with self._lock:
+            self.stats["hits"] += 1
+        self._remember(key, entry["value"])
+        return entry["value"]
+
+    def set(self, key, text):
+        self._remember(key, text)
+        if self._disk is not None:
+            self._disk.set(key, text)
+
+    def _remember(self, key, text):
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+resume_cache = ResumeCache()
+
+
+def parse_resume(file, file_type):
+    """Text of a PDF or DOCX resume, parsed once per distinct file content"""
+    if file_type not in EXTRACTORS:
+        raise ValueError(f"Unsupported resume format: {file_type}")
+
+    data = _read_bytes(file)
+    key = f"{file_type}:{hashlib.sha256(data).hexdigest()}"
+    text = resume_cache.get(key)
+    if text is None:
+        text = EXTRACTORS[file_type](data)
+        resume_cache.set(key, text)
+    return text
@@ -0,0 +1,410 @@
+import asyncio
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import get_encoding_from_headers
+from dotenv import load_dotenv
+
+from cache import SQLiteCache
+from html_text import extract_main_content, html_to_text, reduction_ratio
+
+load_dotenv()
+
+# Network settings, overridable through environment variables
+CONNECT_TIMEOUT = float(os.getenv("SCRAPE_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("SCRAPE_READ_TIMEOUT", "15"))
+MAX_BODY_BYTES = int(os.getenv("SCRAPE_MAX_BYTES", str(5 * 1024 * 1024)))
+POOL_CONNECTIONS = int(os.getenv("SCRAPE_POOL_CONNECTIONS", "16"))
+POOL_MAXSIZE = int(os.getenv("SCRAPE_POOL_MAXSIZE", "16"))
+USER_AGENT = os.getenv("USER_AGENT", "Mozilla/5.0 (compatible; ColdMailGenerator/1.0)")
+
+# Scraped job descriptions are served from the cache for this many seconds,
+# then revalidated with a conditional GET
+JOB_CACHE_TTL = int(os.getenv("JOB_CACHE_TTL", str(6 * 60 * 60)))
+JOB_CACHE_MAX_ENTRIES = int(os.getenv("JOB_CACHE_MAX_ENTRIES", "5000"))
+
+# Strip navigation, banners and footers before the text reaches the prompt
+MAIN_CONTENT_ONLY = os.getenv("MAIN_CONTENT_ONLY", "1") != "0"
+
+# Batch scraping limits
+BATCH_MAX_WORKERS = int(os.getenv("SCRAPE_MAX_WORKERS", "16"))
+BATCH_PER_HOST = int(os.getenv("SCRAPE_PER_HOST", "4"))
+
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "trk", "trackingid", "refid"}
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _accept_encoding():
+    """Advertise brotli only when urllib3 is able to decode it"""
+    encodings = ["gzip", "deflate"]
+    try:
+        import brotli  # noqa: F401
+        encodings.append("br")
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append("br")
+        except ImportError:
+            pass
+    return ", ".join(encodings)
+
+
+class FetchResult:
+    """Body and metadata of a fetched page"""
+
+    def __init__(self, url, status_code, headers, content, encoding):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide HTTP session, creating it on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({
+                    "User-Agent": USER_AGENT,
+                    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+                    "Accept-Encoding": _accept_encoding(),
+                })
+                _session = session
+    return _session
+
+
+def fetch(url, headers=None, timeout=None, max_bytes=None):
+    """Fetch a URL over the pooled session, refusing bodies larger than max_bytes"""
+    timeout = timeout or (CONNECT_TIMEOUT, READ_TIMEOUT)
+    max_bytes = max_bytes or MAX_BODY_BYTES
+
+    with get_session().get(url, headers=headers, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+
+        declared = response.headers.get("Content-Length")
+        if declared and declared.isdigit() and int(declared) > max_bytes:
+            raise ValueError(f"Response too large ({declared} bytes, limit {max_bytes})")
+
+        chunks = []
+        received = 0
+        for chunk in response.iter_content(CHUNK_SIZE):
+            received += len(chunk)
+            if received > max_bytes:
+                raise ValueError(f"Response exceeded {max_bytes} bytes")
+            chunks.append(chunk)
+
+        return FetchResult(
+            url=response.url,
+            status_code=response.status_code,
+            headers=response.headers,
+            content=b"".join(chunks),
+            encoding=response.encoding,
+        )
+
+
+# Pooled async client of each event loop, with the async generator that closes it
+_async_clients = {}
+
+
+async def _close_with_loop(loop, client):
+    """Waits at its yield until the loop shuts down its async generators, then closes client.
+
+    asyncio.run does that shutdown while the loop still runs, so the client's
+    connections are closed on the loop that opened them.
+    """
+    try:
+        yield
+    finally:
+        _async_clients.pop(loop, None)
+        await client.aclose()
+
+
+async def get_async_client():
+    """Return the pooled async HTTP client of the running event loop, closed when the loop shuts down"""
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(loop)
+    if entry is None:
+        # Loops closed without shutting down their async generators leave their entry behind
+        for closed in [other for other in _async_clients if other.is_closed()]:
+            del _async_clients[closed]
+        client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=POOL_CONNECTIONS * POOL_MAXSIZE, max_keepalive_connections=POOL_MAXSIZE),
+            headers={
+                "User-Agent": USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+                "Accept-Encoding": _accept_encoding(),
+            },
+        )
+        # The loop holds its async generators weakly, so the entry keeps the closer alive
+        entry = _async_clients[loop] = (client, _close_with_loop(loop, client))
+        await entry[1].asend(None)
+    return entry[0]
+
+
+async def afetch(url, headers=None, timeout=None, max_bytes=None):
+    """Async counterpart of fetch, sharing its timeouts and body size limit"""
+    if isinstance(timeout, tuple):
+        timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+    max_bytes = max_bytes or MAX_BODY_BYTES
+    kwargs = {"headers": headers}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+
+    client = await get_async_client()
+    async with client.stream("GET", url, **kwargs) as response:
+        # httpx also raises for 3xx, but 304 answers a conditional request
+        if response.is_error:
+            response.raise_for_status()
+
+        declared = response.headers.get("Content-Length")
+        if declared and declared.isdigit() and int(declared) > max_bytes:
+            raise ValueError(f"Response too large ({declared} bytes, limit {max_bytes})")
+
+        chunks = []
+        received = 0
+        async for chunk in response.aiter_bytes(CHUNK_SIZE):
+            received += len(chunk)
+            if received > max_bytes:
+                raise ValueError(f"Response exceeded {max_bytes} bytes")
+            chunks.append(chunk)
+
+        return FetchResult(
+            url=str(response.url),
+            status_code=response.status_code,
+            headers=response.headers,
+            content=b"".join(chunks),
+            encoding=get_encoding_from_headers(response.headers),
+        )
+
+
+def normalize_url(url):
+    """Canonical form of a URL used as cache key (lowercase host, no fragment or tracking params)"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme == "http" and netloc.endswith(":80")) or (scheme == "https" and netloc.endswith(":443")):
+        netloc = netloc.rsplit(":", 1)[0]
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(query), ""))
+
+
+_job_cache = None
+
+
+def get_job_cache():
+    global _job_cache
+    if _job_cache is None:
+        with _session_lock:
+            if _job_cache is None:
+                _job_cache = SQLiteCache("job_descriptions", ttl=JOB_CACHE_TTL, max_entries=JOB_CACHE_MAX_ENTRIES)
+    return _job_cache
+
+
+def page_text(html):
+    """Posting text of a page with boilerplate removed, plus size statistics"""
+    raw = html_to_text(html)
+    text = extract_main_content(raw) if MAIN_CONTENT_ONLY else raw
+    return text, {"raw_chars": len(raw), "chars": len(text), "reduction": reduction_ratio(raw, text)}
+
+
+def scrape_job_description(url, use_cache=True, timeout=None, with_stats=False):
+    """Cleaned text of a job posting, served from the cache while fresh and revalidated after.
+
+    With ``with_stats`` a (text, stats) tuple is returned, where stats reports how
+    much boilerplate was removed and whether the text came from the cache. When
+    the site cannot be reached to revalidate an expired entry, the stale text is
+    returned and marked ``stale``.
+    """
+    text, stats = _scrape(url, use_cache, timeout)
+    return (text, stats) if with_stats else text
+
+
+def _revalidation_headers(entry):
+    headers = {}
+    if entry:
+        if entry["meta"].get("etag"):
+            headers["If-None-Match"] = entry["meta"]["etag"]
+        if entry["meta"].get("last_modified"):
+            headers["If-Modified-Since"] = entry["meta"]["last_modified"]
+    return headers
+
+
+def _from_entry(entry, stale=False):
+    return entry["value"], dict(entry["meta"].get("stats", {}), cached=True, stale=stale)
+
+
+def _site_unavailable(error):
+    """Whether a failed fetch means the site is unreachable rather than the posting gone"""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout, httpx.TransportError)):
+        return True
+    response = getattr(error, "response", None)
+    return response is not None and response.status_code >= 500
+
+
+def _store(key, text, stats, response):
+    get_job_cache().set(key, text, meta={
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "stats": stats,
+    })
+
+
+def _scrape(url, use_cache, timeout):
+    if not use_cache:
+        text, stats = page_text(fetch(url, timeout=timeout).text)
+        return text, dict(stats, cached=False)
+
+    cache = get_job_cache()
+    key = normalize_url(url)
+    entry = cache.get(key, allow_stale=True)
+    if entry and entry["fresh"]:
+        return _from_entry(entry)
+
+    try:
+        response = fetch(url, headers=_revalidation_headers(entry), timeout=timeout)
+    except requests.RequestException as error:
+        if entry and _site_unavailable(error):
+            return _from_entry(entry, stale=True)
+        raise
+    if response.status_code == 304 and entry:
+        cache.touch(key)
+        return _from_entry(entry)
+
+    text, stats = page_text(response.text)
+    _store(key, text, stats, response)
+    return text, dict(stats, cached=False)
+
+
+async def ascrape_job_description(url, use_cache=True, timeout=None, with_stats=False):
+    """Async counterpart of scrape_job_description"""
+    text, stats = await _ascrape(url, use_cache, timeout)
+    return (text, stats) if with_stats else text
+
+
+async def _ascrape(url, use_cache, timeout):
+    # HTML parsing is CPU-bound, so it runs off the event loop
+    if not use_cache:
+        response = await afetch(url, timeout=timeout)
+        text, stats = await asyncio.to_thread(page_text, response.text)
+        return text, dict(stats, cached=False)
+
+    cache = get_job_cache()
+    key = normalize_url(url)
+    entry = cache.get(key, allow_stale=True)
+    if entry and entry["fresh"]:
+        return _from_entry(entry)
+
+    try:
+        response = await afetch(url, headers=_revalidation_headers(entry), timeout=timeout)
+    except httpx.HTTPError as error:
+        if entry and _site_unavailable(error):
+            return _from_entry(entry, stale=True)
+        raise
+    if response.status_code == 304 and entry:
+        cache.touch(key)
+        return _from_entry(entry)
+
+    text, stats = await asyncio.to_thread(page_text, response.text)
+    _store(key, text, stats, response)
+    return text, dict(stats, cached=False)
+
+
+def map_per_host(func, items, host_of, max_workers, per_host):
+    """Run func over items in a thread pool, yielding (item, result, error) as each finishes.
+
+    At most ``max_workers`` calls run at once and at most ``per_host`` of them
+    for items with the same ``host_of(item)``. Items wait in per-host queues and
+    reach the pool only when their host has a free slot, so pool threads never
+    sit blocked behind a busy host while other hosts have work.
+    """
+    items = list(items)
+    if not items:
+        return
+
+    queues = {}
+    for item in items:
+        queues.setdefault(host_of(item), deque()).append(item)
+    results = queue.Queue()
+    # Reentrant: a future that is already done runs its callback inside submit
+    lock = threading.RLock()
+    closed = False
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(items)))
+
+    def submit(item):
+        future = executor.submit(func, item)
+        future.add_done_callback(lambda done: finished(item, done))
+
+    def finished(item, future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        results.put((item, None if error else future.result(), error))
+        # The freed slot goes to the next item of the same host
+        with lock:
+            pending = queues[host_of(item)]
+            if closed or not pending:
+                return
+            try:
+                submit(pending.popleft())
+            except RuntimeError:
+                pass  # executor shut down by the consumer
+
+    with lock:
+        # Round-robin across hosts, so the first threads spread over all of them
+        for _ in range(per_host):
+            for pending in queues.values():
+                if pending:
+                    submit(pending.popleft())
+    try:
+        for _ in range(len(items)):
+            yield results.get()
+    finally:
+        with lock:
+            closed = True
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def scrape_many(urls, max_workers=None, per_host=None, timeout=None, use_cache=True):
+    """Scrape many job postings concurrently, yielding (url, text, error) as each one finishes.
+
+    At most ``max_workers`` requests run at once and at most ``per_host`` of them
+    against the same host. Failures are yielded with text None instead of raised.
+    """
+    urls = list(dict.fromkeys(urls))
+    max_workers = max_workers or BATCH_MAX_WORKERS
+    per_host = per_host or BATCH_PER_HOST
+
+    def scrape(url):
+        return scrape_job_description(url, use_cache=use_cache, timeout=timeout)
+
+    def host_of(url):
+        return urlsplit(url).netloc.lower()
+
+    yield from map_per_host(scrape, urls, host_of, max_workers, per_host)
@@ -0,0 +1,197 @@
+import re
+from collections import deque
+from functools import lru_cache
+
+# Common skills recognized in every job description, on top of the domain
+# keywords, domain insight skills and portfolio tags
+BASE_SKILLS = [
+    # Languages
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Go", "Golang", "Rust", "Ruby", "PHP",
+    "Kotlin", "Swift", "Scala", "R", "MATLAB", "Perl", "Bash", "Shell Scripting", "SQL", "NoSQL",
+    "HTML", "CSS", "Sass", "GraphQL", "Solidity",
+    # Frameworks and libraries
+    "React", "React Native", "Angular", "Vue.js", "Next.js", "Node.js", "Express", "Django", "Flask",
+    "FastAPI", "Spring", "Spring Boot", ".NET", "ASP.NET", "Ruby on Rails", "Laravel", "jQuery",
+    "Redux", "Tailwind CSS", "Bootstrap", "Flutter", "Pandas", "NumPy", "SciPy", "scikit-learn",
+    "TensorFlow", "PyTorch", "Keras", "Hugging Face", "LangChain", "OpenCV", "Spark", "PySpark",
+    "Hadoop", "Airflow", "dbt", "Kafka",
+    # Data and AI
+    "Machine Learning", "Deep Learning", "NLP", "Natural Language Processing", "Computer Vision",
+    "Generative AI", "LLM", "Large Language Models", "AI", "Data Analysis", "Data Engineering",
+    "Data Visualization", "Data Modeling", "Data Mining", "Statistics", "A/B Testing", "ETL",
+    "Feature Engineering", "MLOps", "Time Series", "Predictive Modeling", "Tableau", "Power BI",
+    "Looker", "Excel", "Snowflake", "BigQuery", "Redshift", "Databricks",
+    # Databases
+    "PostgreSQL", "MySQL", "SQL Server", "Oracle", "MongoDB", "Redis", "Elasticsearch", "Cassandra",
+    "DynamoDB", "SQLite", "Firebase",
+    # Cloud and infrastructure
+    "AWS", "Azure", "GCP", "Google Cloud", "Docker", "Kubernetes", "Terraform", "Ansible", "Jenkins",
+    "CI/CD", "GitHub Actions", "Git", "Linux", "Microservices", "REST", "REST APIs", "gRPC",
+    "Serverless", "DevOps", "Site Reliability Engineering", "Networking",
+    # Security
+    "Penetration Testing", "SIEM", "Incident Response", "Threat Modeling", "Vulnerability Assessment",
+    "IAM", "Cryptography", "Network Security", "SOC 2", "ISO 27001",
+    # Design and product
+    "Figma", "Sketch", "Adobe XD", "Photoshop", "Illustrator", "Wireframing", "Prototyping",
+    "User Research", "Usability Testing", "Design Systems", "Product Strategy", "Roadmapping",
+    "Agile", "Scrum", "Kanban", "Jira", "Stakeholder Management",
+    # Business, finance and marketing
+    "Financial Modeling", "Valuation", "Accounting", "Budgeting", "Forecasting", "Risk Management",
+    "Bloomberg Terminal", "Salesforce", "HubSpot", "CRM", "SEO", "SEM", "PPC", "Google Analytics",
+    "Google Ads", "Content Marketing", "Email Marketing", "Social Media", "Copywriting",
+    "Lead Generation", "Negotiation", "Business Development", "Project Management",
+    # Healthcare
+    "Clinical Research", "GCP Compliance", "HIPAA", "EHR", "Regulatory Affairs", "Biostatistics",
+]
+
+# Skills that are also everyday words ("we will go", "the rest of", "excel at")
+# match only in this exact casing. At the start of a sentence, where prose
+# capitalizes them too, they count only alone on a line or ahead of a list
+# separator ("Go, Python and SQL").
+CASE_SENSITIVE_SKILLS = {
+    "Go", "REST", "Express", "Excel", "Spring", "Swift", "Sketch", "Bootstrap",
+}
+
+SENTENCE_END = ".!?"
+LIST_SEPARATORS = ",;/|)"
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize(text):
+    """Lowercase with whitespace runs collapsed, so skills match however the page wraps them"""
+    return " ".join(text.lower().split())
+
+
+def _collapse(text):
+    """Text with whitespace runs collapsed to one space, or to a newline if they contain one"""
+    return WHITESPACE_RE.sub(lambda match: "\n" if "\n" in match.group() else " ", text.strip())
+
+
+class SkillExtractor:
+    """Aho-Corasick automaton over a skill dictionary, built once.
+
+    ``extract`` finds every dictionary skill in a text in one pass over its
+    characters, however many skills there are. Matching ignores case and
+    whitespace differences, and a skill only counts when it is not part of a
+    longer word ("Java" does not match inside "JavaScript"). Skills in
+    ``case_sensitive`` must also match in their exact casing, see
+    CASE_SENSITIVE_SKILLS.
+    """
+
+    def __init__(self, skills, case_sensitive=CASE_SENSITIVE_SKILLS):
+        self.names = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        # skill id -> exact casing required in the text
+        self._cased = {}
+        seen = {}
+        for skill in skills:
+            key = normalize(skill)
+            # Single letters ("R", "C") match too much prose to be useful
+            if len(key) < 2 or key in seen:
+                continue
+            seen[key] = len(self.names)
+            self.names.append(skill.strip())
+            self._add(key, seen[key])
+        for skill in case_sensitive:
+            if normalize(skill) in seen:
+                self._cased[seen[normalize(skill)]] = " ".join(skill.split())
+        self._link()
+
+    def _add(self, key, skill_id):
+        state = 0
+        for char in key:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = ((len(key), skill_id),)
+
+    def _link(self):
+        # Breadth-first, so each state's failure target is complete before its children
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def _cased_match(self, cased, start, after, skill_id):
+        """Whether a case-sensitive skill found at cased[start:after] is meant as the skill"""
+        name = self._cased[skill_id]
+        if cased[start:after] != name:
+            return False
+        if name.isupper():
+            return True
+        sentence_start = (start == 0 or cased[start - 1] == "\n"
+                          or (start > 1 and cased[start - 2] in SENTENCE_END))
+        if not sentence_start:
+            return True
+        return after == len(cased) or cased[after] == "\n" or cased[after] in LIST_SEPARATORS
+
+    def extract(self, text):
+        """Skills mentioned in text, in order of first mention"""
+        cased = _collapse(text)
+        text = cased.lower()
+        if len(text) != len(cased):
+            # A few characters lowercase to two ("İ"); keep those as they are so positions line up
+            text = "".join(char.lower() if len(char.lower()) == 1 else char for char in cased)
+        text = text.replace("\n", " ")
+        goto, fail, output, cased_ids = self._goto, self._fail, self._output, self._cased
+        found = {}
+        state = 0
+        end = len(text)
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                after = position + 1
+                if after < end and text[after].isalnum():
+                    continue
+                for length, skill_id in output[state]:
+                    start = after - length
+                    if skill_id in found or (start and text[start - 1].isalnum()):
+                        continue
+                    if skill_id in cased_ids and not self._cased_match(cased, start, after, skill_id):
+                        continue
+                    found[skill_id] = start
+        return [self.names[skill_id] for skill_id in sorted(found, key=found.get)]
+
+    def __len__(self):
+        return len(self.names)
+
+
+def default_skills():
+    """Base skills, job search domain keywords and insight skills, and portfolio tags"""
+    from job_catalog import DOMAIN_INSIGHTS, DOMAIN_KEYWORDS
+    from portfolio import get_portfolio
+
+    skills = list(BASE_SKILLS)
+    for insight in DOMAIN_INSIGHTS.values():
+        skills.extend(insight["key_skills"])
+    for keywords in DOMAIN_KEYWORDS.values():
+        skills.extend(keywords)
+    for project in get_portfolio().projects:
+        skills.extend(project["tags"])
+    return skills
+
+
+@lru_cache(maxsize=None)
+def get_skill_extractor():
+    """Extractor over the default skill dictionary, shared process-wide"""
+    return SkillExtractor(default_skills())
+
+
+def extract_skills(text):
+    return get_skill_extractor().extract(text)
@@ -0,0 +1,32 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+for path in (ROOT, TESTS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# Caches go to a throwaway directory; set before any repo module reads CACHE_DIR
+_cache_dir = tempfile.mkdtemp(prefix="cold-mail-tests-")
+os.environ["CACHE_DIR"] = _cache_dir
+
+
+@pytest.fixture
+def search_cache(tmp_path, monkeypatch):
+    """The shared search cache on a database of its own"""
+    import cache
+    from job_catalog import get_search_cache
+
+    monkeypatch.setattr(cache, "CACHE_DB", str(tmp_path / "cache.sqlite3"))
+    get_search_cache.cache_clear()
+    yield get_search_cache()
+    get_search_cache.cache_clear()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_cache_dir, ignore_errors=True)
@@ -0,0 +1,46 @@
+"""LangChain LLM with a fixed reply and injected latency, for offline tests and benchmarks"""
+import asyncio
+import time
+from typing import Any, Iterator, List, Optional
+
+from langchain_core.language_models.llms import LLM
+from langchain_core.outputs import GenerationChunk
+
+
+class FakeEmailLLM(LLM):
+    """Answers every prompt with ``response`` after ``latency`` seconds.
+
+    The async path sleeps without blocking the event loop, so concurrent
+    ``ainvoke`` calls overlap like real network round-trips. Streaming yields
+    the response word by word.
+    """
+
+    response: str = "Dear Hiring Manager,\n\nI am excited to apply.\n\nBest regards"
+    latency: float = 0.0
+    model_name: str = "fake-email-llm"
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-email-llm"
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> str:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self.response
+
+    async def _acall(self, prompt: str, stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> str:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.response
+
+    def _stream(self, prompt: str, stop: Optional[List[str]] = None, run_manager=None,
+                **kwargs: Any) -> Iterator[GenerationChunk]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        words = self.response.split(" ")
+        for index, word in enumerate(words):
+            yield GenerationChunk(text=word if index == len(words) - 1 else word + " ")
@@ -0,0 +1,117 @@
+"""Regenerate the sample resume PDFs: python tests/fixtures/resumes/make_resumes.py
+
+Needs fpdf2 (requirements-dev.txt) and the Lato font shipped with rdoc, or any
+TTF passed as the first argument. The PDFs are committed, so tests do not need
+either.
+"""
+import glob
+import os
+import sys
+
+from fpdf import FPDF
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(os.path.dirname(HERE)))
+
+from pdf_factory import make_pdf  # noqa: E402
+
+EXPERIENCE = [
+    ("Senior Backend Engineer – Northwind Analytics, Berlin", "2021 – present", [
+        "Designed the forecasting API in FastAPI, serving 40 million requests a day at 35 ms p95.",
+        "Moved batch jobs from cron to Airflow and cut failed nightly runs from 12% to under 1%.",
+        "Mentored four engineers; ran the backend interview loop.",
+    ]),
+    ("Software Engineer – Kestrel Pay, Dublin", "2018 – 2021", [
+        "Built the refunds service in Django and PostgreSQL, handling €2M in refunds a month.",
+        "Introduced contract tests between payment services; incidents from API changes fell by half.",
+    ]),
+    ("Junior Developer – Café Müller GmbH, Zürich", "2016 – 2018", [
+        "Maintained the ordering website and its Python reporting scripts.",
+    ]),
+]
+SKILLS = [
+    "Languages: Python, SQL, Go",
+    "Frameworks: Django, FastAPI, Celery",
+    "Infrastructure: AWS, Docker, Kubernetes, Terraform",
+]
+
+
+def find_font():
+    if len(sys.argv) > 1:
+        return sys.argv[1]
+    matches = glob.glob(os.path.expanduser("~/.rbenv/versions/*/lib/ruby/*/rdoc/generator/template/darkfish/fonts/Lato-Regular.ttf"))
+    if not matches:
+        sys.exit("Lato-Regular.ttf not found; pass a TTF path")
+    return matches[0]
+
+
+def new_pdf(font):
+    pdf = FPDF(format="A4")
+    pdf.add_font("Body", "", font)
+    pdf.set_auto_page_break(True, margin=18)
+    pdf.set_margins(18, 18, 18)
+    return pdf
+
+
+def heading(pdf, text, width=0):
+    pdf.set_font("Body", size=12)
+    pdf.cell(width, 8, text.upper(), new_x="LMARGIN", new_y="NEXT")
+    pdf.set_font("Body", size=10)
+
+
+def single_column(font):
+    pdf = new_pdf(font)
+    pdf.add_page()
+    pdf.set_font("Body", size=18)
+    pdf.cell(0, 10, "José Álvarez", new_x="LMARGIN", new_y="NEXT")
+    pdf.set_font("Body", size=10)
+    pdf.cell(0, 6, "Berlin, Germany · jose.alvarez@example.com · +49 30 1234567", new_x="LMARGIN", new_y="NEXT")
+    heading(pdf, "Summary")
+    pdf.multi_cell(0, 5, "Backend engineer with eight years of Python, most of it building APIs and data "
+                         "pipelines for logistics and payments companies.", align="L", new_x="LMARGIN")
+    heading(pdf, "Skills")
+    for line in SKILLS:
+        pdf.cell(0, 5, line, new_x="LMARGIN", new_y="NEXT")
+    heading(pdf, "Experience")
+    for role, dates, bullets in EXPERIENCE:
+        pdf.cell(130, 6, role)
+        pdf.cell(0, 6, dates, align="R", new_x="LMARGIN", new_y="NEXT")
+        for bullet in bullets:
+            pdf.multi_cell(0, 5, f"• {bullet}", align="L", new_x="LMARGIN")
+    heading(pdf, "Education")
+    pdf.cell(0, 5, "B.Sc. Computer Science – Universidad de Sevilla, 2016", new_x="LMARGIN", new_y="NEXT")
+    return pdf
+
+
+def multi_page(font, pages):
+    pdf = single_column(font)
+    for number in range(2, pages + 1):
+        pdf.add_page()
+        heading(pdf, f"Selected projects ({number - 1})")
+        for role, dates, bullets in EXPERIENCE:
+            pdf.cell(0, 6, f"{role}, {dates}", new_x="LMARGIN", new_y="NEXT")
+            for bullet in bullets * 3:
+                pdf.multi_cell(0, 5, f"• {bullet}", align="L", new_x="LMARGIN")
+    return pdf
+
+
+def latex_style():
+    lines = ["Alan Turing", "alan@example.com | Manchester, UK", "", "Skills",
+             *SKILLS, "", "Experience"]
+    for role, dates, bullets in EXPERIENCE:
+        lines.append(f"{role} ({dates})".replace("–", "-").replace("€", "EUR "))
+        lines.extend(f"- {bullet}".replace("€", "EUR ") for bullet in bullets)
+    lines = [line.replace("ü", "ue") for line in lines]
+    return make_pdf([lines[:14], lines[14:]], word_gap=270)
+
+
+def main():
+    font = find_font()
+    single_column(font).output(os.path.join(HERE, "single_column.pdf"))
+    multi_page(font, 4).output(os.path.join(HERE, "four_pages.pdf"))
+    with open(os.path.join(HERE, "latex_style.pdf"), "wb") as f:
+        f.write(latex_style())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Minimal PDF writer for synthetic resumes in tests and benchmarks, with no extra dependency"""
+import random
+
+WORDS = (
+    "designed built shipped maintained python django postgresql kubernetes services api team "
+    "customers latency reliability pipelines data analytics reporting migration cloud aws docker "
+    "mentored engineers improved reduced costs throughput monitoring release automation testing"
+).split()
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _content(lines, word_gap):
+    ops = ["BT", "/F1 10 Tf", "13 TL", "50 790 Td"]
+    for line in lines:
+        if word_gap:
+            # TeX style: no space glyphs, each word placed word_gap/1000 em after the last
+            words = f" -{word_gap} ".join(f"({_escape(word)})" for word in line.split(" "))
+            ops.append(f"[{words}] TJ T*")
+        else:
+            ops.append(f"({_escape(line)}) Tj T*")
+    ops.append("ET")
+    return "\n".join(ops).encode("latin-1")
+
+
+def make_pdf(pages, word_gap=None):
+    """PDF bytes with one page per list of text lines; an empty list gives a page without text.
+
+    With ``word_gap`` words are positioned apart instead of separated by spaces,
+    as pdfTeX does.
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    kids = []
+    for lines in pages:
+        stream = _content(lines, word_gap)
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects))
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def resume_pages(page_count, lines_per_page=55, blank_every=0, seed=0):
+    """Text lines for a synthetic resume; every blank_every-th page has no text"""
+    rng = random.Random(seed)
+    pages = []
+    for number in range(1, page_count + 1):
+        if blank_every and number % blank_every == 0:
+            pages.append([])
+            continue
+        lines = [f"Experience - page {number}"]
+        lines += [" ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 12))).capitalize()
+                  for _ in range(lines_per_page - 1)]
+        pages.append(lines)
+    return pages
@@ -0,0 +1,150 @@
+"""Local HTTP server standing in for job boards in tests and benchmarks"""
+import os
+import socket
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog of 5 drops bursts of concurrent connects into SYN retries
+    request_queue_size = 256
+    daemon_threads = True
+
+
+class StubServer:
+    """Serves fixed responses on 127.0.0.1 with optional injected latency.
+
+    ``routes`` maps a path (without query string) to a body (str or bytes) or to
+    a dict with ``body``, ``status`` and ``headers``. A route with an ``ETag``
+    header answers matching conditional requests with 304. ``directory`` serves
+    files below it for paths not in ``routes``. ``latency`` is slept on every
+    request and ``handshake_latency`` once per new connection, standing in for
+    DNS, TCP and TLS setup. Connections are kept alive (HTTP/1.1).
+    """
+
+    def __init__(self, routes=None, directory=None, latency=0.0, handshake_latency=0.0):
+        self.routes = dict(routes or {})
+        self.directory = directory
+        self.latency = latency
+        self.handshake_latency = handshake_latency
+        self.hits = Counter()
+        self.connections = 0
+        self.not_modified = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._sockets = set()
+        self._server = _Server(("127.0.0.1", 0), self._handler())
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def url(self, path="/"):
+        return self.base_url + path
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and drop kept-alive connections, as a server going down would"""
+        self._server.shutdown()
+        self._server.server_close()
+        with self._lock:
+            sockets, self._sockets = self._sockets, set()
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _route(self, path):
+        if path in self.routes:
+            route = self.routes[path]
+            return route if isinstance(route, dict) else {"body": route}
+        if self.directory:
+            file_path = os.path.normpath(os.path.join(self.directory, path.lstrip("/")))
+            if file_path.startswith(os.path.abspath(self.directory)) and os.path.isfile(file_path):
+                with open(file_path, "rb") as f:
+                    return {"body": f.read()}
+        return None
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Send headers and body in one segment; separate small writes on a
+            # kept-alive connection stall on Nagle plus delayed ACK
+            wbufsize = -1
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+                    stub._sockets.add(self.connection)
+                if stub.handshake_latency:
+                    time.sleep(stub.handshake_latency)
+
+            def finish(self):
+                super().finish()
+                with stub._lock:
+                    stub._sockets.discard(self.connection)
+
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                with stub._lock:
+                    stub.hits[path] += 1
+                    stub.active += 1
+                    stub.max_active = max(stub.max_active, stub.active)
+                try:
+                    if stub.latency:
+                        time.sleep(stub.latency)
+                    self._respond(stub._route(path))
+                finally:
+                    with stub._lock:
+                        stub.active -= 1
+
+            def _respond(self, route):
+                if route is None:
+                    self._send(404, {}, b"not found")
+                    return
+                headers = dict(route.get("headers", {}))
+                etag = headers.get("ETag")
+                if etag and self.headers.get("If-None-Match") == etag:
+                    with stub._lock:
+                        stub.not_modified += 1
+                    self._send(304, {"ETag": etag}, b"")
+                    return
+                body = route.get("body", b"")
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+                headers.setdefault("Content-Type", "text/html; charset=utf-8")
+                self._send(route.get("status", 200), headers, body)
+
+            def _send(self, status, headers, body):
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
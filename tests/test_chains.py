@@ -0,0 +1,98 @@
+import asyncio
+
+from chains import Chain
+from fake_llm import FakeEmailLLM
+from stub_server import StubServer
+
+JOB_DESCRIPTION = "Backend Engineer\nWe need Python, Django and PostgreSQL experience."
+
+
+def make_chain(llm, **kwargs):
+    return Chain(name="Ada", tone="Formal", resume_text="Python developer, 5 years", llm=llm, **kwargs)
+
+
+def test_write_mail_uses_fake_llm_without_api_key():
+    llm = FakeEmailLLM(response="Dear team, hello.")
+    chain = make_chain(llm, use_cache=False)
+    assert chain.write_mail(JOB_DESCRIPTION) == "Dear team, hello."
+    assert llm.calls == 1
+    assert chain.last_token_report["prompt_tokens"] > 0
+
+
+def test_repeat_generation_served_from_response_cache():
+    llm = FakeEmailLLM(response="Cached email body")
+    chain = make_chain(llm)
+    description = JOB_DESCRIPTION + "\nCache test posting."
+    assert chain.write_mail(description) == "Cached email body"
+    assert chain.write_mail(description) == "Cached email body"
+    assert llm.calls == 1
+    assert chain.last_from_cache
+
+
+def test_stream_mail_yields_chunks_and_caches_full_email():
+    llm = FakeEmailLLM(response="one two three four")
+    chain = make_chain(llm)
+    description = JOB_DESCRIPTION + "\nStreaming test posting."
+    chunks = list(chain.stream_mail(description))
+    assert len(chunks) == 4
+    assert "".join(chunks) == "one two three four"
+    assert list(chain.stream_mail(description)) == ["one two three four"]
+    assert llm.calls == 1
+
+
+def test_awrite_mail_overlaps_concurrent_generations():
+    llm = FakeEmailLLM(response="async email", latency=0.2)
+    chain = make_chain(llm, use_cache=False)
+
+    async def generate_all():
+        return await asyncio.gather(*(chain.awrite_mail(f"{JOB_DESCRIPTION}\n{i}") for i in range(5)))
+
+    loop = asyncio.new_event_loop()
+    try:
+        start = loop.time()
+        emails = loop.run_until_complete(generate_all())
+        elapsed = loop.time() - start
+    finally:
+        loop.close()
+    assert emails == ["async email"] * 5
+    assert elapsed < 0.6
+
+
+def test_awrite_mail_reports_per_call_and_leaves_chain_alone():
+    llm = FakeEmailLLM(response="async email", latency=0.05)
+    chain = make_chain(llm, token_budget=200)
+    short = JOB_DESCRIPTION + "\nReport test posting."
+    long = short + "\n" + "Maintain Django services and PostgreSQL schemas for billing. " * 200
+
+    async def generate():
+        first = await asyncio.gather(chain.awrite_mail(short, with_report=True),
+                                     chain.awrite_mail(long, with_report=True))
+        return first, await chain.awrite_mail(short, with_report=True)
+
+    (short_result, long_result), repeat = asyncio.run(generate())
+    assert short_result[0] == long_result[0] == "async email"
+    assert not short_result[1]["trimmed"] and long_result[1]["trimmed"]
+    assert short_result[1]["prompt_tokens"] < long_result[1]["prompt_tokens"]
+    assert not short_result[1]["from_cache"] and repeat[1]["from_cache"]
+    assert repeat[1]["prompt_tokens"] == short_result[1]["prompt_tokens"]
+    assert (chain.last_token_report, chain.last_from_cache) == ({}, False)
+
+
+def test_chains_share_one_client_and_runnable(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "gsk_test_key")
+    first, second = Chain(name="Ada"), Chain(name="Grace", tone="Casual")
+    assert first.llm is second.llm
+    assert first.chain_email is second.chain_email
+    assert (first.name, second.name) == ("Ada", "Grace")
+
+
+def test_scrape_job_description_through_chain():
+    page = ("<html><body><h1>Senior Engineer</h1><p>We will go the extra mile for our customers. "
+            "You build services in Go and Python on AWS, with PostgreSQL and REST APIs.</p></body></html>")
+    chain = make_chain(FakeEmailLLM())
+    with StubServer({"/job": page}) as server:
+        text = chain.scrape_job_description(server.url("/job"))
+    assert "Senior Engineer" in text
+    assert chain.last_scrape_stats
+    assert chain.job_skills(text) == ["Go", "Python", "AWS", "PostgreSQL", "REST", "REST APIs"]
+    assert chain.last_skills == chain.job_skills(text)
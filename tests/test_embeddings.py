@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+
+import embeddings
+from embeddings import EmbeddingCache
+
+DIM = 4
+
+
+class FakeModel:
+    """Deterministic embedding per text, recording every batch it is called with"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        return [vector(text) for text in texts]
+
+
+def vector(text):
+    return np.array([len(text), ord(text[0]), ord(text[-1]), sum(map(ord, text)) % 97], dtype=np.float32)
+
+
+def make_cache(tmp_path, capacity=3, **kwargs):
+    model = FakeModel()
+    return EmbeddingCache(model, dim=DIM, capacity=capacity, path=str(tmp_path), **kwargs), model
+
+
+def embedded(model):
+    return [text for batch in model.batches for text in batch]
+
+
+def test_misses_are_embedded_in_batches_and_hits_served_from_cache(tmp_path):
+    cache, model = make_cache(tmp_path, capacity=10, batch_size=2)
+    texts = ["alpha", "beta", "gamma", "beta", "delta", "epsilon"]
+    assert np.array_equal(cache.embed(texts), np.stack([vector(text) for text in texts]))
+    assert model.batches == [["alpha", "beta"], ["gamma", "delta"], ["epsilon"]]
+    assert cache.stats == {"hits": 1, "misses": 5}
+
+    assert np.array_equal(cache.embed(["gamma", "alpha"]), np.stack([vector("gamma"), vector("alpha")]))
+    assert len(model.batches) == 3
+    assert cache.embed([]).shape == (0, DIM)
+
+
+def test_rows_persist_and_cache_reopens_from_files(tmp_path):
+    cache, _ = make_cache(tmp_path)
+    cache.embed(["alpha", "beta"])
+    del cache
+
+    reopened, model = make_cache(tmp_path)
+    assert len(reopened) == 2
+    assert np.array_equal(reopened.embed(["beta", "alpha"]), np.stack([vector("beta"), vector("alpha")]))
+    assert model.batches == []
+
+
+def test_least_recently_used_row_is_evicted(tmp_path):
+    cache, model = make_cache(tmp_path)
+    cache.embed(["a1", "b2", "c3"])
+    cache.embed(["a1"])
+    cache.embed(["d4"])
+    assert len(cache) == 3
+
+    model.batches.clear()
+    cache.embed(["a1", "c3", "d4"])
+    assert model.batches == []
+    cache.embed(["b2"])
+    assert embedded(model) == ["b2"]
+
+
+def test_evictions_survive_reopening(tmp_path):
+    cache, _ = make_cache(tmp_path)
+    for text in ["a1", "b2", "c3", "d4", "e5"]:
+        cache.embed([text])
+    del cache
+
+    reopened, model = make_cache(tmp_path)
+    assert np.array_equal(reopened.embed(["c3", "d4", "e5"]), np.stack([vector(t) for t in ["c3", "d4", "e5"]]))
+    assert model.batches == []
+    reopened.embed(["a1"])
+    assert embedded(model) == ["a1"]
+
+
+def test_texts_beyond_capacity_are_returned_without_being_stored(tmp_path):
+    cache, model = make_cache(tmp_path, capacity=2)
+    cache.embed(["a1"])
+    texts = ["a1", "b2", "c3", "d4"]
+    assert np.array_equal(cache.embed(texts), np.stack([vector(text) for text in texts]))
+    # The hit keeps its row, so one of the three new texts fits
+    assert len(cache) == 2
+    model.batches.clear()
+    cache.embed(["a1", "b2"])
+    assert model.batches == []
+
+
+def test_index_log_is_appended_and_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr(embeddings, "INDEX_LOG_COMPACT_RATIO", 2)
+    cache, _ = make_cache(tmp_path)
+    index_path = tmp_path / f"index_{DIM}.jsonl"
+
+    cache.embed(["a1", "b2"])
+    cache.embed(["c3"])
+    assert len(index_path.read_text().splitlines()) == 3
+    for i in range(10):
+        cache.embed([f"x{i}"])
+        assert len(index_path.read_text().splitlines()) <= 2 * 3
+
+    reopened, model = make_cache(tmp_path)
+    assert np.array_equal(reopened.embed(["x7", "x8", "x9"]), np.stack([vector(t) for t in ["x7", "x8", "x9"]]))
+    assert model.batches == []
+
+
+def test_torn_log_line_is_ignored(tmp_path):
+    cache, _ = make_cache(tmp_path)
+    cache.embed(["a1"])
+    with open(tmp_path / f"index_{DIM}.jsonl", "a", encoding="utf-8") as f:
+        f.write('["tor')
+    reopened, model = make_cache(tmp_path)
+    assert len(reopened) == 1
+    reopened.embed(["a1"])
+    assert model.batches == []
+
+
+@pytest.mark.parametrize("capacity", [3, 5])
+def test_resized_cache_starts_empty(tmp_path, capacity):
+    cache, _ = make_cache(tmp_path, capacity=4)
+    cache.embed(["a1"])
+    reopened, model = make_cache(tmp_path, capacity=capacity)
+    assert len(reopened) == 0
+    reopened.embed(["a1"])
+    assert embedded(model) == ["a1"]
@@ -0,0 +1,116 @@
+import glob
+import os
+
+import pytest
+
+import html_text
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pages")
+PAGES = sorted(glob.glob(os.path.join(PAGES_DIR, "*.html")))
+FAST_BACKENDS = [name for name in html_text.available_backends() if name != "html.parser"]
+
+
+def read_page(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_corpus_is_present():
+    assert len(PAGES) >= 5
+
+
+@pytest.mark.parametrize("backend", FAST_BACKENDS)
+@pytest.mark.parametrize("path", PAGES, ids=os.path.basename)
+def test_backends_match_html_parser_on_saved_pages(path, backend):
+    html = read_page(path)
+    assert html_text.html_to_text(html, backend) == html_text.html_to_text(html, "html.parser")
+
+
+@pytest.mark.parametrize("backend", html_text.available_backends())
+@pytest.mark.parametrize("html", [
+    "<p>a<script>x()</script>b</p>",
+    "<p>a<style>p{}</style>b</p>",
+    "<p>a<!-- note -->b</p>",
+])
+def test_removed_nodes_keep_text_apart(html, backend):
+    assert html_text.html_to_text(html, backend) == "a\nb"
+
+
+@pytest.mark.parametrize("backend", html_text.available_backends())
+@pytest.mark.parametrize("html", ["", "   ", "<!-- only a comment -->", "<script>x()</script>"])
+def test_pages_without_text(html, backend):
+    assert html_text.html_to_text(html, backend) == ""
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown HTML backend"):
+        html_text.html_to_text("<p>x</p>", "regex")
+
+
+# Lines extract_main_content must keep and lines it must drop, per saved page
+MAIN_CONTENT = {
+    "greenhouse_backend.html": (
+        ["Senior Backend Engineer", "Requirements", "5+ years of Python", "Django or FastAPI", "PostgreSQL",
+         "AWS experience", "Docker and Kubernetes", "Benefits", "30 days of paid vacation"],
+        ["We use cookies to improve your experience.", "Terms of Service"],
+    ),
+    "lever_data_engineer.html": (
+        ["Data Engineer", "Qualifications", "3+ years in data engineering", "Strong SQL", "Airflow or Dagster"],
+        [],
+    ),
+    "workday_frontend.html": (
+        ["Frontend Developer (React)", "Skills and experience", "TypeScript and React", "REST and GraphQL APIs",
+         "What we offer"],
+        ["Search for Jobs", "Similar Jobs", "QA Engineer", "Cookie Settings"],
+    ),
+    "company_devops.html": (
+        ["DevOps Engineer", "Must have", "Linux administration", "Bash or Python scripting", "Perks"],
+        ["Pricing", "Press", "Privacy policy"],
+    ),
+    "board_ml_engineer.html": (
+        ["Machine Learning Engineer", "Required qualifications:", "PyTorch", "B.Tech or M.Tech in CS", "Benefits:"],
+        ["Company reviews", "We use cookies to personalise content.", "Help Center"],
+    ),
+    "inline_widgets.html": (
+        ["Site Reliability Engineer", "Requirements", "Go or Python", "Incident management"],
+        ["Jobs", "Cookie settings"],
+    ),
+}
+
+
+def test_main_content_expectations_cover_corpus():
+    assert sorted(MAIN_CONTENT) == sorted(os.path.basename(path) for path in PAGES)
+
+
+@pytest.mark.parametrize("name", sorted(MAIN_CONTENT))
+def test_main_content_keeps_posting_sections(name):
+    kept, dropped = MAIN_CONTENT[name]
+    raw = html_text.html_to_text(read_page(os.path.join(PAGES_DIR, name)))
+    lines = html_text.extract_main_content(raw).split("\n")
+    assert [line for line in kept if line not in lines] == []
+    assert [line for line in dropped if line in lines] == []
+
+
+ABOUT = ("We build routing software for logistics companies across Europe and have grown to sixty people. "
+         "You will design the services behind our forecasting product together with our data scientists.")
+
+
+def test_main_content_keeps_requirements_separated_from_body():
+    text = "\n".join([
+        "Home", "Jobs", "Sign in", "Backend Engineer", ABOUT, ABOUT, "Share this job",
+        "Requirements", "5+ years of Python", "PostgreSQL", "Share this job", "© 2026 Example",
+    ])
+    lines = html_text.extract_main_content(text).split("\n")
+    assert lines == ["Backend Engineer", ABOUT, ABOUT, "Requirements", "5+ years of Python", "PostgreSQL"]
+
+
+def test_main_content_keeps_prose_after_requirements_heading():
+    requirement = "You have shipped Python services to production and are comfortable running PostgreSQL."
+    text = "\n".join([ABOUT, ABOUT, "Terms of use", "Privacy policy", "What you'll need", requirement, "© 2026"])
+    lines = html_text.extract_main_content(text).split("\n")
+    assert lines == [ABOUT, ABOUT, "What you'll need", requirement]
+
+
+def test_main_content_returns_short_pages_unchanged():
+    text = "Backend Engineer\nPython\nSign in"
+    assert html_text.extract_main_content(text) == text
@@ -0,0 +1,84 @@
+from urllib.parse import quote_plus
+
+import pytest
+
+from job_catalog import DOMAIN_KEYWORDS, JOB_SITES, SUGGESTION_SITES, build_search_url, search_queries
+
+# JobSearcher's site and keyword tables before they moved to job_catalog
+BASELINE_JOB_SITES = {
+    "LinkedIn": "https://www.linkedin.com/jobs/search/?keywords={}&location={}&f_E=2,3",
+    "Indeed": "https://www.indeed.com/jobs?q={}&l={}",
+    "Glassdoor": "https://www.glassdoor.com/Job/jobs.htm?sc.keyword={}&locT=C&locId={}",
+    "AngelList": "https://angel.co/jobs?keywords={}&location={}",
+    "RemoteOK": "https://remoteok.io/remote-{}-jobs",
+    "WeWorkRemotely": "https://weworkremotely.com/remote-jobs/search?term={}",
+}
+BASELINE_DOMAIN_KEYWORDS = {
+    "Data Science": ["data scientist", "machine learning engineer", "data analyst", "ML engineer", "AI researcher", "data science intern"],
+    "Finance": ["financial analyst", "investment banker", "portfolio manager", "risk analyst", "quantitative analyst", "finance intern"],
+    "Software Engineering": ["software engineer", "full stack developer", "backend developer", "frontend developer", "DevOps engineer", "software engineering intern"],
+    "Marketing": ["digital marketing", "content marketing", "marketing manager", "SEO specialist", "social media manager", "marketing intern"],
+    "Product Management": ["product manager", "product owner", "product analyst", "growth manager", "business analyst", "product management intern"],
+    "Consulting": ["management consultant", "strategy consultant", "business consultant", "IT consultant", "consulting intern"],
+    "Healthcare": ["healthcare analyst", "medical device", "pharmaceutical", "biotech", "clinical research", "healthcare intern"],
+    "Cybersecurity": ["cybersecurity analyst", "security engineer", "penetration tester", "information security", "cybersecurity intern"],
+    "UX/UI Design": ["UX designer", "UI designer", "product designer", "visual designer", "user researcher", "design intern"],
+    "Sales": ["sales manager", "account executive", "business development", "sales representative", "sales intern"],
+}
+
+JOB_TYPES = ["Full-time", "Part-time", "Internship", "Contract"]
+LOCATIONS = ["United States", "New York, NY", "São Paulo & Remote", ""]
+
+
+def baseline_queries(domain, job_type):
+    """Keyword filtering and query building of the old JobSearcher.get_job_suggestions"""
+    keywords = BASELINE_DOMAIN_KEYWORDS[domain]
+    if job_type.lower() == "internship":
+        keywords = [k for k in keywords if "intern" in k.lower()]
+        if not keywords:
+            keywords = [f"{k} intern" for k in BASELINE_DOMAIN_KEYWORDS[domain][:3]]
+    else:
+        keywords = [k for k in keywords if "intern" not in k.lower()]
+
+    queries = []
+    for keyword in keywords[:3]:
+        search_query = keyword
+        if job_type.lower() != "full-time":
+            search_query += f" {job_type.lower()}"
+        queries.append((keyword, search_query))
+    return queries
+
+
+def baseline_url(site_name, search_query, location):
+    """URL formatting of the old JobSearcher.get_job_suggestions"""
+    site_url = BASELINE_JOB_SITES[site_name]
+    if site_name == "RemoteOK":
+        return site_url.format(quote_plus(search_query.replace(" ", "-")))
+    elif site_name == "WeWorkRemotely":
+        return site_url.format(quote_plus(search_query))
+    return site_url.format(quote_plus(search_query), quote_plus(location))
+
+
+def test_tables_match_baseline():
+    assert JOB_SITES == BASELINE_JOB_SITES
+    assert DOMAIN_KEYWORDS == BASELINE_DOMAIN_KEYWORDS
+    assert SUGGESTION_SITES == list(BASELINE_JOB_SITES)[:4]
+
+
+@pytest.mark.parametrize("job_type", JOB_TYPES)
+@pytest.mark.parametrize("domain", list(BASELINE_DOMAIN_KEYWORDS))
+def test_search_queries_match_baseline(domain, job_type):
+    assert search_queries(domain, job_type) == baseline_queries(domain, job_type)
+
+
+@pytest.mark.parametrize("site", list(BASELINE_JOB_SITES))
+@pytest.mark.parametrize("domain", list(BASELINE_DOMAIN_KEYWORDS))
+def test_search_urls_match_baseline(domain, site):
+    for job_type in JOB_TYPES:
+        for _, search_query in baseline_queries(domain, job_type):
+            for location in LOCATIONS:
+                assert build_search_url(site, search_query, location) == baseline_url(site, search_query, location)
+
+
+def test_unknown_domain_has_no_queries():
+    assert search_queries("Underwater Basket Weaving") == []
@@ -0,0 +1,77 @@
+import math
+import random
+from collections import Counter
+
+import numpy as np
+
+from job_fit import SKILL_BOOST, fit_terms, posting_text, rank_postings, tfidf_scores
+
+RESUME_TEXT = "Backend developer. Skills: Python, Django. Also wrote some Java in university."
+
+
+def test_rank_postings_best_fit_first():
+    postings = [
+        {"title": "Sales Manager", "description": "Quota, pipeline and CRM"},
+        {"title": "Python Developer", "description": "Django services"},
+    ]
+    ranked = rank_postings(postings, RESUME_TEXT)
+    assert [posting["title"] for posting in ranked] == ["Python Developer", "Sales Manager"]
+    assert ranked[0]["fit"] > ranked[1]["fit"] == 0
+
+
+def test_resume_skills_outweigh_other_resume_terms():
+    postings = [
+        {"title": "Java Engineer", "description": "Java university hiring"},
+        {"title": "Django Engineer", "description": "Django"},
+    ]
+    plain = rank_postings(postings, RESUME_TEXT)
+    boosted = rank_postings(postings, RESUME_TEXT, skills={"python", "django"})
+    assert plain[0]["title"] == "Java Engineer"
+    assert boosted[0]["title"] == "Django Engineer"
+
+
+def test_rank_postings_without_resume_keeps_order():
+    postings = [{"title": "B"}, {"title": "A"}]
+    assert rank_postings(postings, "  ") == postings
+
+
+def reference_scores(resume_text, documents, boost_terms=()):
+    """TF-IDF cosine scores computed one posting at a time with dicts, as the reference"""
+    counts = [Counter(fit_terms(document)) for document in documents]
+    n_docs = len(documents)
+    document_frequency = Counter(term for terms in counts for term in terms)
+    idf = {term: math.log((1 + n_docs) / (1 + df)) + 1 for term, df in document_frequency.items()}
+    query = {term: (1 + math.log(count)) * idf[term] * (SKILL_BOOST if term in boost_terms else 1.0)
+             for term, count in Counter(fit_terms(resume_text)).items() if term in idf}
+    query_norm = math.sqrt(sum(value * value for value in query.values()))
+    scores = []
+    for terms in counts:
+        weights = {term: (1 + math.log(count)) * idf[term] for term, count in terms.items()}
+        doc_norm = math.sqrt(sum(value * value for value in weights.values()))
+        dot = sum(weight * query.get(term, 0.0) for term, weight in weights.items())
+        scores.append(dot / (doc_norm * query_norm) if doc_norm and query_norm else 0.0)
+    return scores
+
+
+WORDS = ("python sql pandas spark aws docker kubernetes react node java scala ml ai nlp tableau excel "
+         "finance risk marketing seo design figma ux research statistics pytorch c++ c# .net the and").split()
+TITLES = ["Data Scientist", "ML Engineer", "Backend Developer", "Product Manager", "UX Designer", "Financial Analyst"]
+
+
+def synthetic_postings(count, seed=0):
+    rng = random.Random(seed)
+    return [{
+        "title": f"{rng.choice(TITLES)} {i}",
+        "keyword": rng.choice(TITLES).lower(),
+        "company": f"Company {i % 50}",
+        "location": rng.choice(["New York, NY", "Remote", "Austin, TX"]),
+        "description": " ".join(rng.choices(WORDS, k=rng.randint(0, 60))),
+    } for i in range(count)]
+
+
+def test_tfidf_scores_match_per_posting_reference():
+    documents = [posting_text(posting) for posting in synthetic_postings(300)] + ["", "the and"]
+    resume = "Data scientist: Python, SQL, pandas and PyTorch. NLP models, statistics, Tableau.\nC++ and .NET"
+    boost = fit_terms("Python, SQL")
+    scores = tfidf_scores(resume, documents, boost)
+    assert np.allclose(scores, reference_scores(resume, documents, set(boost)))
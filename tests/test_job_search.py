@@ -0,0 +1,55 @@
+import pytest
+
+from test_job_catalog import BASELINE_DOMAIN_KEYWORDS, JOB_TYPES, baseline_queries, baseline_url
+
+job_search = pytest.importorskip("job_search", reason="job_search needs a working Streamlit install",
+                                 exc_type=ImportError)
+
+
+@pytest.fixture
+def searcher(monkeypatch):
+    searcher = job_search.JobSearcher()
+    calls = []
+    for name in ("get_job_suggestions", "search_specific_jobs"):
+        method = getattr(searcher, name)
+        monkeypatch.setattr(searcher, name, lambda *args, _method=method, **kw: calls.append(args) or _method(*args, **kw))
+    searcher.calls = calls
+    return searcher
+
+
+@pytest.mark.parametrize("job_type", JOB_TYPES)
+def test_job_suggestions_match_baseline(job_type):
+    searcher = job_search.JobSearcher()
+    for domain in BASELINE_DOMAIN_KEYWORDS:
+        expected = [
+            {"title": f"{keyword.title()} ({job_type}) - {site}", "url": baseline_url(site, query, "Berlin, DE"),
+             "site": site, "keyword": keyword, "job_type": job_type}
+            for keyword, query in baseline_queries(domain, job_type)
+            for site in ["LinkedIn", "Indeed", "Glassdoor", "AngelList"]
+        ]
+        assert searcher.get_job_suggestions(domain, "Berlin, DE", job_type=job_type) == expected
+
+
+def test_find_jobs_is_served_from_search_cache(search_cache, searcher):
+    first = searcher.find_jobs("Data Science", "New York")
+    assert first and len(searcher.calls) == 1
+
+    # Locations differing only in case and spacing share the entry
+    assert searcher.find_jobs("Data Science", "  new york ") == first
+    assert len(searcher.calls) == 1 and search_cache.stats["hits"] == 1
+
+    searcher.find_jobs("Data Science", "New York", job_type="Internship")
+    searcher.find_jobs("Data Science", "New York", company="Acme")
+    assert len(searcher.calls) == 3 and len(search_cache) == 3
+
+
+def test_find_jobs_does_not_cache_empty_results(search_cache, searcher):
+    assert searcher.find_jobs("Underwater Basket Weaving") == []
+    assert searcher.find_jobs("Underwater Basket Weaving") == []
+    assert len(searcher.calls) == 2 and len(search_cache) == 0
+
+
+def test_find_jobs_without_cache(search_cache, searcher):
+    searcher.find_jobs("Data Science", use_cache=False)
+    searcher.find_jobs("Data Science", use_cache=False)
+    assert len(searcher.calls) == 2 and len(search_cache) == 0
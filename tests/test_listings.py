@@ -0,0 +1,174 @@
+import os
+import time
+from urllib.parse import urlsplit
+
+import pytest
+
+from job_catalog import search_queries
+from listings import ADAPTERS, fetch_listings, get_live_listings
+from stub_server import StubServer
+
+LISTINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "listings")
+
+# Recorded search results page of each site and the postings parsed from it
+RECORDED = {
+    "LinkedIn": ("linkedin.html", [
+        ("Data Scientist", "Acme Analytics", "New York, NY",
+         "https://www.linkedin.com/jobs/view/data-scientist-at-acme-3901?refId=abc&trackingId=x"),
+        ("Machine Learning Engineer", "Globex", "Brooklyn, NY",
+         "https://www.linkedin.com/jobs/view/machine-learning-engineer-at-globex-3902"),
+    ]),
+    "Indeed": ("indeed.html", [
+        ("Senior Data Scientist", "Initech", "New York, NY 10001",
+         "https://www.indeed.com/rc/clk?jk=7a1f&bb=xyz&from=serp"),
+        ("Data Analyst", "Hooli", "Remote in New York, NY", "https://www.indeed.com/rc/clk?jk=9c2e&from=serp"),
+    ]),
+    "Glassdoor": ("glassdoor.html", [
+        ("Data Scientist", "Umbrella Health", "New York, NY",
+         "https://www.glassdoor.com/job-listing/data-scientist-umbrella-health-JV_IC1132348_KO0,14_KE15,30.htm"
+         "?jl=1009411"),
+        ("Applied Scientist", "Stark Industries", "Jersey City, NJ",
+         "https://www.glassdoor.com/job-listing/applied-scientist-stark-industries-JV_KO0,17.htm?jl=1009412"),
+    ]),
+    "AngelList": ("angellist.html", [
+        ("Data Scientist", "Lumen Labs", "New York City", "https://angel.co/jobs/2871001-data-scientist"),
+        ("ML Engineer", "Lumen Labs", "New York City", "https://angel.co/jobs/2871002-ml-engineer"),
+        ("AI Researcher", "Tern", "Remote", "https://angel.co/jobs/2871544-ai-researcher"),
+    ]),
+    "RemoteOK": ("remoteok.html", [
+        ("Data Scientist", "Tessellate", "🌏 Worldwide",
+         "https://remoteok.io/remote-jobs/remote-data-scientist-tessellate-1091001"),
+        ("Senior Data Scientist", "Quill", "Europe",
+         "https://remoteok.io/remote-jobs/remote-senior-data-scientist-quill-1091002"),
+    ]),
+    "WeWorkRemotely": ("weworkremotely.html", [
+        ("Data Scientist", "Parcelwise", "Anywhere in the World",
+         "https://weworkremotely.com/remote-jobs/parcelwise-data-scientist"),
+        ("Analytics Engineer", "Northwind", "USA Only",
+         "https://weworkremotely.com/remote-jobs/northwind-analytics-engineer"),
+    ]),
+}
+
+
+def recorded_page(site):
+    with open(os.path.join(LISTINGS_DIR, RECORDED[site][0]), encoding="utf-8") as f:
+        return f.read()
+
+
+def fields(postings):
+    return [(p["title"], p["company"], p["location"], p["url"]) for p in postings]
+
+
+def site_routes(server, sites, queries, location):
+    """Routes serving each site's recorded page for every query, and the base_urls pointing at them"""
+    base_urls = {site: server.url("/" + site) for site in sites}
+    routes = {}
+    for site in sites:
+        adapter = ADAPTERS[site](base_url=base_urls[site])
+        for query in queries:
+            routes[urlsplit(adapter.search_url(query, location)).path] = recorded_page(site)
+    return routes, base_urls
+
+
+def test_recorded_pages_cover_every_adapter():
+    assert sorted(RECORDED) == sorted(ADAPTERS)
+
+
+@pytest.mark.parametrize("site", sorted(RECORDED))
+def test_adapter_parses_recorded_page(site):
+    postings = ADAPTERS[site]().parse(recorded_page(site))
+    assert fields(postings) == RECORDED[site][1]
+    assert {p["site"] for p in postings} == {site}
+
+
+def test_live_listings_through_base_urls():
+    queries = [query for _, query in search_queries("Data Science")]
+    with StubServer() as server:
+        routes, base_urls = site_routes(server, list(ADAPTERS), queries, "New York")
+        server.routes.update(routes)
+        postings, errors = get_live_listings("Data Science", "New York", base_urls=base_urls, rate=0)
+
+    assert errors == {}
+    # Every query returns the same recorded page, so each posting appears once
+    expected = sorted(row for _, rows in RECORDED.values() for row in rows)
+    assert sorted(fields(postings)) == expected
+    assert len(server.hits) == len(routes)
+    assert all(p["keyword"] in queries and p["job_type"] == "Full-time" for p in postings)
+
+
+def test_fetch_listings_limits_each_site():
+    sites = ["Indeed", "RemoteOK"]
+    queries = [f"data scientist {i}" for i in range(4)]
+    servers = {site: StubServer(latency=0.1).start() for site in sites}
+    try:
+        base_urls = {}
+        for site, server in servers.items():
+            routes, urls = site_routes(server, [site], queries, "Remote")
+            server.routes.update(routes)
+            base_urls.update(urls)
+        start = time.perf_counter()
+        results = list(fetch_listings(queries, "Remote", sites, max_workers=8, per_site=2, rate=0,
+                                      base_urls=base_urls))
+        elapsed = time.perf_counter() - start
+    finally:
+        for server in servers.values():
+            server.stop()
+
+    assert [error for *_, error in results] == [None] * 8
+    assert all(server.max_active <= 2 for server in servers.values())
+    # Four pages per site, two at a time: about two rounds of latency, not eight
+    assert elapsed < 0.6
+
+
+def test_fetch_listings_yields_errors_instead_of_raising():
+    with StubServer() as server:
+        results = list(fetch_listings(["data scientist"], sites=["Indeed"], rate=0,
+                                      base_urls={"Indeed": server.url("/missing")}))
+    [(site, query, postings, error)] = results
+    assert (site, query, postings) == ("Indeed", "data scientist", None)
+    assert error is not None
+
+
+def test_fetch_listings_rejects_unknown_sites():
+    with pytest.raises(ValueError, match="No listings adapter"):
+        list(fetch_listings(["data scientist"], sites=["Monster"]))
+
+
+def test_live_listings_are_served_from_search_cache(search_cache):
+    sites = ["Indeed", "RemoteOK"]
+    queries = [query for _, query in search_queries("Data Science")]
+    with StubServer() as server:
+        routes, base_urls = site_routes(server, sites, queries, "New York")
+        server.routes.update(routes)
+        first, errors = get_live_listings("Data Science", "New York", sites=sites, base_urls=base_urls, rate=0)
+        assert errors == {} and len(search_cache) == 1
+        fetched = sum(server.hits.values())
+
+        # Locations differing only in case and spacing share the entry
+        second, errors = get_live_listings("Data Science", " new  york", sites=sites, base_urls=base_urls, rate=0)
+        assert second == first and errors == {}
+        assert sum(server.hits.values()) == fetched
+
+        get_live_listings("Data Science", "Boston", sites=sites, base_urls=base_urls, rate=0)
+        assert sum(server.hits.values()) == 2 * fetched
+    assert search_cache.stats["hits"] == 1 and len(search_cache) == 2
+
+
+def test_partial_live_listings_are_not_cached(search_cache):
+    sites = ["Indeed", "RemoteOK"]
+    queries = [query for _, query in search_queries("Data Science")]
+    with StubServer() as server:
+        routes, base_urls = site_routes(server, sites, queries, "New York")
+        # RemoteOK has a path per query; one of them fails
+        failing = urlsplit(ADAPTERS["RemoteOK"](base_url=base_urls["RemoteOK"]).search_url(queries[0], "New York"))
+        server.routes.update({path: page for path, page in routes.items() if path != failing.path})
+        postings, errors = get_live_listings("Data Science", "New York", sites=sites, base_urls=base_urls, rate=0)
+        assert postings and list(errors) == [("RemoteOK", queries[0])]
+        assert len(search_cache) == 0
+
+        # The next search fetches every page again and, now complete, is cached
+        fetched = sum(server.hits.values())
+        server.routes.update(routes)
+        postings, errors = get_live_listings("Data Science", "New York", sites=sites, base_urls=base_urls, rate=0)
+        assert errors == {} and len(search_cache) == 1
+        assert sum(server.hits.values()) == 2 * fetched
@@ -0,0 +1,247 @@
+import hashlib
+import os
+import random
+import threading
+import time
+
+import pytest
+
+import portfolio as portfolio_module
+from portfolio import Portfolio
+
+PROJECTS = [
+    {"title": "Data Pipeline", "url": "https://example.com/pipeline", "tags": ["Python", "Airflow"]},
+    {"title": "Storefront", "url": "https://example.com/store", "tags": ["React", "Node.js"]},
+    {"title": "Billing API", "url": "https://example.com/billing", "tags": ["Django", "PostgreSQL"]},
+]
+
+
+def make_portfolio():
+    portfolio = Portfolio(file_path=None)
+    portfolio.projects = list(PROJECTS)
+    portfolio.build_index()
+    return portfolio
+
+
+def test_match_projects_by_tag_overlap():
+    titles = [project["title"] for project in make_portfolio().match_projects(["python", "airflow", "react"])]
+    assert titles == ["Data Pipeline", "Storefront"]
+
+
+def test_preferred_skills_count_twice():
+    portfolio = make_portfolio()
+    assert portfolio.match_projects(["python", "django"], limit=1)[0]["title"] == "Data Pipeline"
+    assert portfolio.match_projects(["python", "django"], limit=1, preferred={"django"})[0]["title"] == "Billing API"
+
+
+def test_query_links_falls_back_to_first_projects():
+    links = make_portfolio().query_links(["cobol"])
+    assert links == "[Data Pipeline](https://example.com/pipeline), [Storefront](https://example.com/store)"
+
+
+def test_index_matches_linear_scan_on_random_portfolio():
+    rng = random.Random(1)
+    tags = [f"Tag{i}" for i in range(50)]
+    portfolio = Portfolio(file_path=None)
+    portfolio.projects = [{"title": f"P{i}", "url": f"u{i}", "tags": rng.sample(tags, 3)} for i in range(300)]
+    portfolio.build_index()
+    for _ in range(20):
+        skills = {f"tag{rng.randrange(50)}" for _ in range(4)}
+        scanned = [p for p in portfolio.projects if skills & {tag.lower() for tag in p["tags"]}]
+        matched = portfolio.match_projects(skills)
+        assert sorted(p["title"] for p in matched) == sorted(p["title"] for p in scanned)
+        overlaps = [len(skills & {tag.lower() for tag in p["tags"]}) for p in matched]
+        assert overlaps == sorted(overlaps, reverse=True)
+
+
+def bag_of_tags(texts):
+    """Offline stand-in for the embedding model: one dimension per hashed tag"""
+    import numpy as np
+
+    # 384 dimensions, as all-MiniLM-L6-v2 in the bundled store
+    vectors = np.zeros((len(texts), 384), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for tag in text.lower().split(","):
+            if tag.strip():
+                vectors[row, int(hashlib.md5(tag.strip().encode()).hexdigest(), 16) % 384] += 1
+        vectors[row] /= max(np.linalg.norm(vectors[row]), 1)
+    return vectors
+
+
+def make_index(tmp_path, embed=bag_of_tags, **kwargs):
+    pytest.importorskip("chromadb")
+    from portfolio_index import PortfolioIndex
+
+    return PortfolioIndex(path=str(tmp_path / "index"), embed=embed, **kwargs)
+
+
+def test_semantic_query_returns_closest_projects(tmp_path):
+    index = make_index(tmp_path, seed=None)
+    assert index.sync(PROJECTS) == 3
+    assert index.sync(PROJECTS) == 0
+    assert [match["title"] for match in index.query("Django, PostgreSQL", k=1)] == ["Billing API"]
+
+
+def test_sync_reuses_embeddings_of_replaced_rows(tmp_path):
+    embedded = []
+
+    def counting_embed(texts):
+        embedded.extend(texts)
+        return bag_of_tags(texts)
+
+    index = make_index(tmp_path, embed=counting_embed, seed=None)
+    index.sync(PROJECTS)
+    renamed = [dict(project, title=project["title"] + " v2") for project in PROJECTS]
+    embedded.clear()
+    assert index.sync(renamed) == 0
+    assert embedded == []
+    assert index.collection.count() == 3
+    assert index.query("Python, Airflow", k=1)[0]["title"] == "Data Pipeline v2"
+
+
+def test_sync_leaves_bundled_vectorstore_untouched(tmp_path):
+    from portfolio_index import VECTORSTORE_DIR
+
+    def snapshot():
+        digests = {}
+        for folder, _, files in os.walk(VECTORSTORE_DIR):
+            for name in files:
+                path = os.path.join(folder, name)
+                with open(path, "rb") as f:
+                    digests[path] = hashlib.sha256(f.read()).hexdigest()
+        return digests
+
+    before = snapshot()
+    index = make_index(tmp_path)
+    index.sync(PROJECTS)
+    assert index.collection.count() == 3
+    assert snapshot() == before
+
+
+def test_semantic_links_use_the_index(tmp_path):
+    portfolio = make_portfolio()
+    portfolio._vector_index = make_index(tmp_path, seed=None)
+    links = portfolio.query_links(["PostgreSQL", "Django"], limit=1, semantic=True)
+    assert links == "[Billing API](https://example.com/billing)"
+
+
+def test_semantic_links_fall_back_to_tag_overlap_on_index_error(tmp_path):
+    def offline_embed(texts):
+        raise ConnectionError("model download failed")
+
+    portfolio = make_portfolio()
+    portfolio._vector_index = make_index(tmp_path, embed=offline_embed, seed=None)
+    links = portfolio.query_links(["python", "airflow"], limit=1, semantic=True)
+    assert links == "[Data Pipeline](https://example.com/pipeline)"
+    assert isinstance(portfolio.index_error, ConnectionError)
+
+    # Within the retry window the failing index is not called again
+    portfolio._vector_index = None
+    assert portfolio.query_links(["python"], limit=1, semantic=True) == links
+    assert portfolio._vector_index is None
+
+
+def test_vector_index_is_built_and_synced_once_across_threads(monkeypatch):
+    import portfolio_index
+
+    built, synced = [], []
+
+    class SlowIndex:
+        def __init__(self):
+            time.sleep(0.05)
+            built.append(self)
+
+        def sync(self, projects):
+            time.sleep(0.05)
+            synced.append(projects)
+
+    monkeypatch.setattr(portfolio_index, "PortfolioIndex", SlowIndex)
+    portfolio = make_portfolio()
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(portfolio.vector_index())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(built) == 1 and len(synced) == 1
+    assert all(index is built[0] for index in results) and len(results) == 8
+
+
+def write_csv(path, rows, header='"Techstack","Links"'):
+    path.write_text("\n".join([header] + rows) + "\n", encoding="utf-8")
+
+
+def test_read_portfolio_csv(tmp_path):
+    path = tmp_path / "portfolio.csv"
+    write_csv(path, [
+        '"Python, Airflow","https://example.com/data-pipeline","Pipelines"',
+        '"React,Node.js","https://example.com/my_store/",""',
+        '"","https://example.com/no-tags",""',
+        '"Go","",""',
+    ], header='"Techstack","Links","Title"')
+    assert list(portfolio_module.read_portfolio_csv(path)) == [
+        {"title": "Pipelines", "url": "https://example.com/data-pipeline", "tags": ["Python", "Airflow"]},
+        {"title": "My Store", "url": "https://example.com/my_store/", "tags": ["React", "Node.js"]},
+    ]
+
+
+def counting_reads(monkeypatch):
+    reads = []
+    original = portfolio_module.read_portfolio_csv
+
+    def read(path):
+        reads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(portfolio_module, "read_portfolio_csv", read)
+    return reads
+
+
+def test_touching_csv_without_changes_skips_reload(tmp_path, monkeypatch):
+    path = tmp_path / "portfolio.csv"
+    write_csv(path, ['"Python, Airflow","https://example.com/pipeline"'])
+    reads = counting_reads(monkeypatch)
+    portfolio = Portfolio(file_path=str(path))
+    assert len(reads) == 1
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert portfolio.load_portfolio() is False
+    assert len(reads) == 1
+    # Unchanged signature: not even hashed again
+    assert portfolio.load_portfolio() is False
+
+
+def test_editing_csv_triggers_reload(tmp_path, monkeypatch):
+    path = tmp_path / "portfolio.csv"
+    write_csv(path, ['"Python, Airflow","https://example.com/pipeline"'])
+    portfolio = Portfolio(file_path=str(path))
+    assert portfolio.match_projects(["django"]) == []
+
+    write_csv(path, ['"Django, PostgreSQL","https://example.com/billing"'])
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    reads = counting_reads(monkeypatch)
+    assert portfolio.load_portfolio() is True
+    assert len(reads) == 1
+    assert [project["url"] for project in portfolio.match_projects(["django"])] == ["https://example.com/billing"]
+
+
+def test_emptied_csv_falls_back_to_default_projects(tmp_path):
+    path = tmp_path / "portfolio.csv"
+    write_csv(path, ['"Python, Airflow","https://example.com/pipeline"'])
+    portfolio = Portfolio(file_path=str(path))
+    assert [project["url"] for project in portfolio.projects] == ["https://example.com/pipeline"]
+
+    write_csv(path, [])
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert portfolio.load_portfolio() is True
+    assert portfolio.projects == portfolio_module.DEFAULT_PROJECTS
+    assert portfolio.match_projects([portfolio.projects[0]["tags"][0]])
@@ -0,0 +1,38 @@
+import pytest
+
+from resume import Resume, parse_skill_list
+
+RESUME = """Ada Lovelace
+ada@example.com
+
+Summary
+Backend developer with five years of Python.
+
+Skills
+Languages: Python, SQL; Tools: Docker | Cloud: AWS
+Frameworks: Django, FastAPI
+
+Experience
+Built billing APIs in Django at Example Corp.
+"""
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Languages: Python, SQL; Tools: Docker", {"python", "sql", "docker"}),
+    ("Languages: Python | Frameworks: Django, FastAPI", {"python", "django", "fastapi"}),
+    ("Python, Machine Learning.\n• Git • Linux", {"python", "machine learning", "git", "linux"}),
+    ("Tools:\nDocker", {"docker"}),
+])
+def test_parse_skill_list_strips_every_label(text, expected):
+    assert parse_skill_list(text) == expected
+
+
+def test_resume_sections_and_skills():
+    resume = Resume(RESUME)
+    assert set(resume.sections) == {"header", "summary", "skills", "experience"}
+    assert resume.skills == {"python", "sql", "docker", "aws", "django", "fastapi"}
+
+
+def test_matching_skills_normalizes_job_skills():
+    resume = Resume(RESUME)
+    assert resume.matching_skills(["Python", "Kubernetes", "AWS ", "django."]) == {"python", "aws", "django"}
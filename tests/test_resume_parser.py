@@ -0,0 +1,143 @@
+import glob
+import hashlib
+import io
+import os
+from collections import Counter
+
+import pytest
+
+import resume_parser
+from pdf_factory import make_pdf, resume_pages
+
+RESUMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "resumes")
+RESUMES = sorted(glob.glob(os.path.join(RESUMES_DIR, "*.pdf")))
+
+
+def read_resume(name):
+    with open(os.path.join(RESUMES_DIR, name), "rb") as f:
+        return f.read()
+
+
+@pytest.fixture(scope="module")
+def long_pdf():
+    return make_pdf(resume_pages(30, lines_per_page=20, blank_every=7))
+
+
+def test_pages_without_text_become_empty_blocks():
+    data = make_pdf([["Ada Lovelace", "Python developer"], [], ["Skills: Python"]])
+    text = resume_parser.extract_text_from_pdf(data, backend="pdfplumber")
+    assert text == "Ada Lovelace\nPython developer\n\nSkills: Python\n"
+
+
+def test_max_pages_caps_extraction(long_pdf):
+    text = resume_parser.extract_text_from_pdf(long_pdf, max_pages=3, backend="pdfplumber")
+    assert "Experience - page 3" in text
+    assert "Experience - page 4" not in text
+
+
+def test_unknown_backend(long_pdf):
+    with pytest.raises(ValueError, match="Unknown PDF backend"):
+        resume_parser.extract_text_from_pdf(long_pdf, backend="ocr")
+
+
+@pytest.mark.parametrize("path", RESUMES, ids=os.path.basename)
+def test_backends_extract_the_same_words(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    words = {backend: resume_parser.extract_text_from_pdf(data, backend=backend).split()
+             for backend in resume_parser.PDF_BACKENDS}
+    assert words["pdfium"] == words["pdfplumber"]
+    # pdfminer groups right-aligned text (dates) into its own box, so only the order may differ
+    assert Counter(words["pdfminer"]) == Counter(words["pdfplumber"])
+
+
+@pytest.mark.parametrize("backend", list(resume_parser.PDF_BACKENDS))
+def test_words_stay_apart_in_pdftex_output(backend):
+    lines = resume_parser.extract_text_from_pdf(read_resume("latex_style.pdf"), backend=backend).splitlines()
+    assert lines[:2] == ["Alan Turing", "alan@example.com | Manchester, UK"]
+    assert "Languages: Python, SQL, Go" in lines
+
+
+@pytest.mark.parametrize("pages, backend", [(1, "pdfplumber"), (7, "pdfplumber"), (8, "fast"), (30, "fast")])
+def test_auto_backend_switches_at_page_threshold(pages, backend, monkeypatch):
+    assert resume_parser.PDF_FAST_MIN_PAGES == 8
+    fast = resume_parser._fast_backend()
+    used = []
+    for name, extract in resume_parser.PDF_BACKENDS.items():
+        monkeypatch.setitem(resume_parser.PDF_BACKENDS, name,
+                            lambda data, count, _name=name, _extract=extract: used.append(_name) or _extract(data, count))
+    text = resume_parser.extract_text_from_pdf(make_pdf(resume_pages(pages)))
+    assert used == [fast if backend == "fast" else backend]
+    assert text.count("Experience - page") == pages
+
+
+def test_pdf_backend_setting_overrides_page_threshold(monkeypatch):
+    monkeypatch.setattr(resume_parser, "PDF_BACKEND", "pdfminer")
+    assert {resume_parser.choose_pdf_backend(pages) for pages in (1, 8, 100)} == {"pdfminer"}
+
+
+def test_auto_text_keeps_its_shape_across_the_threshold():
+    pytest.importorskip("pypdfium2")
+    pages = resume_pages(resume_parser.PDF_FAST_MIN_PAGES)
+    below = resume_parser.extract_text_from_pdf(make_pdf(pages[:-1]))
+    at_threshold = resume_parser.extract_text_from_pdf(make_pdf(pages))
+    assert at_threshold.startswith(below)
+    assert at_threshold == resume_parser.extract_text_from_pdf(make_pdf(pages), backend="pdfplumber")
+    one_page = resume_parser.extract_text_from_pdf(read_resume("single_column.pdf"))
+    assert resume_parser.extract_text_from_pdf(read_resume("four_pages.pdf")).startswith(one_page)
+
+
+@pytest.fixture
+def counted_parses(monkeypatch):
+    """Fresh in-memory resume cache, and the list of PDFs actually parsed"""
+    monkeypatch.setattr(resume_parser, "resume_cache", resume_parser.ResumeCache(max_entries=4, disk=False))
+    parsed = []
+    extract = resume_parser.EXTRACTORS[resume_parser.PDF_MIME]
+    monkeypatch.setitem(resume_parser.EXTRACTORS, resume_parser.PDF_MIME,
+                        lambda data: parsed.append(data) or extract(data))
+    return parsed
+
+
+def test_parse_resume_is_cached_by_content_hash(counted_parses):
+    data = make_pdf([["Ada Lovelace", "Python developer"]])
+    first = resume_parser.parse_resume(data, resume_parser.PDF_MIME)
+    # Another upload of the same bytes, as a file object
+    assert resume_parser.parse_resume(io.BytesIO(data), resume_parser.PDF_MIME) == first
+    assert len(counted_parses) == 1
+    key = f"{resume_parser.PDF_MIME}:{hashlib.sha256(data).hexdigest()}"
+    assert resume_parser.resume_cache.get(key) == first
+
+    edited = make_pdf([["Ada Lovelace", "Rust developer"]])
+    assert "Rust developer" in resume_parser.parse_resume(edited, resume_parser.PDF_MIME)
+    assert len(counted_parses) == 2
+    assert resume_parser.resume_cache.stats == {"hits": 2, "misses": 2}
+
+
+def test_parse_resume_rejects_unknown_types(counted_parses):
+    with pytest.raises(ValueError, match="Unsupported resume format"):
+        resume_parser.parse_resume(b"text", "text/plain")
+
+
+def test_resume_cache_evicts_least_recently_used():
+    cache = resume_parser.ResumeCache(max_entries=2, disk=False)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"
+    cache.set("c", "C")
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ("A", "C")
+
+
+def test_resume_disk_cache_outlives_the_instance(tmp_path, monkeypatch):
+    import cache as cache_module
+    monkeypatch.setattr(cache_module, "CACHE_DB", str(tmp_path / "cache.sqlite3"))
+    resume_parser.ResumeCache(max_entries=1, disk=True).set("pdf:abc", "Resume text")
+
+    cache = resume_parser.ResumeCache(max_entries=1, disk=True)
+    assert cache.get("pdf:abc") == "Resume text"
+    assert cache.stats == {"hits": 1, "misses": 0}
+    # Evicted from memory, still on disk
+    cache.set("pdf:def", "Other resume")
+    assert cache.get("pdf:abc") == "Resume text"
+    # The memory-only cache never sees it
+    assert resume_parser.ResumeCache(disk=False).get("pdf:abc") is None
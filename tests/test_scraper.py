@@ -0,0 +1,222 @@
+import asyncio
+import os
+import time
+
+import pytest
+import requests
+
+import scraper
+from cache import SQLiteCache
+from stub_server import StubServer
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pages")
+POSTING = "<html><body><h1>Backend Engineer</h1><p>Build APIs in Python.</p></body></html>"
+
+
+def test_fetch_reuses_pooled_connection():
+    with StubServer({"/job": POSTING}) as server:
+        for _ in range(5):
+            response = scraper.fetch(server.url("/job"))
+            assert response.status_code == 200
+            assert "Backend Engineer" in response.text
+        assert server.hits["/job"] == 5
+        assert server.connections == 1
+
+
+def test_fetch_read_timeout():
+    with StubServer({"/slow": POSTING}, latency=1.0) as server:
+        with pytest.raises(requests.exceptions.Timeout):
+            scraper.fetch(server.url("/slow"), timeout=(1, 0.2))
+
+
+def test_fetch_refuses_oversized_body():
+    with StubServer({"/big": "x" * 10_000}) as server:
+        with pytest.raises(ValueError, match="too large"):
+            scraper.fetch(server.url("/big"), max_bytes=1_000)
+
+
+def test_fetch_raises_for_http_errors():
+    with StubServer() as server:
+        with pytest.raises(requests.exceptions.HTTPError):
+            scraper.fetch(server.url("/missing"))
+
+
+def test_scrape_job_description_uncached():
+    with StubServer({"/job": POSTING}) as server:
+        text = scraper.scrape_job_description(server.url("/job"), use_cache=False)
+    assert text == "Backend Engineer\nBuild APIs in Python."
+
+
+def test_scrape_many_schedules_per_host():
+    # 3 hosts x 8 URLs at 0.2 s with 2 slots per host: 6 run at once, so ~0.8 s
+    page = "<html><body><p>Posting</p></body></html>"
+    servers = [StubServer({f"/job{i}": page for i in range(8)}, latency=0.2).start() for _ in range(3)]
+    try:
+        urls = [server.url(f"/job{i}") for server in servers for i in range(8)]
+        start = time.perf_counter()
+        results = list(scraper.scrape_many(urls, max_workers=8, per_host=2, use_cache=False))
+        elapsed = time.perf_counter() - start
+    finally:
+        for server in servers:
+            server.stop()
+
+    assert sorted(url for url, _, _ in results) == sorted(urls)
+    assert all(error is None and text == "Posting" for _, text, error in results)
+    assert all(server.max_active <= 2 for server in servers)
+    assert elapsed < 1.15
+
+
+def test_scrape_many_yields_errors_instead_of_raising():
+    with StubServer({"/ok": "<p>fine</p>"}) as server:
+        results = {url: (text, error) for url, text, error in
+                   scraper.scrape_many([server.url("/ok"), server.url("/gone")], use_cache=False)}
+    assert results[server.url("/ok")] == ("fine", None)
+    assert results[server.url("/gone")][0] is None
+    assert isinstance(results[server.url("/gone")][1], requests.exceptions.HTTPError)
+
+
+def test_map_per_host_stops_cleanly_when_abandoned():
+    calls = []
+
+    def work(item):
+        calls.append(item)
+        time.sleep(0.01)
+        return item[1]
+
+    items = [("a", i) for i in range(20)]
+    results = scraper.map_per_host(work, items, lambda item: item[0], max_workers=2, per_host=1)
+    first = next(results)
+    results.close()
+    time.sleep(0.05)
+    assert first[1] == first[0][1]
+    assert len(calls) < len(items)
+
+
+def test_scrape_keeps_requirements_of_saved_page():
+    with open(os.path.join(PAGES_DIR, "greenhouse_backend.html"), encoding="utf-8") as f:
+        page = f.read()
+    with StubServer({"/job": page}) as server:
+        text, stats = scraper.scrape_job_description(server.url("/job"), use_cache=False, with_stats=True)
+    lines = text.split("\n")
+    assert "Senior Backend Engineer" in lines
+    assert lines[lines.index("Requirements") + 1:lines.index("Requirements") + 6] == [
+        "5+ years of Python", "Django or FastAPI", "PostgreSQL", "AWS experience", "Docker and Kubernetes",
+    ]
+    assert "We use cookies to improve your experience." not in lines
+    assert 0 < stats["reduction"] < 0.5
+
+
+def test_ascrape_job_description_overlaps_requests():
+    with StubServer({f"/job{i}": POSTING for i in range(5)}, latency=0.2) as server:
+        async def scrape_all():
+            return await asyncio.gather(*(scraper.ascrape_job_description(server.url(f"/job{i}"), use_cache=False)
+                                          for i in range(5)))
+
+        start = time.perf_counter()
+        texts = asyncio.run(scrape_all())
+        elapsed = time.perf_counter() - start
+    assert texts == ["Backend Engineer\nBuild APIs in Python."] * 5
+    assert server.max_active == 5
+    assert elapsed < 0.6
+
+
+@pytest.fixture
+def job_cache(tmp_path, monkeypatch):
+    cache = SQLiteCache("job_descriptions", ttl=60, path=str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(scraper, "_job_cache", cache)
+    return cache
+
+
+def test_normalize_url_strips_tracking_params():
+    url = "HTTPS://Jobs.Example.com:443/posting/42?utm_source=li&b=2&gclid=x&a=1&UTM_Campaign=y&trk=z#apply"
+    assert scraper.normalize_url(url) == "https://jobs.example.com/posting/42?a=1&b=2"
+    assert scraper.normalize_url("http://example.com") == "http://example.com/"
+
+
+def test_scrape_serves_fresh_entries_from_cache(job_cache):
+    with StubServer({"/job": POSTING}) as server:
+        first, stats = scraper.scrape_job_description(server.url("/job?utm_source=mail"), with_stats=True)
+        assert not stats["cached"]
+        # Tracking params do not make a different posting
+        second, stats = scraper.scrape_job_description(server.url("/job?fbclid=abc"), with_stats=True)
+    assert second == first == "Backend Engineer\nBuild APIs in Python."
+    assert stats["cached"] and not stats["stale"]
+    assert server.hits["/job"] == 1
+
+
+def test_scrape_revalidates_expired_entries_with_etag(job_cache):
+    route = {"body": POSTING, "headers": {"ETag": '"v1"'}}
+    with StubServer({"/job": route}) as server:
+        first = scraper.scrape_job_description(server.url("/job"))
+        job_cache.ttl = 0
+        text, stats = scraper.scrape_job_description(server.url("/job"), with_stats=True)
+        assert server.not_modified == 1
+        assert text == first and stats["cached"]
+
+        # The 304 renewed the entry, so it is fresh again under the normal TTL
+        job_cache.ttl = 60
+        scraper.scrape_job_description(server.url("/job"))
+        assert server.hits["/job"] == 2
+
+        # A changed page replaces the entry
+        job_cache.ttl = 0
+        server.routes["/job"] = {"body": "<p>Filled</p>", "headers": {"ETag": '"v2"'}}
+        text, stats = scraper.scrape_job_description(server.url("/job"), with_stats=True)
+    assert text == "Filled" and not stats["cached"]
+    assert job_cache.get(scraper.normalize_url(server.url("/job")), allow_stale=True)["meta"]["etag"] == '"v2"'
+
+
+def test_scrape_serves_stale_entry_when_site_is_down(job_cache):
+    server = StubServer({"/job": POSTING, "/other": POSTING}).start()
+    first = scraper.scrape_job_description(server.url("/job"))
+    server.stop()
+    job_cache.ttl = 0
+
+    text, stats = scraper.scrape_job_description(server.url("/job"), with_stats=True)
+    assert text == first and stats["stale"]
+    # Nothing cached to fall back on
+    with pytest.raises(requests.exceptions.ConnectionError):
+        scraper.scrape_job_description(server.url("/other"))
+
+
+def test_scrape_serves_stale_entry_on_server_errors_only(job_cache):
+    with StubServer({"/job": POSTING}) as server:
+        first = scraper.scrape_job_description(server.url("/job"))
+        job_cache.ttl = 0
+        server.routes["/job"] = {"body": "unavailable", "status": 503}
+        text, stats = scraper.scrape_job_description(server.url("/job"), with_stats=True)
+        assert text == first and stats["stale"]
+
+        # A removed posting is an answer, not an outage
+        del server.routes["/job"]
+        with pytest.raises(requests.exceptions.HTTPError):
+            scraper.scrape_job_description(server.url("/job"))
+
+
+def test_ascrape_serves_stale_entry_when_site_is_down(job_cache):
+    server = StubServer({"/job": POSTING}).start()
+    first = asyncio.run(scraper.ascrape_job_description(server.url("/job")))
+    server.stop()
+    job_cache.ttl = 0
+
+    text, stats = asyncio.run(scraper.ascrape_job_description(server.url("/job"), with_stats=True))
+    assert text == first and stats["stale"]
+
+
+def test_async_client_is_closed_with_its_loop():
+    async def fetch_and_get_client(url):
+        await scraper.afetch(url)
+        return asyncio.get_running_loop(), await scraper.get_async_client()
+
+    with StubServer({"/job": POSTING}) as server:
+        first_loop, first = asyncio.run(fetch_and_get_client(server.url("/job")))
+        assert first.is_closed and first_loop not in scraper._async_clients
+
+        # A loop closed without shutting down its async generators cannot close
+        # its client; the next loop drops the entry
+        loop = asyncio.new_event_loop()
+        stale_loop, stale = loop.run_until_complete(fetch_and_get_client(server.url("/job")))
+        loop.close()
+        _, second = asyncio.run(fetch_and_get_client(server.url("/job")))
+    assert stale_loop not in scraper._async_clients
+    assert second is not first and second.is_closed
@@ -0,0 +1,82 @@
+import random
+import re
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+from skills import CASE_SENSITIVE_SKILLS, SkillExtractor, default_skills, extract_skills, normalize
+
+
+def naive_extract(skills, text):
+    """One case-insensitive regex search per skill, as the reference for the automaton"""
+    text = normalize(text)
+    found = {}
+    for skill in dict.fromkeys(skills):
+        key = normalize(skill)
+        if len(key) < 2 or key in found:
+            continue
+        match = re.search(r"(?<![^\W_])" + re.escape(key) + r"(?![^\W_])", text)
+        if match:
+            found[key] = (match.start(), skill.strip())
+    return [skill for _, skill in sorted(found.values())]
+
+
+def test_everyday_words_are_not_skills():
+    text = "We will go the extra mile. The rest of the team will express interest; excel at spring hiring"
+    assert extract_skills(text) == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Experience with Go, Python and REST APIs", ["Go", "Python", "REST", "REST APIs"]),
+    ("Built on Node.js and Express; reports in Excel", ["Node.js", "Express", "Excel"]),
+    ("Java services on Spring Boot", ["Java", "Spring", "Spring Boot"]),
+    # Capitalized at the start of a sentence, these are prose unless listed
+    ("Go is what we do. Excel at it!", []),
+    ("Go, Rust or C++", ["Go", "Rust", "C++"]),
+    ("Requirements:\n- Excel\n- Tableau", ["Excel", "Tableau"]),
+    ("GO FAST", []),
+])
+def test_case_sensitive_skills(text, expected):
+    assert extract_skills(text) == expected
+
+
+def test_multi_word_skills_ignore_case_and_line_wraps():
+    text = "Knowledge of natural\n   LANGUAGE processing and machine learning"
+    assert extract_skills(text) == ["Natural Language Processing", "Machine Learning"]
+
+
+def test_skills_are_not_matched_inside_longer_words():
+    assert extract_skills("JavaScript only") == ["JavaScript"]
+    assert extract_skills("Java, JavaScript") == ["Java", "JavaScript"]
+
+
+def test_text_that_lowercases_to_more_characters():
+    assert extract_skills("İstanbul office: Go and Docker") == ["Go", "Docker"]
+
+
+def test_overlapping_dictionary_entries():
+    extractor = SkillExtractor(["he", "she", "his", "hers"], case_sensitive=())
+    assert extractor.extract("ushers he his she hers") == ["he", "his", "she", "hers"]
+
+
+def test_automaton_matches_per_skill_regex_on_random_text():
+    skills = default_skills()
+    extractor = SkillExtractor(skills, case_sensitive=())
+    vocabulary = [normalize(skill) for skill in skills] + "we are looking for an engineer with experience".split() * 20
+    rng = random.Random(0)
+    for _ in range(20):
+        text = " ".join(rng.choices(vocabulary, k=500))
+        assert extractor.extract(text) == naive_extract(skills, text)
+
+
+def test_case_sensitive_skills_are_in_the_dictionary():
+    names = set(SkillExtractor(default_skills()).names)
+    assert CASE_SENSITIVE_SKILLS <= names
+
+
+def test_default_skills_do_not_import_streamlit():
+    code = ("import sys, skills; skills.default_skills(); "
+            "assert 'streamlit' not in sys.modules and 'job_search' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
@@ -0,0 +1,53 @@
+import pytest
+
+from token_budget import count_tokens, fit_prompt, trim_to_budget, truncate_tokens
+
+LONG_PARAGRAPH = " ".join(["word"] * 5000)
+
+
+def test_single_long_paragraph_is_truncated_not_dropped():
+    job_description, resume, report = fit_prompt(LONG_PARAGRAPH, "short resume", budget=1000)
+    assert resume == "short resume"
+    assert LONG_PARAGRAPH.startswith(job_description)
+    assert 900 < report["job_description_tokens"] <= 1000 - report["resume_tokens"]
+
+
+def test_oversized_first_line_is_always_kept():
+    text = "Senior Backend Engineer " * 100 + "\nPython"
+    trimmed = trim_to_budget(text, 20)
+    assert trimmed
+    assert text.startswith(trimmed)
+    assert count_tokens(trimmed) <= 20
+
+
+def test_leftover_budget_holds_start_of_best_skipped_line():
+    relevant = "We need Python and PostgreSQL " + "and more detail " * 60
+    text = "Backend Engineer\nUnrelated perks line\n" + relevant
+    trimmed = trim_to_budget(text, 60, {"python", "postgresql"}).split("\n")
+    assert trimmed[0] == "Backend Engineer"
+    assert trimmed[-1].startswith("We need Python and PostgreSQL")
+    assert count_tokens("\n".join(trimmed)) <= 60
+
+
+def test_kept_lines_stay_in_original_order():
+    fillers = [f"filler {i} " * 20 for i in range(10)]
+    text = "\n".join(["Title", *fillers[:5], "Python line", *fillers[5:]])
+    trimmed = trim_to_budget(text, 40, {"python"})
+    lines = trimmed.split("\n")
+    # Whole lines first, then the leftover filled with the start of the first skipped line
+    assert len(lines) == 3
+    assert lines[0] == "Title"
+    assert fillers[0].startswith(lines[1])
+    assert lines[2] == "Python line"
+    assert count_tokens(trimmed) <= 40
+
+
+def test_text_within_budget_is_untouched():
+    assert trim_to_budget("a\n\nb", 100) == "a\n\nb"
+
+
+@pytest.mark.parametrize("max_tokens", [0, 1, 7, 50, 400])
+def test_truncate_tokens_fits(max_tokens):
+    prefix = truncate_tokens(LONG_PARAGRAPH, max_tokens)
+    assert LONG_PARAGRAPH.startswith(prefix)
+    assert count_tokens(prefix) <= max_tokens
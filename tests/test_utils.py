@@ -0,0 +1,114 @@
+import glob
+import os
+import random
+import re
+
+import pytest
+
+from utils import TAG_RE, URL_RE, clean_text, clean_texts
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+CORPUS = sorted(glob.glob(os.path.join(FIXTURES_DIR, "pages", "*.html")))
+
+
+def original_clean_text(text):
+    """clean_text as it was before the passes were merged, kept as the reference output"""
+    text = re.sub(r'<[^>]*?>', '', text)
+    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    text = re.sub(r'[^a-zA-Z0-9 ]', '', text)
+    text = re.sub(r'\s{2,}', ' ', text)
+    text = text.strip()
+    text = ' '.join(text.split())
+    return text
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+EDGE_CASES = [
+    "",
+    "   ",
+    "line\nbreaks\tand\r\ntabs join words",
+    "Salary: €60k–€80k · Remote (EU)",
+    "See https://example.com/jobs?id=1&ref=x, or http://a.b/c%20d!",
+    "<p>Python</p><p>SQL</p> < 5 years > 2 <unclosed",
+    "a    b 　 c",
+    "naïve café Zürich 東京 🚀 done",
+]
+
+
+def random_page(rng, words):
+    parts = []
+    for _ in range(words):
+        roll = rng.random()
+        if roll < 0.1:
+            parts.append(f"<a href='https://x.io/{rng.randint(0, 99)}'>")
+        elif roll < 0.15:
+            parts.append(f"https://example.com/p/{rng.randint(0, 999)}?q=a b")
+        elif roll < 0.2:
+            parts.append(rng.choice(["\n", "\t", "  ", " ", "<", ">", "é", "日本"]))
+        else:
+            parts.append(rng.choice(["python", "data", "engineer", "React,", "(remote)", "5+"]))
+    return rng.choice([" ", "", "\n"]).join(parts)
+
+
+def test_corpus_is_present():
+    assert len(CORPUS) >= 5
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=os.path.basename)
+def test_clean_text_matches_original_on_corpus(path):
+    text = read(path)
+    assert clean_text(text) == original_clean_text(text)
+
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_clean_text_matches_original_on_edge_cases(text):
+    assert clean_text(text) == original_clean_text(text)
+
+
+def test_tag_and_url_patterns_match_the_original_ones():
+    tag_re = re.compile(r'<[^>]*?>')
+    url_re = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+    pieces = ["http://", "https://", "<", ">", "%2F", "%g", "_", "~", "{", "`", "é", " ", "\n", "#"]
+    pieces += [chr(code) for code in range(33, 127)]
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = "".join(rng.choices(pieces, k=40))
+        assert TAG_RE.sub('', text) == tag_re.sub('', text)
+        assert URL_RE.sub('', text) == url_re.sub('', text)
+
+
+@pytest.mark.parametrize("chunk_size", [8, 64, 1000])
+@pytest.mark.parametrize("keep_unicode", [False, True])
+def test_chunked_cleaning_matches_whole_text(chunk_size, keep_unicode):
+    texts = [read(path) for path in CORPUS] + EDGE_CASES
+    rng = random.Random(7)
+    texts += [random_page(rng, rng.randint(1, 400)) for _ in range(100)]
+    expected = [clean_text(text, keep_unicode) for text in texts]
+    assert list(clean_texts(texts, keep_unicode, chunk_size=chunk_size)) == expected
+
+
+def test_chunking_handles_text_without_spaces():
+    text = "<" + "x" * 500 + ">" + "y" * 500
+    assert list(clean_texts([text], chunk_size=16)) == [clean_text(text)]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Entwickler (m/w/d) für München – Python & SQL!", "Entwickler mwd für München Python SQL"),
+    ("<h1>Разработчик</h1>\nPython, 3+ года", "Разработчик Python 3 года"),
+    ("東京のエンジニア\t募集", "東京のエンジニア 募集"),
+    ("डेवलपर — हिंदी", "डेवलपर हिंदी"),
+    ("مهندس برمجيات، دبي", "مهندس برمجيات دبي"),
+    ("Rust 🚀 engineer https://jobs.example.com/1 𝐁old", "Rust engineer 𝐁old"),
+])
+def test_unicode_mode_keeps_letters_of_every_script(text, expected):
+    assert clean_text(text, keep_unicode=True) == expected
+
+
+def test_unicode_mode_keeps_line_breaks_as_word_breaks():
+    text = "Senior Engineer\n\nPython,  SQL & Go"
+    assert clean_text(text, keep_unicode=True) == "Senior Engineer Python SQL Go"
+    assert clean_text(text) == "Senior EngineerPython SQL Go"
@@ -0,0 +1,154 @@
+import math
+import os
+import re
+
+# Tokens available for the job description and resume together. llama3-70b-8192
+# has an 8192 token window shared by the prompt and the generated email.
+TOKEN_BUDGET = int(os.getenv("TOKEN_BUDGET", "5000"))
+JOB_DESCRIPTION_SHARE = float(os.getenv("JOB_DESCRIPTION_SHARE", "0.5"))
+
+WORD_RE = re.compile(r"\w+|[^\w\s]")
+TERM_RE = re.compile(r"[a-z][a-z0-9+#.]{2,}")
+
+STOPWORDS = frozenset("""
+about above after again also among and any are because been before being below between both but can
+could did does doing down during each few for from further had has have having her here hers him his
+how into its itself just more most must not now off once only other our ours out over own same she
+should some such than that the their theirs them then there these they this those through too under
+until very was were what when where which while who whom why will with would you your yours work
+working team teams role job jobs year years including include strong ability experience
+""".split())
+
+# Lines of a job description that usually carry the requirements
+PRIORITY_MARKERS = ("requirement", "qualification", "responsibilit", "skill", "experience", "you will", "must")
+
+# Leftover budget below this is not worth filling with the start of a cut line
+MIN_TRUNCATED_TOKENS = 16
+
+_encoding = None
+
+
+def count_tokens(text):
+    """Token count of text, exact with tiktoken installed and estimated otherwise"""
+    global _encoding
+    if not text:
+        return 0
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except ImportError:
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode(text))
+    # Words and punctuation, plus a margin for words split into sub-word pieces
+    return math.ceil(len(WORD_RE.findall(text)) * 1.3)
+
+
+def truncate_tokens(text, max_tokens):
+    """Longest prefix of text that counts as at most max_tokens tokens"""
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text) <= max_tokens:
+        return text
+    if _encoding:
+        tokens = _encoding.encode(text)[:max_tokens]
+        # Decoding can merge pieces into a longer encoding; drop tokens until it fits
+        while tokens and count_tokens(_encoding.decode(tokens)) > max_tokens:
+            tokens = tokens[:-1]
+        return _encoding.decode(tokens).rstrip()
+    pieces = math.floor(max_tokens / 1.3)
+    matches = list(WORD_RE.finditer(text))[:pieces]
+    return text[:matches[-1].end()] if matches else ""
+
+
+def key_terms(text):
+    return {term.strip(".") for term in TERM_RE.findall(text.lower())} - STOPWORDS
+
+
+def _blocks(text):
+    return [line for line in text.splitlines() if line.strip()]
+
+
+def trim_to_budget(text, budget, relevant_terms=(), priority_markers=()):
+    """Keep the most relevant lines of text that fit in budget tokens, in original order.
+
+    A line scores one point per distinct relevant term it mentions, plus a bonus
+    when it contains a priority marker. The first line (title or name) is always
+    kept, cut short if it alone exceeds the budget. Budget left over after the
+    whole lines is filled with the start of the best line that did not fit.
+    """
+    if count_tokens(text) <= budget:
+        return text
+
+    blocks = _blocks(text)
+    relevant_terms = set(relevant_terms)
+    scored = []
+    for i, block in enumerate(blocks):
+        lowered = block.lower()
+        score = len(key_terms(block) & relevant_terms)
+        if any(marker in lowered for marker in priority_markers):
+            score += 2
+        if i == 0:
+            score = math.inf
+        scored.append((score, i))
+
+    kept = {}
+    skipped = []
+    used = 0
+    for score, i in sorted(scored, key=lambda item: (-item[0], item[1])):
+        cost = count_tokens(blocks[i]) + 1
+        if used + cost <= budget:
+            kept[i] = blocks[i]
+            used += cost
+        elif i == 0:
+            kept[i] = truncate_tokens(blocks[i], budget - 1)
+            used = budget
+        else:
+            skipped.append(i)
+
+    remaining = budget - used - 1
+    if skipped and remaining >= MIN_TRUNCATED_TOKENS:
+        kept[skipped[0]] = truncate_tokens(blocks[skipped[0]], remaining)
+
+    return "\n".join(kept[i] for i in sorted(kept) if kept[i])
+
+
+def fit_prompt(job_description, resume_text, budget=None, share=None):
+    """Trim job description and resume to share one token budget.
+
+    The job description gets ``share`` of the budget and the resume the rest;
+    whatever one side does not need is handed to the other. Resume lines are
+    ranked by overlap with job description terms and vice versa. Returns the
+    trimmed texts and a report of token counts.
+    """
+    budget = budget or TOKEN_BUDGET
+    share = JOB_DESCRIPTION_SHARE if share is None else share
+
+    jd_tokens = count_tokens(job_description)
+    resume_tokens = count_tokens(resume_text)
+
+    jd_budget = int(budget * share)
+    resume_budget = budget - jd_budget
+    if jd_tokens < jd_budget:
+        resume_budget += jd_budget - jd_tokens
+        jd_budget = jd_tokens
+    elif resume_tokens < resume_budget:
+        jd_budget += resume_budget - resume_tokens
+        resume_budget = resume_tokens
+
+    jd_terms = key_terms(job_description)
+    trimmed_jd = trim_to_budget(job_description, jd_budget, key_terms(resume_text), PRIORITY_MARKERS)
+    trimmed_resume = trim_to_budget(resume_text, resume_budget, jd_terms)
+
+    report = {
+        "budget": budget,
+        "job_description_tokens": count_tokens(trimmed_jd),
+        "resume_tokens": count_tokens(trimmed_resume),
+        "original_job_description_tokens": jd_tokens,
+        "original_resume_tokens": resume_tokens,
+    }
+    report["trimmed"] = (
+        report["job_description_tokens"] < jd_tokens or report["resume_tokens"] < resume_tokens
+    )
+    return trimmed_jd, trimmed_resume, report
@@ -1,16 +1,132 @@
+import os
 import re
+import unicodedata
 
-def clean_text(text):
+TAG_RE = re.compile(r'<[^>]*>')
+# The original per-character alternation folded into one class: '$-_' is the
+# range from '$' to '_', which already holds the digits, capitals, '%' and most
+# punctuation, so only '!' and the lowercase letters are added
+URL_RE = re.compile(r'https?://[!$-_a-z]+')
+
+# Texts longer than this are cleaned in pieces of about this many characters
+CLEAN_CHUNK_CHARS = int(os.getenv("CLEAN_CHUNK_CHARS", str(1 << 20)))
+
+# Every ASCII byte except letters, digits and space; non-ASCII characters are
+# dropped by the encode step before this table is applied
+_ALLOWED = b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 '
+_DELETE_ASCII = bytes(b for b in range(128) if b not in _ALLOWED)
+
+
+def _classify(code_point):
+    """Translation of one code point in Unicode mode: kept, turned into a space, or deleted"""
+    char = chr(code_point)
+    if unicodedata.category(char)[0] in 'LMN':
+        return char
+    if char.isspace():
+        return ' '
+    return None
+
+
+# str.translate table for the Basic Multilingual Plane, indexed by code point.
+# Built on first use (a few tens of ms); a flat list is about twice as fast to index as a dict.
+_BMP_TABLE = None
+
+
+def _bmp_table():
+    global _BMP_TABLE
+    if _BMP_TABLE is None:
+        _BMP_TABLE = [_classify(code_point) for code_point in range(0x10000)]
+    return _BMP_TABLE
+
+
+# Pure-ASCII text takes the bytes.translate path in Unicode mode as well
+_ASCII_WHITESPACE = bytes(b for b in range(128) if _classify(b) == ' ' and b != 32)
+_ASCII_SPACE_MAP = bytes.maketrans(_ASCII_WHITESPACE, b' ' * len(_ASCII_WHITESPACE))
+_DELETE_ASCII_UNICODE_MODE = bytes(b for b in range(128) if _classify(b) is None)
+_ASTRAL_RE = re.compile('[\U00010000-\U0010FFFF]')
+
+
+class _UnicodeTable(dict):
+    """Translation table for text with characters beyond the BMP (emoji, rare CJK).
+
+    Each code point is classified once on first sight and then served from the dict.
+    """
+
+    def __missing__(self, code_point):
+        value = self[code_point] = _classify(code_point)
+        return value
+
+
+_FULL_TABLE = _UnicodeTable()
+
+
+def clean_text(text, keep_unicode=False):
+    """Strip tags, URLs and special characters, collapsing whitespace.
+
+    By default only ASCII letters, digits and spaces survive. With keep_unicode
+    letters and digits of any script are kept (for non-English postings) and
+    line breaks and tabs separate words instead of joining them. That mode is
+    for correctness, not speed: it runs at about the pace of the original
+    regex passes, well behind the ASCII mode.
+    """
     # Remove HTML tags
-    text = re.sub(r'<[^>]*?>', '', text)
+    if '<' in text:
+        text = TAG_RE.sub('', text)
     # Remove URLs
-    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    if 'http' in text:
+        text = URL_RE.sub('', text)
     # Remove special characters
-    text = re.sub(r'[^a-zA-Z0-9 ]', '', text)
-    # Replace multiple spaces with a single space
-    text = re.sub(r'\s{2,}', ' ', text)
-    # Trim leading and trailing whitespace
-    text = text.strip()
-    # Remove extra whitespace
-    text = ' '.join(text.split())
-    return text
\ No newline at end of file
+    if keep_unicode:
+        # Letters, marks and digits of every script are kept, whitespace becomes a space
+        if text.isascii():
+            text = text.encode('ascii').translate(_ASCII_SPACE_MAP, _DELETE_ASCII_UNICODE_MODE).decode('ascii')
+        else:
+            text = text.translate(_FULL_TABLE if _ASTRAL_RE.search(text) else _bmp_table())
+    else:
+        text = text.encode('ascii', 'ignore').translate(None, _DELETE_ASCII).decode('ascii')
+    # Collapse runs of spaces and trim, which also covers the old \s{2,} and strip passes
+    return ' '.join(text.split())
+
+
+def _chunks(text, size):
+    """Split text at spaces outside tags into pieces of about size characters.
+
+    No tag or URL crosses a split and every split is a plain space, which both
+    modes keep as a word break, so the cleaned pieces joined by a space equal
+    clean_text of the whole text.
+    """
+    # A '<' after the last '>' never starts a tag
+    last_close = text.rfind('>')
+    start = 0
+    window = size
+    while len(text) - start > window:
+        end = text.rfind(' ', start, start + window)
+        # Move the split before a tag that is still open at it
+        while end > start:
+            open_at = text.rfind('<', start, end)
+            if open_at < 0 or open_at < text.rfind('>', start, end) or open_at > last_close:
+                break
+            end = text.rfind(' ', start, open_at)
+        if end <= start:
+            # No safe space in the window (one huge tag or word): look further ahead
+            window *= 2
+            continue
+        yield text[start:end]
+        start, window = end, size
+    yield text[start:]
+
+
+def clean_texts(texts, keep_unicode=False, chunk_size=None):
+    """Clean an iterable of texts lazily, yielding one cleaned text per item.
+
+    Texts longer than chunk_size (CLEAN_CHUNK_CHARS by default) are cleaned
+    chunk by chunk, so the intermediate copies each pass makes stay small;
+    the result is the same as clean_text on the whole text.
+    """
+    chunk_size = chunk_size or CLEAN_CHUNK_CHARS
+    for text in texts:
+        if len(text) <= chunk_size:
+            yield clean_text(text, keep_unicode)
+            continue
+        cleaned = (clean_text(chunk, keep_unicode) for chunk in _chunks(text, chunk_size))
+        yield ' '.join(chunk for chunk in cleaned if chunk)